@@ -0,0 +1,229 @@
+"""Admin screen latency on a seeded database.
+
+Seeds bots, groups, distributions (posts spread over the groups) and post
+attempts into DATABASE_URL, then renders every read-only admin screen the way
+an update does: a fresh ``UpdateScope`` over the admin unit of work and its
+read-only twin, ``UXContext`` resolved from it, ``AdminUX.show_*`` awaited.
+Prints a latency table to stderr and the numbers as JSON to stdout.
+
+At 10k groups and above the p95 of every screen is checked against
+BUDGETS_MS and the script exits with status 1 when a budget is exceeded
+(``--no-budgets`` only reports). Seeded rows are removed afterwards. Group
+metadata is marked fresh, so rendering never calls Telegram.
+
+    python -m benchmarks.admin_screens --groups 10000 --bots 20 --distributions 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, select
+
+from bot.middlewares.update.scope import UpdateScope
+from bot.ux import RU_ADMIN_TEXTS, AdminUX
+from infra.db.models import Bot, Group, Post, PostAttempt, PostStatus, Setting
+from infra.db.session import dispose_engine
+from infra.db.uow import get_uow
+from services import SystemService
+
+BUDGET_SCALE_GROUPS = 10_000
+
+# p95, мс, для BUDGET_SCALE_GROUPS групп
+BUDGETS_MS = {
+    "bots_list": 150.0,
+    "bot_card": 150.0,
+    "groups_list": 250.0,
+    "distributions_list": 300.0,
+    "distribution_card": 200.0,
+    "distribution_groups": 400.0,
+}
+
+CHUNK = 1000
+
+
+async def _insert_chunked(session, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), CHUNK):
+        await session.execute(insert(model), rows[start:start + CHUNK])
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    suffix = uuid4().hex[:8]
+    base_id = 8_000_000_000 + uuid4().int % 10**9
+    now = datetime.now(timezone.utc)
+    statuses = [PostStatus.ACTIVE.value, PostStatus.ACTIVE.value, PostStatus.PAUSED.value, PostStatus.ERROR.value]
+
+    async with get_uow(kind="admin") as uow:
+        setting_id = None
+        if await uow.settings_repo.get_current() is None:
+            setting_id = uuid4()
+            await uow.session.execute(insert(Setting).values(id=setting_id, name=f"bench-{suffix}", is_current=True))
+
+        bots = [
+            dict(id=uuid4(), bot_id=base_id + i, token=f"{base_id + i}:bench{suffix}", server_ip=f"bench-{suffix}-{i}",
+                 username=f"bench_{i}_bot", name=f"Bench {i}", last_heartbeat_at=now, settings_id=setting_id)
+            for i in range(args.bots)
+        ]
+        await _insert_chunked(uow.session, Bot, bots)
+
+        groups = [
+            dict(id=uuid4(), tg_chat_id=-(base_id + i), type="supergroup", title=f"bench {i}",
+                 username=f"bench_{suffix}_{i}", assigned_bot_id=bots[i % args.bots]["id"],
+                 metadata_refreshed_at=now)
+            for i in range(args.groups)
+        ]
+        await _insert_chunked(uow.session, Group, groups)
+
+        posts = []
+        for i, group in enumerate(groups):
+            for j in range(args.posts_per_group):
+                posts.append(dict(
+                    id=uuid4(), group_id=group["id"], bot_id=group["assigned_bot_id"],
+                    status=statuses[(i + j) % len(statuses)], target_chat_id=group["tg_chat_id"],
+                    distribution_name=f"bench-{suffix}-{(i + j) % args.distributions}",
+                    source_channel_username="bench", source_channel_id=-100, source_message_id=j + 1,
+                    last_attempt_at=now, count_attempts=args.attempts_per_post, target_attempts=-1,
+                ))
+        await _insert_chunked(uow.session, Post, posts)
+
+        attempts = [
+            dict(id=uuid4(), post_id=post["id"], bot_id=post["bot_id"], group_id=post["group_id"],
+                 chat_id=post["target_chat_id"], message_id=k + 1, success=k % 5 != 4, deleted=False)
+            for post in posts
+            for k in range(args.attempts_per_post)
+        ]
+        await _insert_chunked(uow.session, PostAttempt, attempts)
+
+        # distribution_id экрана — любой пост рассылки; берём пост первой
+        distribution_id = (
+            await uow.session.execute(
+                select(Post.id).where(Post.distribution_name == f"bench-{suffix}-0").limit(1)
+            )
+        ).scalar_one()
+
+    return {
+        "setting_id": setting_id,
+        "bot_ids": [bot["id"] for bot in bots],
+        "group_ids": [group["id"] for group in groups],
+        "distribution_id": distribution_id,
+        "posts": len(posts),
+        "attempts": len(attempts),
+    }
+
+
+async def cleanup(fixture: dict) -> None:
+    async with get_uow(kind="admin") as uow:
+        group_ids = fixture["group_ids"]
+        for start in range(0, len(group_ids), CHUNK):
+            # posts и post_attempts уходят каскадом
+            await uow.session.execute(delete(Group).where(Group.id.in_(group_ids[start:start + CHUNK])))
+        await uow.session.execute(delete(Bot).where(Bot.id.in_(fixture["bot_ids"])))
+        if fixture["setting_id"] is not None:
+            await uow.session.execute(delete(Setting).where(Setting.id == fixture["setting_id"]))
+
+
+def screens(fixture: dict) -> dict[str, Callable[[AdminUX], Awaitable]]:
+    bot_id = fixture["bot_ids"][0]
+    distribution_id = fixture["distribution_id"]
+    return {
+        "bots_list": lambda admin: admin.show_bots_list(page=1),
+        "bot_card": lambda admin: admin.show_bot_card(bot_id),
+        "groups_list": lambda admin: admin.show_groups_list(page=1),
+        "distributions_list": lambda admin: admin.show_distributions_list(page=1),
+        "distribution_card": lambda admin: admin.show_distribution_card(distribution_id),
+        "distribution_groups": lambda admin: admin.show_distribution_groups(distribution_id, page=1),
+    }
+
+
+async def render(screen: Callable[[AdminUX], Awaitable]) -> float:
+    started = time.perf_counter()
+    async with get_uow(kind="admin") as uow, get_uow(kind="admin", read_only=True) as read_uow:
+        scope = UpdateScope(uow, read_uow=read_uow, system_service=SystemService(), texts=RU_ADMIN_TEXTS)
+        await screen(scope.resolve("ux").admin)
+    return (time.perf_counter() - started) * 1e3
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+def print_table(results: dict) -> None:
+    header = f"{'screen':<22}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'budget':>10}"
+    print(header, file=sys.stderr)
+    print("-" * len(header), file=sys.stderr)
+    for name, row in results.items():
+        budget = f"{row['budget_ms']:.0f}" if row["budget_ms"] is not None else "-"
+        mark = "" if row["within_budget"] in (None, True) else "  !"
+        print(
+            f"{name:<22}{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['max_ms']:>10.1f}{budget:>10}{mark}",
+            file=sys.stderr,
+        )
+
+
+async def run(args: argparse.Namespace) -> dict:
+    fixture = await seed(args)
+    check_budgets = args.budgets and args.groups >= BUDGET_SCALE_GROUPS
+    results: dict = {}
+    try:
+        for name, screen in screens(fixture).items():
+            for _ in range(args.warmup):
+                await render(screen)
+            timings = [await render(screen) for _ in range(args.repeat)]
+            p95 = percentile(timings, 0.95)
+            budget = BUDGETS_MS.get(name) if check_budgets else None
+            results[name] = {
+                "p50_ms": percentile(timings, 0.50),
+                "p95_ms": p95,
+                "max_ms": max(timings),
+                "budget_ms": budget,
+                "within_budget": None if budget is None else p95 <= budget,
+            }
+    finally:
+        await cleanup(fixture)
+        await dispose_engine()
+
+    return {
+        "params": {
+            "bots": args.bots,
+            "groups": args.groups,
+            "distributions": args.distributions,
+            "posts": fixture["posts"],
+            "attempts": fixture["attempts"],
+            "repeat": args.repeat,
+        },
+        "screens": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=20)
+    parser.add_argument("--groups", type=int, default=BUDGET_SCALE_GROUPS)
+    parser.add_argument("--distributions", type=int, default=50)
+    parser.add_argument("--posts-per-group", type=int, default=1)
+    parser.add_argument("--attempts-per-post", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--no-budgets", dest="budgets", action="store_false")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_table(report["screens"])
+    print(json.dumps(report, indent=2))
+
+    failed = [name for name, row in report["screens"].items() if row["within_budget"] is False]
+    if failed:
+        print(f"Budget exceeded: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Row-to-DTO conversion cost for large listings.
+
+Compares ``from_model`` on ORM instances (attribute access through the
+instrumented descriptors, getattr chains for joined group/bot) with
+``from_rows`` on the positional rows returned by the column selects.
+Runs without a database: ORM objects are transient, rows are plain tuples
+in the column order of the *_DTO_COLUMNS selects.
+
+    python -m benchmarks.dto_mapping --rows 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from common.dto import BotDTO, GroupDTO, PostDTO
+from infra.db.models import Bot, Group, Post
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _bot_values(i: int) -> dict:
+    return dict(
+        id=uuid4(), bot_id=i, username=f"bot{i}", name=f"Bot {i}", token=f"{i}:token", server_ip=f"10.0.{i % 256}.1",
+        last_heartbeat_at=_now(), self_destruction=False, deactivated=False, settings_id=None, max_posts=10,
+        tracked_branch="main", current_commit_hash="abc", latest_available_commit_hash="abc", commits_behind=0,
+        last_update_check_at=_now(), force_update=False, created_at=_now(), updated_at=_now(),
+    )
+
+
+def _group_values(i: int) -> dict:
+    return dict(
+        id=uuid4(), tg_chat_id=-i, type="supergroup", title=f"Group {i}", username=f"group{i}", last_post_at=None,
+        assigned_bot_id=uuid4(), created_at=_now(), updated_at=_now(), metadata_refreshed_at=_now(),
+    )
+
+
+def _post_values(i: int, group: dict, bot: dict) -> dict:
+    return dict(
+        id=uuid4(), group_id=group["id"], bot_id=bot["id"], status="active", target_chat_id=group["tg_chat_id"],
+        distribution_name="bench", source_channel_username="source", source_channel_id=-100, source_message_id=i,
+        last_attempt_at=_now(), last_error=None, count_attempts=i % 7, target_attempts=10, delete_last_attempt=False,
+        pin_after_post=False, num_attempt_for_pin_post=None, pause_between_attempts_s=60, notify_on_failure=True,
+        created_at=_now(), updated_at=_now(),
+    )
+
+
+def build_fixtures(n: int) -> dict:
+    bots = [_bot_values(i) for i in range(n)]
+    groups = [_group_values(i) for i in range(n)]
+    posts = [_post_values(i, groups[i], bots[i]) for i in range(n)]
+
+    post_models = []
+    for values, group, bot in zip(posts, groups, bots):
+        model = Post(**values)
+        model.group = Group(**group)
+        model.bot = Bot(**bot)
+        post_models.append(model)
+
+    # Кортежи в порядке колонок *_DTO_COLUMNS (так их отдаёт Row)
+    post_rows = [
+        (*values.values(), group["tg_chat_id"], group["title"], group["username"], bot["username"], bot["name"], bot["token"])
+        for values, group, bot in zip(posts, groups, bots)
+    ]
+    return {
+        "bot": ([Bot(**v) for v in bots], [tuple(v.values()) for v in bots], BotDTO),
+        "group": ([Group(**v) for v in groups], [tuple(v.values()) for v in groups], GroupDTO),
+        "post": (post_models, post_rows, PostDTO),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {"rows": args.rows}
+    for name, (models, rows, dto) in build_fixtures(args.rows).items():
+        assert dto.from_rows(rows[:1])[0] == dto.from_model(models[0]), f"{name}: row and model DTOs differ"
+        from_model = min(timeit.repeat(lambda: [dto.from_model(m) for m in models], number=1, repeat=args.repeat))
+        from_rows = min(timeit.repeat(lambda: dto.from_rows(rows), number=1, repeat=args.repeat))
+        results[name] = {
+            "from_model_ms": from_model * 1e3,
+            "from_rows_ms": from_rows * 1e3,
+            "speedup": from_model / from_rows,
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
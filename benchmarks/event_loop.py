@@ -0,0 +1,186 @@
+"""Default asyncio loop and stdlib json vs uvloop and orjson.
+
+Starts ``benchmarks.fake_bot_api`` in a separate process (so the server side
+does not change between modes) and, for every combination of USE_UVLOOP and
+FAST_JSON, runs two workloads through ``create_bot`` and ``run_event_loop``
+— the same path as ``main.py``:
+
+* posting: each of --bots clients forwards messages back to back, like
+  ``PostingService.send_post``; reports sends/s and p50/p99 call latency;
+* updates: raw updates fed through a ``Dispatcher`` whose handler answers via
+  the Bot API (``Dispatcher.feed_raw_update``), --concurrency at a time;
+  reports updates/s and p50/p99 per update.
+
+No database is involved. Prints a table to stderr and JSON to stdout.
+
+    python -m benchmarks.event_loop --sends 5000 --updates 5000 --bots 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import subprocess
+import sys
+import time
+from itertools import product
+
+from aiogram import Dispatcher, Router
+from aiogram.types import Message
+
+from bot.builder.instance_bot import create_bot
+from config.app_setup import run_event_loop
+from config.settings import get_settings
+
+TOKEN_BASE = 900_000_000
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+def summarize(count: int, elapsed: float, latencies: list[float]) -> dict:
+    return {
+        "per_s": count / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+async def posting_workload(args: argparse.Namespace) -> dict:
+    bots = [create_bot(f"{TOKEN_BASE + i}:bench") for i in range(args.bots)]
+    latencies: list[float] = []
+
+    async def worker(index: int, bot) -> None:
+        for n in range(index, args.sends, args.bots):
+            started = time.perf_counter()
+            await bot.forward_message(chat_id=-(1000 + n % args.chats), from_chat_id=-100, message_id=n + 1)
+            latencies.append(time.perf_counter() - started)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i, bot) for i, bot in enumerate(bots)))
+        elapsed = time.perf_counter() - started
+    finally:
+        for bot in bots:
+            await bot.session.close()
+    return summarize(args.sends, elapsed, latencies)
+
+
+def raw_update(n: int, chats: int) -> dict:
+    chat_id = 1000 + n % chats
+    return {
+        "update_id": n + 1,
+        "message": {
+            "message_id": n + 1,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private", "first_name": "Bench"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Bench", "language_code": "ru"},
+            "text": f"/start {n}",
+        },
+    }
+
+
+async def updates_workload(args: argparse.Namespace) -> dict:
+    bot = create_bot(f"{TOKEN_BASE}:bench")
+    router = Router()
+
+    @router.message()
+    async def answer(message: Message) -> None:
+        await message.answer(f"<b>ok</b> {message.text}")
+
+    dp = Dispatcher()
+    dp.include_router(router)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def feed(n: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await dp.feed_raw_update(bot, raw_update(n, args.chats))
+            latencies.append(time.perf_counter() - started)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(feed(n) for n in range(args.updates)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await bot.session.close()
+    return summarize(args.updates, elapsed, latencies)
+
+
+async def run_mode(args: argparse.Namespace) -> dict:
+    # Прогрев: соединения в пуле aiohttp и ленивые импорты aiogram
+    await posting_workload(argparse.Namespace(**{**vars(args), "sends": args.bots * 10}))
+    return {"posting": await posting_workload(args), "updates": await updates_workload(args)}
+
+
+def start_fake_api(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.fake_bot_api",
+            "--port", str(args.api_port), "--latency-ms", str(args.latency_ms),
+            "--chat-limit", "0", "--global-rps", "0",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = proc.stdout.readline()
+    if not line:
+        proc.kill()
+        raise RuntimeError("benchmarks.fake_bot_api did not start")
+    return proc, json.loads(line)["listening"]
+
+
+def print_table(results: list[dict]) -> None:
+    header = f"{'loop':<9}{'json':<8}{'sends/s':>10}{'p99 ms':>9}{'updates/s':>11}{'p99 ms':>9}"
+    print(header, file=sys.stderr)
+    print("-" * len(header), file=sys.stderr)
+    for row in results:
+        print(
+            f"{row['loop']:<9}{row['json']:<8}"
+            f"{row['posting']['per_s']:>10.0f}{row['posting']['p99_ms']:>9.1f}"
+            f"{row['updates']['per_s']:>11.0f}{row['updates']['p99_ms']:>9.1f}",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sends", type=int, default=5000)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--bots", type=int, default=4)
+    parser.add_argument("--chats", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fake Bot API response delay")
+    parser.add_argument("--api-port", type=int, default=8082)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    proc, settings.TELEGRAM_API_BASE_URL = start_fake_api(args)
+    results = []
+    try:
+        for use_uvloop, fast_json in product((False, True), (False, True)):
+            settings.USE_UVLOOP = use_uvloop
+            settings.FAST_JSON = fast_json
+            if use_uvloop and importlib.util.find_spec("uvloop") is None:
+                continue
+            report = run_event_loop(settings, run_mode(args))
+            results.append({
+                "loop": "uvloop" if use_uvloop else "asyncio",
+                "json": "orjson" if fast_json else "json",
+                **report,
+            })
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print_table(results)
+    print(json.dumps({"params": vars(args), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""Local Telegram Bot API stub for load and failure testing.
+
+Serves ``/bot<token>/<method>`` like api.telegram.org, so a node started with
+TELEGRAM_API_BASE_URL=http://127.0.0.1:8081 (see ``create_bot``) talks to it
+instead of Telegram. Implements the methods the posting path and admin flows
+use: getMe, forwardMessage, sendMessage, deleteMessage, pinChatMessage,
+getChat, getChatMember (plus getUpdates/deleteWebhook so polling starts).
+
+Latency, error injection (429 with retry_after, 403 kicked, 5xx, hanging
+requests) and per-chat / per-bot rate limits are configurable; counters are
+served at ``GET /stats`` and reset with ``POST /stats/reset``.
+
+    python -m benchmarks.fake_bot_api --port 8081 --latency-ms 40 --rate-429 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+import zlib
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from aiohttp import web
+
+SEND_METHODS = frozenset({"forwardMessage", "sendMessage"})
+
+
+@dataclass(slots=True)
+class FakeBotAPIConfig:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    # Вероятности ошибок на один вызов из fault_methods
+    rate_429: float = 0.0
+    retry_after_s: int = 1
+    rate_403: float = 0.0
+    rate_5xx: float = 0.0
+    rate_timeout: float = 0.0
+    hang_s: float = 120.0  # Сколько «висит» запрос при инъекции таймаута
+    fault_methods: frozenset[str] = SEND_METHODS
+    # Лимиты Telegram, считаются отдельно для каждого токена: ~20 сообщений
+    # в минуту на группу и ~30 в секунду на бота (global_rps); 0 — без лимита
+    chat_limit: int = 20
+    chat_window_s: float = 60.0
+    global_rps: int = 30
+    kicked_chats: frozenset[int] = frozenset()
+    seed: Optional[int] = None
+
+
+@dataclass(slots=True)
+class _Window:
+    limit: int
+    window_s: float
+    hits: deque = field(default_factory=deque)
+
+    def acquire(self, now: float) -> Optional[int]:
+        """None if allowed, otherwise retry_after in seconds."""
+        if self.limit <= 0:
+            return None
+        while self.hits and now - self.hits[0] >= self.window_s:
+            self.hits.popleft()
+        if len(self.hits) >= self.limit:
+            return max(1, math.ceil(self.window_s - (now - self.hits[0])))
+        self.hits.append(now)
+        return None
+
+
+class TelegramError(Exception):
+    def __init__(self, code: int, description: str, retry_after: Optional[int] = None) -> None:
+        super().__init__(description)
+        self.code = code
+        self.description = description
+        self.retry_after = retry_after
+
+
+class FakeBotAPI:
+    def __init__(self, config: Optional[FakeBotAPIConfig] = None) -> None:
+        self.config = config or FakeBotAPIConfig()
+        self._random = random.Random(self.config.seed)
+        self._message_ids: dict[int, itertools.count] = defaultdict(lambda: itertools.count(1))
+        self._messages: dict[int, set[int]] = defaultdict(set)
+        self._chat_windows: dict[tuple[int, int], _Window] = {}
+        self._bot_windows: dict[int, _Window] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self.calls: Counter[tuple[str, str]] = Counter()
+        self.sent_per_chat: Counter[int] = Counter()
+
+        self.app = web.Application()
+        self.app.router.add_get("/stats", self._handle_stats)
+        self.app.router.add_post("/stats/reset", self._handle_reset)
+        self.app.router.add_route("*", "/bot{token}/{method}", self._handle_method)
+
+        self._methods = {
+            "getMe": self._get_me,
+            "forwardMessage": self._forward_message,
+            "sendMessage": self._send_message,
+            "deleteMessage": self._delete_message,
+            "pinChatMessage": self._pin_chat_message,
+            "getChat": self._get_chat,
+            "getChatMember": self._get_chat_member,
+            "getUpdates": self._get_updates,
+            "deleteWebhook": self._ok,
+        }
+
+    # ---------- lifecycle ----------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8081) -> str:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeBotAPI":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        by_method: dict[str, dict[str, int]] = defaultdict(dict)
+        for (method, outcome), count in sorted(self.calls.items()):
+            by_method[method][outcome] = count
+        return {
+            "calls": dict(by_method),
+            "chats": len(self.sent_per_chat),
+            "sent": sum(self.sent_per_chat.values()),
+            "max_sent_per_chat": max(self.sent_per_chat.values(), default=0),
+        }
+
+    def reset_stats(self) -> None:
+        self.calls.clear()
+        self.sent_per_chat.clear()
+
+    # ---------- HTTP ----------
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+    async def _handle_reset(self, request: web.Request) -> web.Response:
+        self.reset_stats()
+        return web.json_response({"ok": True})
+
+    async def _handle_method(self, request: web.Request) -> web.Response:
+        token = request.match_info["token"]
+        method = request.match_info["method"]
+        handler = self._methods.get(method)
+        if handler is None:
+            self.calls[(method, "404")] += 1
+            return _error(TelegramError(404, "Not Found"))
+
+        params = await _read_params(request)
+        await self._delay()
+        try:
+            self._inject_faults(method, params)
+            if method in SEND_METHODS:
+                self._check_limits(_bot_id(token), _chat_id(params.get("chat_id")))
+            result = await handler(token, params)
+        except TelegramError as e:
+            self.calls[(method, str(e.code))] += 1
+            return _error(e)
+        except _Hang:
+            self.calls[(method, "timeout")] += 1
+            await asyncio.sleep(self.config.hang_s)
+            return _error(TelegramError(504, "Gateway Timeout"))
+
+        self.calls[(method, "ok")] += 1
+        return web.json_response({"ok": True, "result": result})
+
+    async def _delay(self) -> None:
+        delay = self.config.latency_ms
+        if self.config.latency_jitter_ms:
+            delay += self._random.uniform(0, self.config.latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    def _inject_faults(self, method: str, params: dict[str, Any]) -> None:
+        config = self.config
+        if method not in config.fault_methods:
+            return
+        chat_id = _chat_id(params.get("chat_id"))
+        if chat_id in config.kicked_chats:
+            raise TelegramError(403, "Forbidden: bot was kicked from the supergroup chat")
+
+        roll = self._random.random()
+        for rate, error in (
+            (config.rate_429, lambda: TelegramError(
+                429, f"Too Many Requests: retry after {config.retry_after_s}", config.retry_after_s
+            )),
+            (config.rate_403, lambda: TelegramError(403, "Forbidden: bot was kicked from the supergroup chat")),
+            (config.rate_5xx, lambda: TelegramError(502, "Bad Gateway")),
+        ):
+            if roll < rate:
+                raise error()
+            roll -= rate
+        if roll < config.rate_timeout:
+            raise _Hang()
+
+    def _check_limits(self, bot_id: int, chat_id: int) -> None:
+        now = time.monotonic()
+        bot_window = self._bot_windows.get(bot_id)
+        if bot_window is None:
+            bot_window = self._bot_windows[bot_id] = _Window(self.config.global_rps, 1.0)
+        retry_after = bot_window.acquire(now)
+        if retry_after is None:
+            window = self._chat_windows.get((bot_id, chat_id))
+            if window is None:
+                window = self._chat_windows[(bot_id, chat_id)] = _Window(
+                    self.config.chat_limit, self.config.chat_window_s
+                )
+            retry_after = window.acquire(now)
+        if retry_after is not None:
+            raise TelegramError(429, f"Too Many Requests: retry after {retry_after}", retry_after)
+
+    # ---------- methods ----------
+
+    async def _ok(self, token: str, params: dict[str, Any]) -> bool:
+        return True
+
+    async def _get_me(self, token: str, params: dict[str, Any]) -> dict[str, Any]:
+        return _bot_user(token)
+
+    async def _get_updates(self, token: str, params: dict[str, Any]) -> list:
+        # Long polling: держим запрос, как настоящий сервер без новых апдейтов
+        await asyncio.sleep(min(float(params.get("timeout") or 0), 5.0))
+        return []
+
+    async def _forward_message(self, token: str, params: dict[str, Any]) -> dict[str, Any]:
+        message = self._new_message(_chat_id(params.get("chat_id")))
+        message["forward_origin"] = {
+            "type": "channel",
+            "date": message["date"],
+            "chat": _chat(_chat_id(params.get("from_chat_id")), "channel"),
+            "message_id": int(params.get("message_id") or 0),
+        }
+        return message
+
+    async def _send_message(self, token: str, params: dict[str, Any]) -> dict[str, Any]:
+        message = self._new_message(_chat_id(params.get("chat_id")))
+        message["text"] = str(params.get("text") or "")
+        return message
+
+    async def _delete_message(self, token: str, params: dict[str, Any]) -> bool:
+        chat_id = _chat_id(params.get("chat_id"))
+        message_id = int(params.get("message_id") or 0)
+        messages = self._messages[chat_id]
+        if message_id not in messages:
+            raise TelegramError(400, "Bad Request: message to delete not found")
+        messages.discard(message_id)
+        return True
+
+    async def _pin_chat_message(self, token: str, params: dict[str, Any]) -> bool:
+        chat_id = _chat_id(params.get("chat_id"))
+        if int(params.get("message_id") or 0) not in self._messages[chat_id]:
+            raise TelegramError(400, "Bad Request: message to pin not found")
+        return True
+
+    async def _get_chat(self, token: str, params: dict[str, Any]) -> dict[str, Any]:
+        chat_id = _chat_id(params.get("chat_id"))
+        return {
+            **_chat(chat_id, "supergroup"),
+            "accent_color_id": 0,
+            "max_reaction_count": 11,
+            "accepted_gift_types": {
+                "unlimited_gifts": False,
+                "limited_gifts": False,
+                "unique_gifts": False,
+                "premium_subscription": False,
+            },
+        }
+
+    async def _get_chat_member(self, token: str, params: dict[str, Any]) -> dict[str, Any]:
+        chat_id = _chat_id(params.get("chat_id"))
+        user_id = int(params.get("user_id") or 0)
+        user = _bot_user(token) if user_id == _bot_id(token) else {"id": user_id, "is_bot": False, "first_name": "User"}
+        if chat_id in self.config.kicked_chats:
+            return {"status": "kicked", "user": user, "until_date": 0}
+        rights = (
+            "can_manage_chat", "can_delete_messages", "can_manage_video_chats", "can_restrict_members",
+            "can_promote_members", "can_change_info", "can_invite_users", "can_post_stories",
+            "can_edit_stories", "can_delete_stories", "can_pin_messages",
+        )
+        return {
+            "status": "administrator",
+            "user": user,
+            "can_be_edited": False,
+            "is_anonymous": False,
+            **{right: True for right in rights},
+        }
+
+    def _new_message(self, chat_id: int) -> dict[str, Any]:
+        message_id = next(self._message_ids[chat_id])
+        self._messages[chat_id].add(message_id)
+        self.sent_per_chat[chat_id] += 1
+        return {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": _chat(chat_id, "supergroup"),
+        }
+
+
+class _Hang(Exception):
+    pass
+
+
+async def _read_params(request: web.Request) -> dict[str, Any]:
+    if request.content_type == "application/json":
+        return await request.json()
+    if request.method == "GET":
+        return dict(request.query)
+    return dict(await request.post())
+
+
+def _error(error: TelegramError) -> web.Response:
+    payload: dict[str, Any] = {"ok": False, "error_code": error.code, "description": error.description}
+    if error.retry_after is not None:
+        payload["parameters"] = {"retry_after": error.retry_after}
+    return web.json_response(payload, status=error.code)
+
+
+def _chat_id(value: Any) -> int:
+    if value is None:
+        raise TelegramError(400, "Bad Request: chat_id is empty")
+    text = str(value)
+    if text.lstrip("-").isdigit():
+        return int(text)
+    # @username — стабильный отрицательный id, как у публичных групп
+    return -(1_000_000_000_000 + zlib.crc32(text.encode()))
+
+
+def _chat(chat_id: int, chat_type: str) -> dict[str, Any]:
+    return {"id": chat_id, "type": chat_type, "title": f"Chat {chat_id}", "username": f"chat{abs(chat_id)}"}
+
+
+def _bot_id(token: str) -> int:
+    prefix = token.split(":", 1)[0]
+    return int(prefix) if prefix.isdigit() else zlib.crc32(token.encode())
+
+
+def _bot_user(token: str) -> dict[str, Any]:
+    bot_id = _bot_id(token)
+    return {"id": bot_id, "is_bot": True, "first_name": f"Fake {bot_id}", "username": f"fake_{bot_id}_bot"}
+
+
+def config_from_args(args: argparse.Namespace) -> FakeBotAPIConfig:
+    return FakeBotAPIConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        rate_429=args.rate_429,
+        retry_after_s=args.retry_after_s,
+        rate_403=args.rate_403,
+        rate_5xx=args.rate_5xx,
+        rate_timeout=args.rate_timeout,
+        hang_s=args.hang_s,
+        chat_limit=args.chat_limit,
+        chat_window_s=args.chat_window_s,
+        global_rps=args.global_rps,
+        kicked_chats=frozenset(args.kicked_chat),
+        seed=args.seed,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after-s", type=int, default=1)
+    parser.add_argument("--rate-403", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--rate-timeout", type=float, default=0.0)
+    parser.add_argument("--hang-s", type=float, default=120.0)
+    parser.add_argument("--chat-limit", type=int, default=20, help="messages per chat window, 0 disables")
+    parser.add_argument("--chat-window-s", type=float, default=60.0)
+    parser.add_argument("--global-rps", type=int, default=30, help="messages per second per bot token, 0 disables")
+    parser.add_argument("--kicked-chat", type=int, action="append", default=[])
+    parser.add_argument("--seed", type=int, default=None)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    async with FakeBotAPI(config_from_args(args)) as api:
+        url = await api.start(args.host, args.port)
+        print(json.dumps({"listening": url}), flush=True)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    add_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
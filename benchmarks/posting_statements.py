@@ -0,0 +1,176 @@
+"""SQL statements and round-trip time per hot-path write.
+
+Compares the previous write strategy (separate transactions, read-modify-write
+through the ORM, follow-up SELECTs) with the atomic column-level UPDATEs used
+now. Needs a migrated database at DATABASE_URL; creates a throwaway group, post
+and bot row and removes them afterwards.
+
+    python -m benchmarks.posting_statements --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import delete, event, update
+
+from infra.db.models import Bot, Group, Post, PostAttempt, PostStatus
+from infra.db.session import dispose_engine, get_engine
+from infra.db.uow import get_uow
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+    def attach(self, engine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, *args) -> None:
+        self.statements += 1
+
+    def _on_commit(self, *args) -> None:
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+async def _fixture() -> tuple[Group, Post, Bot]:
+    async with get_uow(kind="posting") as uow:
+        suffix = uuid4().int % 10**9
+        bot = await uow.bot_repo.add(
+            Bot(bot_id=-suffix, token=f"{-suffix}:bench", server_ip=f"bench-{suffix}", deactivated=True)
+        )
+        group = await uow.group_repo.add(Group(tg_chat_id=-suffix, type="supergroup", title="bench"))
+        post = await uow.post_repo.create(
+            group_id=group.id,
+            target_chat_id=group.tg_chat_id,
+            distribution_name=None,
+            source_channel_username="bench",
+            source_message_id=1,
+            target_attempts=-1,
+        )
+        return group, post, bot
+
+
+async def _cleanup(group: Group, bot: Bot) -> None:
+    async with get_uow(kind="posting") as uow:
+        await uow.session.execute(delete(Group).where(Group.id == group.id))
+        await uow.session.execute(delete(Bot).where(Bot.id == bot.id))
+
+
+def _attempt(post: Post, bot: Bot) -> PostAttempt:
+    return PostAttempt(
+        post_id=post.id, bot_id=bot.id, group_id=post.group_id, chat_id=post.target_chat_id,
+        message_id=1, deleted=False, success=True,
+    )
+
+
+async def send_legacy(post: Post, bot: Bot) -> None:
+    # Попытка в своей транзакции, затем счётчик и статус отдельными UPDATE
+    async with get_uow(kind="posting") as uow:
+        await uow.post_attempt_repo.add(_attempt(post, bot))
+    async with get_uow(kind="posting") as uow:
+        await uow.session.execute(
+            update(Post)
+            .where(Post.id == post.id)
+            .values(count_attempts=Post.count_attempts + 1, last_attempt_at=datetime.now(timezone.utc))
+        )
+        await uow.session.execute(update(Post).where(Post.id == post.id).values(status=PostStatus.DONE.value))
+
+
+async def send_atomic(post: Post, bot: Bot) -> None:
+    async with get_uow(kind="posting") as uow:
+        await uow.post_attempt_repo.add(_attempt(post, bot))
+        await uow.post_repo.register_success(post.id)
+
+
+async def bot_update_legacy(post: Post, bot: Bot) -> None:
+    async with get_uow(kind="heartbeat") as uow:
+        obj = await uow.bot_repo.get(bot.id)
+        obj.update(last_update_check_at=datetime.now(timezone.utc))
+        await uow.bot_repo.update(obj)
+
+
+async def bot_update_atomic(post: Post, bot: Bot) -> None:
+    async with get_uow(kind="heartbeat") as uow:
+        await uow.bot_repo.update_fields(bot.id, last_update_check_at=datetime.now(timezone.utc))
+
+
+async def metadata_legacy(post: Post, bot: Bot) -> None:
+    async with get_uow(kind="admin") as uow:
+        await uow.session.execute(
+            update(Group).where(Group.id == post.group_id).values(metadata_refreshed_at=datetime.now(timezone.utc))
+        )
+        await uow.group_repo.get(post.group_id)
+
+
+async def metadata_atomic(post: Post, bot: Bot) -> None:
+    async with get_uow(kind="admin") as uow:
+        await uow.group_repo.update_metadata(post.group_id, refreshed_at=datetime.now(timezone.utc))
+
+
+CASES = {
+    "send": (send_legacy, send_atomic),
+    "bot_update_fields": (bot_update_legacy, bot_update_atomic),
+    "group_update_metadata": (metadata_legacy, metadata_atomic),
+}
+
+
+async def _measure(func, post: Post, bot: Bot, counter: StatementCounter, iterations: int) -> dict:
+    counter.reset()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func(post, bot)
+    elapsed = time.perf_counter() - started
+    return {
+        "statements_per_op": counter.statements / iterations,
+        "commits_per_op": counter.commits / iterations,
+        "ms_per_op": elapsed / iterations * 1e3,
+    }
+
+
+async def run(iterations: int) -> dict:
+    counter = StatementCounter()
+    for kind in ("posting", "heartbeat", "admin"):
+        counter.attach(get_engine(kind))
+
+    group, post, bot = await _fixture()
+    results: dict = {}
+    try:
+        for name, (legacy, atomic) in CASES.items():
+            await legacy(post, bot)  # прогрев пулов и кэша prepared statements
+            await atomic(post, bot)
+            results[name] = {
+                "legacy": await _measure(legacy, post, bot, counter, iterations),
+                "atomic": await _measure(atomic, post, bot, counter, iterations),
+            }
+            # Возвращаем пост в active: mark_done в legacy-сценарии закрывает его
+            async with get_uow(kind="posting") as uow:
+                await uow.session.execute(
+                    update(Post).where(Post.id == post.id).values(status=PostStatus.ACTIVE.value)
+                )
+    finally:
+        await _cleanup(group, bot)
+        await dispose_engine()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.iterations)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
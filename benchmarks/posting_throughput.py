@@ -0,0 +1,216 @@
+"""End-to-end posting throughput against the fake Bot API.
+
+Seeds N bots, M groups and K posts into the database at DATABASE_URL, starts
+``benchmarks.fake_bot_api`` in-process and runs one ``PostingRunner`` per bot
+for a fixed duration. Reports sends per second, schedule lateness (attempt
+time minus the moment the post became due: run start for the first attempt,
+previous attempt + pause after that), DB statements per send and peak RSS.
+Seeded rows are removed afterwards.
+
+Needs a migrated Postgres: the posting queries use LATERAL, pg_notify and
+gen_random_uuid(), so the schema does not run on SQLite.
+
+    python -m benchmarks.posting_throughput --bots 4 --groups 400 --posts 2000 --duration-s 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import resource
+import time
+from collections import defaultdict
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, insert, select
+
+from benchmarks.fake_bot_api import FakeBotAPI, add_arguments, config_from_args
+from benchmarks.posting_statements import StatementCounter
+from config.settings import get_settings
+from infra.db.models import Bot, Group, Post, PostAttempt, PostStatus, Setting
+from infra.db.session import dispose_engine, get_engine
+from infra.db.uow import get_uow
+from services.posting.posting_runner import PostingRunner
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    suffix = uuid4().hex[:8]
+    base_id = 7_000_000_000 + uuid4().int % 10**9
+
+    async with get_uow(kind="posting") as uow:
+        setting_id = uuid4()
+        await uow.session.execute(
+            insert(Setting).values(id=setting_id, name=f"bench-{suffix}", max_posts_per_bot=args.batch)
+        )
+
+        bots = [
+            dict(
+                id=uuid4(), bot_id=base_id + i, token=f"{base_id + i}:bench{suffix}",
+                server_ip=f"bench-{suffix}-{i}", settings_id=setting_id,
+            )
+            for i in range(args.bots)
+        ]
+        await uow.session.execute(insert(Bot), bots)
+
+        groups = [
+            dict(
+                id=uuid4(), tg_chat_id=-(base_id + i), type="supergroup", title=f"bench {i}",
+                assigned_bot_id=bots[i % args.bots]["id"],
+            )
+            for i in range(args.groups)
+        ]
+        await uow.session.execute(insert(Group), groups)
+
+        posts = []
+        for i in range(args.posts):
+            group = groups[i % args.groups]
+            posts.append(dict(
+                id=uuid4(), group_id=group["id"], status=PostStatus.ACTIVE.value,
+                target_chat_id=group["tg_chat_id"], distribution_name=f"bench-{suffix}",
+                source_channel_username="bench", source_channel_id=-100, source_message_id=i + 1,
+                target_attempts=args.target_attempts, pause_between_attempts_s=args.pause_s,
+                delete_last_attempt=args.delete_last_attempt, notify_on_failure=False,
+            ))
+        for start in range(0, len(posts), 1000):
+            await uow.session.execute(insert(Post), posts[start:start + 1000])
+
+    return {
+        "setting_id": setting_id,
+        "bot_ids": [bot["id"] for bot in bots],
+        "tokens": [bot["token"] for bot in bots],
+        "group_ids": [group["id"] for group in groups],
+    }
+
+
+async def cleanup(fixture: dict) -> None:
+    async with get_uow(kind="posting") as uow:
+        # posts и post_attempts уходят каскадом от groups
+        await uow.session.execute(delete(Group).where(Group.id.in_(fixture["group_ids"])))
+        await uow.session.execute(delete(Bot).where(Bot.id.in_(fixture["bot_ids"])))
+        await uow.session.execute(delete(Setting).where(Setting.id == fixture["setting_id"]))
+
+
+async def lateness(fixture: dict, started_at, pause_s: int) -> list[float]:
+    async with get_uow(kind="posting") as uow:
+        rows = (
+            await uow.session.execute(
+                select(PostAttempt.post_id, PostAttempt.created_at)
+                .where(PostAttempt.bot_id.in_(fixture["bot_ids"]), PostAttempt.success.is_(True))
+                .order_by(PostAttempt.post_id, PostAttempt.created_at)
+            )
+        ).all()
+
+    by_post: dict[UUID, list] = defaultdict(list)
+    for post_id, created_at in rows:
+        by_post[post_id].append(created_at)
+
+    values: list[float] = []
+    for attempts in by_post.values():
+        due = started_at
+        for sent_at in attempts:
+            values.append((sent_at - due).total_seconds())
+            due = sent_at + timedelta(seconds=pause_s)
+    return values
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    settings = get_settings()
+    settings.MAX_POSTS_PER_SECOND = args.max_posts_per_second
+
+    counter = StatementCounter()
+    counter.attach(get_engine("posting"))
+
+    api = FakeBotAPI(config_from_args(args))
+    # create_bot читает настройку при создании клиента, поэтому раннеры пойдут в заглушку
+    settings.TELEGRAM_API_BASE_URL = await api.start(port=args.api_port)
+
+    fixture = await seed(args)
+    runners = [PostingRunner(token) for token in fixture["tokens"]]
+    for runner in runners:
+        runner.sleep_interval = args.poll_s
+
+    async with get_uow(kind="posting") as uow:
+        started_at = await uow.session.scalar(select(func.now()))
+    api.reset_stats()
+    counter.reset()
+
+    stop_event = asyncio.Event()
+    tasks = [asyncio.create_task(runner.start(stop_event)) for runner in runners]
+    started = time.perf_counter()
+    try:
+        await asyncio.sleep(args.duration_s)
+    finally:
+        stop_event.set()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    elapsed = time.perf_counter() - started
+
+    try:
+        stats = api.stats()
+        late = await lateness(fixture, started_at, args.pause_s)
+    finally:
+        for runner in runners:
+            await runner.close()
+        await api.stop()
+        await cleanup(fixture)
+        await dispose_engine()
+
+    sent = stats["sent"]
+    return {
+        "params": {
+            key: getattr(args, key)
+            for key in ("bots", "groups", "posts", "batch", "pause_s", "target_attempts", "duration_s",
+                        "max_posts_per_second", "latency_ms", "rate_429", "rate_403", "rate_5xx")
+        },
+        "duration_s": elapsed,
+        "sends": sent,
+        "sends_per_s": sent / elapsed if elapsed else 0.0,
+        "lateness_s": {
+            "p50": percentile(late, 0.50),
+            "p99": percentile(late, 0.99),
+            "max": max(late, default=None),
+        },
+        "db_statements_per_send": counter.statements / sent if sent else None,
+        "db_commits_per_send": counter.commits / sent if sent else None,
+        # ru_maxrss в Linux — килобайты
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "api_calls": stats["calls"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bots", type=int, default=2)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=100, help="settings.max_posts_per_bot")
+    parser.add_argument("--pause-s", type=int, default=10)
+    parser.add_argument("--target-attempts", type=int, default=-1)
+    parser.add_argument("--delete-last-attempt", action="store_true")
+    parser.add_argument("--duration-s", type=float, default=30.0)
+    parser.add_argument("--poll-s", type=float, default=1.0, help="PostingRunner.sleep_interval")
+    parser.add_argument("--max-posts-per-second", type=int, default=get_settings().MAX_POSTS_PER_SECOND)
+    parser.add_argument("--api-port", type=int, default=8081)
+    parser.add_argument("--log-level", default="WARNING")
+    add_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+    print(json.dumps(asyncio.run(run(args)), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Cold start: import time and time to first post after a restart.
+
+Import time: for each module in --modules runs ``python -X importtime -c
+"import <module>"`` in a fresh interpreter and reports the cumulative import
+time, the wall time of the process and the slowest modules by self time.
+
+Time to first post (``--restarts N``, needs a migrated Postgres at
+DATABASE_URL): seeds one bot with ready posts like
+``benchmarks.posting_throughput``, serves ``benchmarks.fake_bot_api``
+in-process and starts ``main.py`` N times with TOKEN and
+TELEGRAM_API_BASE_URL pointing at it. Each run measures the time from spawn
+to the first forwardMessage the fake API receives, then stops the node with
+SIGTERM. ``update_autoposter.sh`` restarts every node on deploy, so this is
+the posting gap a deploy causes.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --restarts 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = ("bootstrap", "services.posting", "bot.builder.dispatcher_manager")
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_time(module: str, top: int) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed"}
+
+    rows = []
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        self_us, total_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        rows.append((self_us, name))
+        if name == module and len(indent) <= 1:
+            cumulative_us = total_us
+    rows.sort(reverse=True)
+    return {
+        "cumulative_ms": cumulative_us / 1e3,
+        "wall_ms": wall * 1e3,
+        "modules": len(rows),
+        "slowest_self_ms": {name: self_us / 1e3 for self_us, name in rows[:top]},
+    }
+
+
+async def first_post(args: argparse.Namespace) -> list[float]:
+    from benchmarks.fake_bot_api import FakeBotAPI, FakeBotAPIConfig
+    from benchmarks.posting_throughput import cleanup, seed
+    from infra.db.session import dispose_engine
+
+    api = FakeBotAPI(FakeBotAPIConfig(chat_limit=0, global_rps=0))
+    url = await api.start(port=args.api_port)
+    seed_args = argparse.Namespace(
+        bots=1, groups=args.posts, posts=args.posts, batch=args.posts, target_attempts=-1,
+        pause_s=3600, delete_last_attempt=False,
+    )
+    fixture = await seed(seed_args)
+    timings: list[float] = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "TOKEN": fixture["tokens"][0],
+                "TELEGRAM_API_BASE_URL": url,
+                "LOG_FILE": str(Path(tmp) / "startup.log"),
+                "LOG_LEVEL": "WARNING",
+            }
+            for _ in range(args.restarts):
+                api.reset_stats()
+                timings.append(await _spawn_until_first_post(api, env, args.timeout_s))
+                # Следующий запуск тоже должен застать пост готовым
+                await _reset_posts(fixture)
+    finally:
+        await api.stop()
+        await cleanup(fixture)
+        await dispose_engine()
+    return timings
+
+
+async def _spawn_until_first_post(api, env: dict, timeout_s: float) -> float:
+    started = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "main.py", cwd=ROOT, env=env,
+        stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        while api.stats()["sent"] == 0:
+            if proc.returncode is not None:
+                raise RuntimeError(f"main.py exited with {proc.returncode} before the first post")
+            if time.perf_counter() - started > timeout_s:
+                raise TimeoutError(f"No post within {timeout_s}s")
+            await asyncio.sleep(0.01)
+        return time.perf_counter() - started
+    finally:
+        if proc.returncode is None:
+            proc.send_signal(signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+
+
+async def _reset_posts(fixture: dict) -> None:
+    from sqlalchemy import delete, update
+
+    from infra.db.models import Post, PostAttempt
+    from infra.db.uow import get_uow
+
+    async with get_uow(kind="posting") as uow:
+        post_ids = (
+            await uow.session.execute(
+                update(Post)
+                .where(Post.group_id.in_(fixture["group_ids"]))
+                .values(count_attempts=0, last_attempt_at=None)
+                .returning(Post.id)
+            )
+        ).scalars().all()
+        if post_ids:
+            await uow.session.execute(delete(PostAttempt).where(PostAttempt.post_id.in_(post_ids)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES))
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list per import")
+    parser.add_argument("--restarts", type=int, default=0, help="time-to-first-post runs (needs the database)")
+    parser.add_argument("--posts", type=int, default=5)
+    parser.add_argument("--timeout-s", type=float, default=120.0)
+    parser.add_argument("--api-port", type=int, default=8083)
+    args = parser.parse_args()
+
+    report: dict = {"imports": {module: import_time(module, args.top) for module in args.modules}}
+    if args.restarts:
+        timings = sorted(asyncio.run(first_post(args)))
+        report["time_to_first_post_s"] = {
+            "runs": timings,
+            "p50": timings[len(timings) // 2],
+            "max": timings[-1],
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
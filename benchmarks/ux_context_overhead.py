@@ -0,0 +1,220 @@
+"""Per-update overhead of building the admin UX context.
+
+Compares the baseline construction with the lazy context, where a typical
+update touches a single screen. The baseline is the body of the previous
+``UXMiddleware._build_context``, copied verbatim: locale dictionaries read on
+each update and every use case instantiated. The use case constructors are
+unchanged since then. The old ``AdminUX.__init__`` only stored its arguments,
+so a ``SimpleNamespace`` stands in for it.
+
+    python -m benchmarks.ux_context_overhead --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from types import SimpleNamespace
+
+from bot.locales import RU_TEXT, RU_BUTTONS, RU_STATUS, RU_PAGINATION, RU_CONFIRMATION, RU_RESULTS
+from bot.ux import AdminUseCases, AdminUX, UXContext, RU_ADMIN_TEXTS
+from common.enums import AdminMenuAction
+from common.usecases import (
+    ShowMainMenuUseCase,
+    ShowBotsListUseCase,
+    ShowBotCardUseCase,
+    ShowGroupsListUseCase,
+    ShowGroupCardUseCase,
+    PrepareFreeBotUseCase,
+    FreeBotUseCase,
+    PrepareDeleteBotUseCase,
+    DeleteBotUseCase,
+    ShowPlaceholderUseCase,
+    ShowDistributionsListUseCase,
+    ShowDistributionCardUseCase,
+    ShowDistributionGroupsUseCase,
+    ShowDistributionGroupCardUseCase,
+    ShowPostCardUseCase,
+    ShowPostsListUseCase,
+)
+
+# Use cases only keep references to their services, so placeholders are enough here.
+_SERVICES = {
+    "bot_service": object(),
+    "group_service": object(),
+    "post_service": object(),
+    "post_attempt_service": object(),
+    "settings_service": object(),
+}
+
+
+def baseline_update() -> SimpleNamespace:
+    bot_service = _SERVICES["bot_service"]
+    group_service = _SERVICES["group_service"]
+    post_service = _SERVICES["post_service"]
+    post_attempt_service = _SERVICES["post_attempt_service"]
+    settings_service = _SERVICES["settings_service"]
+
+    main_menu_uc = ShowMainMenuUseCase(
+        prompt_text=RU_TEXT["menu"]["main_prompt"],
+        buttons={
+            AdminMenuAction.DISTRIBUTIONS: RU_BUTTONS["menu"]["distributions"],
+            AdminMenuAction.BOTS: RU_BUTTONS["menu"]["bots"],
+            AdminMenuAction.GROUPS: RU_BUTTONS["menu"]["groups"],
+            AdminMenuAction.STATS: RU_BUTTONS["menu"]["stats"],
+            AdminMenuAction.SETTINGS: RU_BUTTONS["menu"]["settings"],
+        },
+    )
+    bots_list_uc = ShowBotsListUseCase(
+        bot_service=bot_service,
+        post_service=post_service,
+        settings_service=settings_service,
+        texts=RU_TEXT["bots"],
+        status_texts=RU_STATUS,
+        pagination_texts=RU_PAGINATION,
+    )
+    bot_card_uc = ShowBotCardUseCase(
+        bot_service=bot_service,
+        post_service=post_service,
+        post_attempt_service=post_attempt_service,
+        settings_service=settings_service,
+        texts=RU_TEXT["bots"],
+        metrics_texts={
+            "last_send": RU_TEXT["bots"]["card_metrics_last"],
+            "success_min": RU_TEXT["bots"]["card_metrics_success_min"],
+            "success_total": RU_TEXT["bots"]["card_metrics_success_total"],
+            "fail_min": RU_TEXT["bots"]["card_metrics_fail_min"],
+            "fail_total": RU_TEXT["bots"]["card_metrics_fail_total"],
+        },
+        status_texts=RU_STATUS,
+    )
+    groups_list_uc = ShowGroupsListUseCase(
+        group_service=group_service,
+        bot_service=bot_service,
+        settings_service=settings_service,
+        texts=RU_TEXT["groups"],
+        pagination_texts=RU_PAGINATION,
+    )
+    group_card_uc = ShowGroupCardUseCase(
+        group_service=group_service,
+        bot_service=bot_service,
+        texts=RU_TEXT["groups"],
+    )
+    ShowPostsListUseCase(
+        post_service=post_service,
+        settings_service=settings_service,
+        group_service=group_service,
+        bot_service=bot_service,
+        texts=RU_TEXT["posts"],
+        pagination_texts=RU_PAGINATION,
+    )
+    ShowPostCardUseCase(
+        post_service=post_service,
+        group_service=group_service,
+        bot_service=bot_service,
+        texts=RU_TEXT["posts"],
+    )
+    distributions_list_uc = ShowDistributionsListUseCase(
+        post_service=post_service,
+        settings_service=settings_service,
+        texts=RU_TEXT["distributions"],
+        pagination_texts=RU_PAGINATION,
+        status_short_texts=RU_TEXT["posts"].get("status_short", {}),
+    )
+    distribution_card_uc = ShowDistributionCardUseCase(
+        post_service=post_service,
+        texts=RU_TEXT["distributions"],
+        status_labels=RU_TEXT["posts"].get("status_labels", {}),
+        status_short=RU_TEXT["posts"].get("status_short", {}),
+    )
+    distribution_groups_uc = ShowDistributionGroupsUseCase(
+        post_service=post_service,
+        settings_service=settings_service,
+        group_service=group_service,
+        bot_service=bot_service,
+        texts=RU_TEXT["distributions"],
+        pagination_texts=RU_PAGINATION,
+        status_short_texts=RU_TEXT["posts"].get("status_short", {}),
+    )
+    distribution_group_card_uc = ShowDistributionGroupCardUseCase(
+        post_service=post_service,
+        group_service=group_service,
+        bot_service=bot_service,
+        texts=RU_TEXT["distributions"],
+        status_labels=RU_TEXT["posts"].get("status_labels", {}),
+    )
+    free_prompt_uc = PrepareFreeBotUseCase(
+        bot_service=bot_service,
+        texts=RU_TEXT["bots"],
+        confirmation_texts=RU_CONFIRMATION,
+    )
+    free_uc = FreeBotUseCase(
+        bot_service=bot_service,
+        post_service=post_service,
+        result_texts=RU_RESULTS,
+    )
+    delete_prompt_uc = PrepareDeleteBotUseCase(
+        bot_service=bot_service,
+        texts=RU_TEXT["bots"],
+        confirmation_texts=RU_CONFIRMATION,
+    )
+    delete_uc = DeleteBotUseCase(
+        bot_service=bot_service,
+        post_service=post_service,
+        result_texts=RU_RESULTS,
+    )
+    placeholder_base = RU_TEXT["menu"].get("placeholder", "Раздел в разработке")
+    placeholder_uc = ShowPlaceholderUseCase(
+        texts={
+            AdminMenuAction.STATS: f"{RU_BUTTONS['menu']['stats']} — {placeholder_base}",
+            AdminMenuAction.SETTINGS: f"{RU_BUTTONS['menu']['settings']} — {placeholder_base}",
+            "placeholder": placeholder_base,
+        }
+    )
+    admin_ux = SimpleNamespace(
+        bot_service=bot_service,
+        main_menu_uc=main_menu_uc,
+        bots_list_uc=bots_list_uc,
+        bot_card_uc=bot_card_uc,
+        groups_list_uc=groups_list_uc,
+        group_card_uc=group_card_uc,
+        distributions_list_uc=distributions_list_uc,
+        distribution_card_uc=distribution_card_uc,
+        distribution_groups_uc=distribution_groups_uc,
+        distribution_group_card_uc=distribution_group_card_uc,
+        free_prompt_uc=free_prompt_uc,
+        free_uc=free_uc,
+        delete_prompt_uc=delete_prompt_uc,
+        delete_uc=delete_uc,
+        placeholder_uc=placeholder_uc,
+        admin_texts=RU_TEXT["admin"],
+        menu_texts=RU_TEXT["menu"],
+        bots_texts=RU_TEXT["bots"],
+        groups_texts=RU_TEXT["groups"],
+        distributions_texts=RU_TEXT["distributions"],
+    )
+    return SimpleNamespace(admin=admin_ux)
+
+
+def lazy_update() -> None:
+    use_cases = AdminUseCases(texts=RU_ADMIN_TEXTS, **_SERVICES)  # type: ignore[arg-type]
+    admin = AdminUX(bot_service=_SERVICES["bot_service"], use_cases=use_cases, texts=RU_ADMIN_TEXTS)  # type: ignore[arg-type]
+    UXContext(admin=admin).admin._use_cases.main_menu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {}
+    for name, func in (("baseline", baseline_update), ("lazy", lazy_update)):
+        elapsed = min(timeit.repeat(func, number=args.iterations, repeat=5))
+        results[name] = {"us_per_update": elapsed / args.iterations * 1e6}
+    results["speedup"] = results["baseline"]["us_per_update"] / results["lazy"]["us_per_update"]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
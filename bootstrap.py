@@ -4,15 +4,29 @@ import asyncio
 import contextlib
 import logging
 import signal
+from typing import Optional
+
 from config.settings import Config
 from bot.builder.bot_manager import BotManager
 from bot.builder.dispatcher_manager import DispatcherManager
-from config.app_setup import setup_application
+from bot.builder.instance_redis_storage import create_redis_storage
+from bot.states.selection_store import RedisSelectionStore, configure_selection_store
+from config.app_setup import log_event_loop, setup_application
+from config.logging_setup import stop_logging
 from config.settings import get_settings
 from services.heartbeat import _heartbeat_worker
+from common.enums import ControlEvent
+from infra.cache import RedisCache, configure_cache, create_redis_client, get_cache
+from infra.db.notify import ControlListener, listen_dsn
+from infra.db.replica import get_replica_router
 from infra.db.session import dispose_engine
+from infra.loop_watchdog import LoopWatchdog, configure_asyncio_debug
+from infra.metrics import start_metrics_server
+from infra.tracing import configure_tracing, shutdown_tracing
+import infra.db.metrics  # noqa: F401  регистрирует метрики db_pool_*
 
 from services.posting import PostingRunner
+from services.settings_service import SETTINGS_CACHE_BUCKET
 
 logger = logging.getLogger(__name__)
 
@@ -41,37 +55,119 @@ async def _init_posting_runner(settings: Config):
     return posting_runner
 
 
+def _init_redis(settings: Config):
+    """Create the shared Redis pool and the FSM storage / cache that use it."""
+    if not settings.REDIS_URL or not (settings.USE_REDIS_STORAGE or settings.USE_REDIS_CACHE):
+        return None, None
+
+    redis = create_redis_client(settings.REDIS_URL)
+    storage = None
+    if settings.USE_REDIS_STORAGE:
+        storage = create_redis_storage(redis)
+        configure_selection_store(RedisSelectionStore(redis))
+    if settings.USE_REDIS_CACHE:
+        configure_cache(RedisCache(redis, ttl=settings.REDIS_CACHE_TTL_S))
+    logger.info(
+        f"Redis enabled: fsm_storage={settings.USE_REDIS_STORAGE}, cache={settings.USE_REDIS_CACHE}"
+    )
+    return redis, storage
+
+
+def _init_control_listener(
+    settings: Config,
+    heartbeat_wake: asyncio.Event,
+    posting_runner: PostingRunner,
+) -> ControlListener | None:
+    """LISTEN на управляющие события: реагируем сразу, не дожидаясь опроса."""
+    if not settings.CONTROL_LISTEN_ENABLED or "+asyncpg" not in (settings.DB_LISTEN_URL or settings.DATABASE_URL):
+        return None
+
+    async def on_force_update(message: dict) -> None:
+        heartbeat_wake.set()
+
+    async def on_settings_changed(message: dict) -> None:
+        cache = get_cache()
+        if cache is not None:
+            await cache.invalidate(SETTINGS_CACHE_BUCKET)
+
+    async def on_posts_stopped(message: dict) -> None:
+        posting_runner.interrupt_batch(message)
+
+    listener = ControlListener(listen_dsn(settings))
+    listener.subscribe(ControlEvent.FORCE_UPDATE, on_force_update)
+    listener.subscribe(ControlEvent.SETTINGS_CHANGED, on_settings_changed)
+    listener.subscribe(ControlEvent.POSTS_PAUSED, on_posts_stopped)
+    listener.subscribe(ControlEvent.BOT_DEACTIVATED, on_posts_stopped)
+    return listener
+
+
 async def init_app() -> None:
     """Bootstrap application, run dispatcher polling and gracefull shutdown."""
     settings = get_settings()
     setup_application(settings)
+    log_event_loop(settings)
+    start_metrics_server(settings)
+    # До создания клиентов и диспетчера: middlewares трассировки ставятся только если она включена
+    configure_tracing(settings)
 
-    bot_manager = BotManager(settings.TOKEN)
-    dp_manager = DispatcherManager(bot_manager)
+    redis, storage = _init_redis(settings)
     posting_runner = await _init_posting_runner(settings)
-    await dp_manager.setup()
 
     loop = asyncio.get_running_loop()
+    configure_asyncio_debug(loop, settings.ASYNCIO_DEBUG, settings.ASYNCIO_SLOW_CALLBACK_S)
     stop_event = asyncio.Event()
     _install_signal_handlers(stop_event, loop)
 
-    polling_task = asyncio.create_task(_start_polling(dp_manager, stop_event), name="bot-polling")
-    heartbeat_task = asyncio.create_task(
-        _heartbeat_worker(settings.TOKEN, stop_event),
-        name="bot-heartbeat",
-    )
+    # Раннер стартует первым: после рестарта (update_autoposter.sh) первый пост
+    # не ждёт set_my_commands в dp_manager.setup()
     posting_task = asyncio.create_task(
         posting_runner.start(stop_event),
         name="posting-runner",
     )
+    heartbeat_wake = asyncio.Event()
+    heartbeat_task = asyncio.create_task(
+        _heartbeat_worker(settings.TOKEN, stop_event, heartbeat_wake),
+        name="bot-heartbeat",
+    )
+    await asyncio.sleep(0)
+
+    # Раннер и heartbeat уже работают: ошибку настройки диспетчера проводим
+    # через обычную остановку, а не бросаем из init_app с живыми задачами
+    bot_manager: Optional[BotManager] = None
+    dp_manager: Optional[DispatcherManager] = None
+    polling_task: Optional[asyncio.Task] = None
+    setup_error: Optional[Exception] = None
+    try:
+        bot_manager = BotManager(settings.TOKEN)
+        dp_manager = DispatcherManager(bot_manager, storage=storage)
+        await dp_manager.setup()
+    except Exception as e:
+        logger.error(f"Dispatcher setup failed, shutting down: {type(e).__name__}: {e}", exc_info=True)
+        setup_error = e
+        stop_event.set()
+    else:
+        polling_task = asyncio.create_task(_start_polling(dp_manager, stop_event), name="bot-polling")
+    replica_router = get_replica_router()
+    replica_task = None
+    if replica_router is not None:
+        replica_task = asyncio.create_task(replica_router.run(stop_event), name="db-replica-lag")
+    control_listener = _init_control_listener(settings, heartbeat_wake, posting_runner)
+    control_task = None
+    if control_listener is not None:
+        control_task = asyncio.create_task(control_listener.run(stop_event), name="control-listener")
+    watchdog_task = None
+    if settings.LOOP_WATCHDOG_ENABLED:
+        watchdog = LoopWatchdog(settings.LOOP_WATCHDOG_INTERVAL_S, settings.LOOP_WATCHDOG_THRESHOLD_S)
+        watchdog_task = asyncio.create_task(watchdog.run(stop_event), name="loop-watchdog")
 
     await stop_event.wait()
 
     logger.info("Shutting down tasks...")
     
-    polling_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-        await polling_task
+    if polling_task is not None:
+        polling_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await polling_task
 
     heartbeat_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
@@ -81,24 +177,48 @@ async def init_app() -> None:
     with contextlib.suppress(asyncio.CancelledError):
         await posting_task
 
+    if replica_task is not None:
+        replica_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await replica_task
+
+    if control_task is not None:
+        control_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await control_task
+
+    if watchdog_task is not None:
+        watchdog_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watchdog_task
+
     logger.info("Closing resources...")
     
     # Закрываем ресурсы через их методы
-    try:
-        await dp_manager.close()
-    except Exception as e:
-        logger.error(f"Error closing dispatcher manager: {e}", exc_info=True)
-    
-    try:
-        await bot_manager.close()
-    except Exception as e:
-        logger.error(f"Error closing bot manager: {e}", exc_info=True)
+    if dp_manager is not None:
+        try:
+            await dp_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing dispatcher manager: {e}", exc_info=True)
+
+    if bot_manager is not None:
+        try:
+            await bot_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing bot manager: {e}", exc_info=True)
     
     try:
         await posting_runner.close()
     except Exception as e:
         logger.error(f"Error closing posting runner: {e}", exc_info=True)
     
+    if redis is not None:
+        configure_cache(None)
+        try:
+            await redis.aclose()
+        except Exception as e:
+            logger.error(f"Error closing redis: {e}", exc_info=True)
+
     # Закрываем соединения с БД через функцию из session
     try:
         await dispose_engine()
@@ -106,7 +226,16 @@ async def init_app() -> None:
     except Exception as e:
         logger.error(f"Error disposing database engine: {e}", exc_info=True)
 
+    try:
+        shutdown_tracing()
+    except Exception as e:
+        logger.error(f"Error flushing traces: {e}", exc_info=True)
+
     logger.info("Application shutdown complete.")
+    stop_logging()
+    if setup_error is not None:
+        # Ненулевой код выхода, чтобы супервизор перезапустил узел
+        raise setup_error
 
 
 __all__ = ["init_app"]
@@ -1,11 +1,39 @@
 from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
 from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
 from aiogram.enums import ParseMode
 
+from bot.middlewares.request import connect_request_middlewares
+from config.settings import get_settings
+
+
+def _orjson_dumps(obj) -> str:
+    import orjson
+
+    return orjson.dumps(obj).decode()
+
+
+def create_session() -> AiohttpSession | None:
+    """Сессия по настройкам: свой Bot API server и/или orjson; None — сессия aiogram по умолчанию."""
+    settings = get_settings()
+    base_url = settings.TELEGRAM_API_BASE_URL
+    if not base_url and not settings.FAST_JSON:
+        return None
+    kwargs = {}
+    if settings.FAST_JSON:
+        import orjson
+
+        kwargs.update(json_loads=orjson.loads, json_dumps=_orjson_dumps)
+    # Локальный Bot API server или заглушка benchmarks.fake_bot_api
+    api = TelegramAPIServer.from_base(base_url) if base_url else PRODUCTION
+    return AiohttpSession(api=api, **kwargs)
+
 
 def create_bot(token: str, session: AiohttpSession | None = None):
-    return Bot(
+    if session is None:
+        session = create_session()
+    bot = Bot(
         token=token,
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
@@ -13,3 +41,5 @@ def create_bot(token: str, session: AiohttpSession | None = None):
         ),
         session=session
     )
+    connect_request_middlewares(bot)
+    return bot
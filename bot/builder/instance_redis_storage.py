@@ -2,11 +2,18 @@ from aiogram.fsm.storage.base import DefaultKeyBuilder
 from aiogram.fsm.storage.redis import RedisStorage
 from redis.asyncio import Redis
 
+from infra.cache import json_dumps, json_loads
+
+
+def create_redis_storage(redis: Redis | str) -> RedisStorage:
+    if isinstance(redis, str):
+        redis = Redis.from_url(redis)
 
-def create_redis_storage(DATABASE_URL: str) -> RedisStorage:
     redis_storage = RedisStorage(
-        Redis.from_url(DATABASE_URL),
-        key_builder=DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+        redis,
+        key_builder=DefaultKeyBuilder(with_bot_id=True, with_destiny=True),
+        json_loads=json_loads,
+        json_dumps=json_dumps,
         )
 
     return redis_storage
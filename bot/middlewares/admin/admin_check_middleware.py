@@ -4,7 +4,7 @@ from typing import Any, Awaitable, Callable
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 
-from infra.db.models import User
+from common.dto import UserDTO
 
 logger = getLogger(__name__)
 
@@ -16,7 +16,7 @@ class AdminCheckMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: dict[str, Any]
     ) -> Any:
-        user: User = data['user']
+        user: UserDTO = data['user']
 
         if not user.is_superuser:
             return
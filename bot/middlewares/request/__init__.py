@@ -0,0 +1,13 @@
+from aiogram import Bot
+
+from infra.tracing import is_tracing_enabled
+
+from .metrics_middleware import RequestMetricsMiddleware
+from .tracing_middleware import TracingRequestMiddleware
+
+
+def connect_request_middlewares(bot: Bot) -> None:
+    # Middlewares исходящих запросов к Bot API (сессия своя у каждого клиента)
+    bot.session.middleware(RequestMetricsMiddleware())
+    if is_tracing_enabled():
+        bot.session.middleware(TracingRequestMiddleware())
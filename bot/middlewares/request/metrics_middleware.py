@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+
+from infra.metrics import TELEGRAM_REQUEST_DURATION
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+# Long polling держит запрос до timeout — в латентность API его не считаем
+SKIP_METHODS = frozenset({"getUpdates"})
+
+
+class RequestMetricsMiddleware(BaseRequestMiddleware):
+    """Latency of outgoing Bot API calls by method and outcome."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        api_method: Any = method.__api_method__
+        if api_method in SKIP_METHODS:
+            return await make_request(bot, method)
+
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await make_request(bot, method)
+            outcome = "ok"
+            return response
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            TELEGRAM_REQUEST_DURATION.labels(method=api_method, outcome=outcome).observe(
+                time.perf_counter() - started
+            )
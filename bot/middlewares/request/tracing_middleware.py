@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+
+from infra import tracing
+
+from .metrics_middleware import SKIP_METHODS
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+
+class TracingRequestMiddleware(BaseRequestMiddleware):
+    """Спан telegram.<method> на исходящий вызов Bot API."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        api_method: Any = method.__api_method__
+        if api_method in SKIP_METHODS:
+            return await make_request(bot, method)
+        with tracing.span(
+            f"telegram.{api_method}",
+            **{"telegram.method": api_method, "telegram.chat_id": getattr(method, "chat_id", None)},
+        ):
+            return await make_request(bot, method)
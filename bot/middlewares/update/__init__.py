@@ -1,28 +1,23 @@
 from aiogram import Dispatcher
 
-from .uow_middleware import UoWMiddleware
-from .settings_service_middleware import SettingsServiceMiddleware
-from .bot_service_middleware import BotServiceMiddleware
-from .group_service_middleware import GroupServiceMiddleware
-from .post_service_middleware import PostServiceMiddleware
-from .post_attempt_service_middleware import PostAttemptServiceMiddleware
-from .user_service_middleware import UserServiceMiddleware
-from .system_service_middleware import SystemServiceMiddleware
-from .ux_middleware import UXMiddleware
-from .bot_initialization_middleware import BotInitializationMiddleware
-from .user_middleware import UserMiddleware
+from config.settings import get_settings
+from infra.tracing import is_tracing_enabled
+
+from .di_middleware import DependencyMiddleware
+from .tracing_middleware import TracingMiddleware
+from .user_cache import UserCache
 
 
 def connect_update_middlewares(dp: Dispatcher) -> None:
-    # Order matters: first start the UoW, then expose service facades, then resolve user context
-    dp.update.middleware(UoWMiddleware())
-    dp.update.middleware(SettingsServiceMiddleware())
-    dp.update.middleware(BotServiceMiddleware())
-    dp.update.middleware(GroupServiceMiddleware())
-    dp.update.middleware(PostServiceMiddleware())
-    dp.update.middleware(PostAttemptServiceMiddleware())
-    dp.update.middleware(UserServiceMiddleware())
-    dp.update.middleware(SystemServiceMiddleware())
-    dp.update.middleware(UXMiddleware())
-    dp.update.middleware(BotInitializationMiddleware())
-    dp.update.middleware(UserMiddleware())
+    # One inner middleware per event observer: the matched handler is known there,
+    # so only the dependencies it declares are built (see DependencyMiddleware).
+    settings = get_settings()
+    if is_tracing_enabled():
+        dp.update.outer_middleware(TracingMiddleware())
+    di_middleware = DependencyMiddleware(
+        user_cache=UserCache(max_size=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_S),
+    )
+    for name, observer in dp.observers.items():
+        if name in ("update", "error"):
+            continue
+        observer.middleware.register(di_middleware)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.enums.chat_type import ChatType
+from aiogram.types import TelegramObject, User
+
+from bot.ux import AdminTexts, RU_ADMIN_TEXTS
+from common.dto import BotInitializationResult, UserDTO
+from common.usecases import BotInitializationUseCase
+from infra.db.models import User as UserDB
+from infra.db.replica import get_replica_router
+from infra.db.uow import SQLAlchemyUnitOfWork, get_uow
+from services import SystemService
+
+from .scope import PROVIDERS, UpdateScope
+from .user_cache import UserCache
+
+logger = getLogger(__name__)
+
+
+class DependencyMiddleware(BaseMiddleware):
+    """Single inner middleware that injects per-update dependencies.
+
+    Registered on the event observers (not on ``update``), so the matched
+    handler is already known: only the services listed in its signature are
+    built. The set of names per handler is computed once and cached.
+    """
+
+    def __init__(
+        self,
+        texts: AdminTexts = RU_ADMIN_TEXTS,
+        uow_factory: Callable[[], SQLAlchemyUnitOfWork] = partial(get_uow, kind="admin"),
+        user_cache: Optional[UserCache] = None,
+        read_uow_factory: Callable[[], SQLAlchemyUnitOfWork] = partial(get_uow, kind="admin", read_only=True),
+    ) -> None:
+        self._texts = texts
+        self._user_cache = user_cache if user_cache is not None else UserCache()
+        self._uow_factory = uow_factory
+        self._read_uow_factory = read_uow_factory
+        self._system_service = SystemService()
+        self._plans: dict[Any, tuple[str, ...]] = {}
+
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._init_result: Optional[BotInitializationResult] = None
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        chat = data.get("event_chat")
+        if chat is None or chat.type != ChatType.PRIVATE.value:
+            return
+
+        from_user: Optional[User] = data.get("event_from_user")
+        if from_user is None or from_user.is_bot:
+            return
+
+        # Без реплики (или пока она отстаёт) админка читает в той же транзакции:
+        # второй сессии на primary незачем держать ещё одно соединение пула
+        router = get_replica_router()
+        async with self._uow_factory() as uow:
+            read_uow = self._read_uow_factory() if router is not None and router.healthy else uow
+            async with read_uow:
+                scope = UpdateScope(uow, read_uow=read_uow, system_service=self._system_service, texts=self._texts)
+
+                if not self._initialized:
+                    await self._initialize_bot(scope, data["bot"])
+
+                data["user"] = await self._resolve_user(uow, from_user)
+                for name in self._plan_for(data.get("handler")):
+                    data[name] = scope.resolve(name)
+                if self._init_result:
+                    data["bot_initialization"] = self._init_result
+
+                return await handler(event, data)
+
+    def _plan_for(self, handler_object: Any) -> tuple[str, ...]:
+        if handler_object is None:
+            return tuple(PROVIDERS)
+
+        key = handler_object.callback
+        plan = self._plans.get(key)
+        if plan is None:
+            if handler_object.varkw:
+                plan = tuple(PROVIDERS)
+            else:
+                plan = tuple(name for name in PROVIDERS if name in handler_object.params)
+            self._plans[key] = plan
+        return plan
+
+    async def _initialize_bot(self, scope: UpdateScope, bot: Any) -> None:
+        async with self._init_lock:
+            if self._initialized:
+                return
+            me = await bot.get_me()
+            usecase = BotInitializationUseCase(
+                scope.resolve("bot_service"),
+                scope.resolve("settings_service"),
+                scope.resolve("system_service"),
+            )
+            self._init_result = await usecase(
+                bot_id=me.id,
+                token=bot.token,
+                username=me.username,
+                full_name=getattr(me, "full_name", None),
+            )
+            self._initialized = True
+
+    async def _resolve_user(self, uow: SQLAlchemyUnitOfWork, user: User) -> UserDTO:
+        cached = self._user_cache.get(user.id, user.username, user.full_name)
+        if cached is not None:
+            return cached
+
+        tg_user = await uow.user_repo.get(user.id)
+        if tg_user is None:
+            tg_user = await uow.user_repo.add(
+                UserDB(
+                    user_id=user.id,
+                    username=user.username,
+                    full_name=user.full_name,
+                )
+            )
+        elif tg_user.full_name != user.full_name or tg_user.username != user.username:
+            tg_user.full_name = user.full_name
+            tg_user.username = user.username
+            tg_user = await uow.user_repo.update(tg_user)
+
+        dto = UserDTO.from_model(tg_user)
+        # В кэш — только после коммита: при откате вставки/обновления кэш не должен
+        # отдавать несуществующую строку до истечения TTL
+        uow.after_commit(partial(self._user_cache.put, dto))
+        return dto
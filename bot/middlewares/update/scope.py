@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from bot.states.selection_store import get_selection_store
+from bot.ux import UXContext, AdminUX, AdminTexts, AdminUseCases, AdminReadServices
+from infra.cache import get_cache
+from infra.db.uow import SQLAlchemyUnitOfWork
+from services import (
+    BotService,
+    GroupService,
+    PostAttemptService,
+    PostService,
+    SettingsService,
+    SystemService,
+    UserService,
+)
+
+
+class UpdateScope:
+    """Per-update dependency container.
+
+    Every dependency is built on first request and cached for the rest of the
+    update. Repositories (and therefore the DB session) are only created when
+    a service that needs them is resolved.
+
+    ``read_uow`` is a read-only unit of work on the replica when one is in
+    sync, and ``uow`` itself otherwise. Admin screens read through it only
+    while the handler has written nothing: the write transaction commits when
+    the middleware exits, so a screen rendered after a write must read it on
+    the primary. Everything that writes — including the group metadata
+    refresh done while rendering — stays on ``uow``.
+    """
+
+    __slots__ = ("uow", "read_uow", "_system_service", "_texts", "_resolved", "_replica_readers")
+
+    def __init__(
+        self,
+        uow: SQLAlchemyUnitOfWork,
+        *,
+        read_uow: SQLAlchemyUnitOfWork,
+        system_service: SystemService,
+        texts: AdminTexts,
+    ) -> None:
+        self.uow = uow
+        self.read_uow = read_uow
+        self._system_service = system_service
+        self._texts = texts
+        self._resolved: dict[str, Any] = {}
+        self._replica_readers: Optional[AdminReadServices] = None
+
+    def resolve(self, name: str) -> Any:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            value = self._resolved[name] = PROVIDERS[name](self)
+            return value
+
+    def _build_ux(self) -> UXContext:
+        bot_service = self.resolve("bot_service")
+        use_cases = AdminUseCases(
+            bot_service=bot_service,
+            group_service=self.resolve("group_service"),
+            post_service=self.resolve("post_service"),
+            post_attempt_service=self.resolve("post_attempt_service"),
+            settings_service=self.resolve("settings_service"),
+            texts=self._texts,
+            readers=self._admin_readers,
+        )
+        return UXContext(admin=AdminUX(bot_service=bot_service, use_cases=use_cases, texts=self._texts))
+
+    def _admin_readers(self) -> AdminReadServices:
+        if self.read_uow is self.uow or self.uow.has_writes:
+            return AdminReadServices(
+                bot_service=self.resolve("bot_service"),
+                post_service=self.resolve("post_service"),
+                post_attempt_service=self.resolve("post_attempt_service"),
+                settings_service=self.resolve("settings_service"),
+            )
+        if self._replica_readers is None:
+            self._replica_readers = AdminReadServices(
+                bot_service=BotService(self.read_uow.bot_repo, get_cache(), uow=self.read_uow),
+                post_service=PostService(self.read_uow, get_cache()),
+                post_attempt_service=PostAttemptService(self.read_uow),
+                settings_service=SettingsService(self.read_uow.settings_repo, get_cache(), uow=self.read_uow),
+            )
+        return self._replica_readers
+
+
+PROVIDERS: dict[str, Callable[[UpdateScope], Any]] = {
+    "uow": lambda scope: scope.uow,
+    "settings_service": lambda scope: SettingsService(scope.uow.settings_repo, get_cache(), uow=scope.uow),
+    "bot_service": lambda scope: BotService(scope.uow.bot_repo, get_cache(), uow=scope.uow),
+    "group_service": lambda scope: GroupService(scope.uow.group_repo),
+    "post_service": lambda scope: PostService(scope.uow, get_cache()),
+    "post_attempt_service": lambda scope: PostAttemptService(scope.uow),
+    "user_service": lambda scope: UserService(scope.uow.user_repo),
+    "system_service": lambda scope: scope._system_service,
+    "selections": lambda scope: get_selection_store(),
+    "ux": UpdateScope._build_ux,
+}
+
+
+__all__ = ["UpdateScope", "PROVIDERS"]
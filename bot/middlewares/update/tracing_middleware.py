@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+from infra import tracing
+
+
+class TracingMiddleware(BaseMiddleware):
+    """Корневой спан telegram.update на обработку апдейта.
+
+    Outer middleware на ``update``: спаны DI, use case, репозиториев и SQL
+    внутри обработчика становятся его дочерними.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Update):
+            return await handler(event, data)
+        with tracing.span(
+            "telegram.update",
+            update_id=event.update_id,
+            event_type=event.event_type,
+        ):
+            return await handler(event, data)
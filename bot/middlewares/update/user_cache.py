@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from common.dto import UserDTO
+
+
+def profile_hash(username: Optional[str], full_name: Optional[str]) -> int:
+    return hash((username, full_name))
+
+
+@dataclass(slots=True)
+class _Entry:
+    user: UserDTO
+    profile_hash: int
+    expires_at: float
+
+
+class UserCache:
+    """
+    LRU-кэш пользователей по Telegram id.
+
+    Запись считается актуальной, пока не истёк TTL и хэш (username, full_name)
+    совпадает с тем, что пришёл в апдейте. is_superuser кэшируется вместе с
+    записью, поэтому изменение прав в БД применяется не позже чем через TTL.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size должен быть больше 0")
+        if ttl <= 0:
+            raise ValueError("ttl должен быть больше 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+
+    def get(self, user_id: int, username: Optional[str], full_name: Optional[str]) -> Optional[UserDTO]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic() or entry.profile_hash != profile_hash(username, full_name):
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return entry.user
+
+    def put(self, user: UserDTO) -> None:
+        self._entries[user.user_id] = _Entry(
+            user=user,
+            profile_hash=profile_hash(user.username, user.full_name),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries.move_to_end(user.user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -15,6 +15,7 @@ from aiogram.exceptions import TelegramBadRequest
 
 from bot.middlewares.admin import connect_admin_middlewares
 from bot.routers.base import BaseRouter
+from bot.builder.instance_bot import create_bot
 from bot.ux import UXContext
 from bot.keyboards.inline import AdminInlineKeyboards
 from bot.keyboards.callback_data import (
@@ -36,10 +37,20 @@ AdminDistributionsAction,
 from common.dto import BotDTO, GroupDTO
 from .helper import edit_message
 from bot.states.admin.admin_states import AdminStates
+from bot.states.selection_store import SelectionStore
 from services import BotService, GroupService, PostService
 
 logger = getLogger(__name__)
 
+# Списки и множества id мастеров рассылок хранятся в SelectionStore, в FSM — только скаляры
+DIST_GROUPS = "dist_groups"
+DIST_SELECTED_BOTS = "dist_selected_bots"
+DIST_BINDINGS_POOL = "dist_edit_bindings_items"
+DIST_BINDINGS_SELECTED = "dist_edit_bindings_selected"
+DIST_CURRENT_GROUPS = "dist_edit_current_groups"
+DIST_DELETE_SELECTION = "dist_delete_selection"
+DIST_GROUPS_CHUNK = 500
+
 class AdminRouter(BaseRouter):
     chat_types = ChatType.PRIVATE
     def setup_middlewares(self):
@@ -313,10 +324,9 @@ class AdminRouter(BaseRouter):
                 await callback.answer("Список групп пуст", show_alert=True)
                 return
 
-            from aiogram import Bot as AioBot
             ok: list[int] = []
             fail: list[int] = []
-            test_bot = AioBot(token=bot_dto.token)
+            test_bot = create_bot(bot_dto.token)
             try:
                 me = await test_bot.get_me()
                 for gid in group_ids:
@@ -672,6 +682,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -683,8 +694,8 @@ class AdminRouter(BaseRouter):
                 dist_edit_distribution=str(dist_id),
                 dist_edit_groups_page=groups_page,
                 dist_edit_card_page=card_page,
-                dist_edit_bindings_selected=[],
             )
+            await selections.clear(state.key, DIST_BINDINGS_SELECTED)
             keyboard = AdminInlineKeyboards.build_admin_distribution_groups_add_method_keyboard(
                 distribution_id=dist_id,
                 groups_page=groups_page,
@@ -736,6 +747,7 @@ class AdminRouter(BaseRouter):
             group_service: GroupService,
             bot_service: BotService,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -744,11 +756,15 @@ class AdminRouter(BaseRouter):
                 await callback.answer("Рассылка не найдена", show_alert=True)
                 return
             desired_page = callback_data.page or 1
-            await self._prepare_bindings_pool(state, dist_id, group_service, bot_service, post_service, ux)
+            await self._prepare_bindings_pool(state, selections, dist_id, group_service, post_service)
             await self._render_bindings_selection(
                 callback,
                 ux,
                 state,
+                selections,
+                group_service,
+                bot_service,
+                post_service,
                 distribution_id=dist_id,
                 page=desired_page,
             )
@@ -759,7 +775,10 @@ class AdminRouter(BaseRouter):
             callback_data: AdminDistributionsCallback,
             state: FSMContext,
             ux: UXContext,
+            group_service: GroupService,
+            bot_service: BotService,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -771,19 +790,17 @@ class AdminRouter(BaseRouter):
             if group_uuid is None:
                 await callback.answer("Группа не найдена", show_alert=True)
                 return
+            await selections.toggle(state.key, DIST_BINDINGS_SELECTED, str(group_uuid))
             data = await state.get_data()
-            selected: set[str] = set(data.get("dist_edit_bindings_selected", []))
-            key = str(group_uuid)
-            if key in selected:
-                selected.remove(key)
-            else:
-                selected.add(key)
-            await state.update_data(dist_edit_bindings_selected=list(selected))
             page = callback_data.page or data.get("dist_edit_bindings_page", 1) or 1
             await self._render_bindings_selection(
                 callback,
                 ux,
                 state,
+                selections,
+                group_service,
+                bot_service,
+                post_service,
                 distribution_id=dist_id,
                 page=page,
             )
@@ -797,6 +814,7 @@ class AdminRouter(BaseRouter):
             group_service: GroupService,
             bot_service: BotService,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -805,21 +823,12 @@ class AdminRouter(BaseRouter):
                 await callback.answer("Рассылка не найдена", show_alert=True)
                 return
             data = await state.get_data()
-            selected_ids: list[str] = data.get("dist_edit_bindings_selected", [])
+            selected_ids = await selections.members(state.key, DIST_BINDINGS_SELECTED)
             if not selected_ids:
                 await callback.answer(ux.admin.distribution_groups_add_nothing_text(), show_alert=True)
                 return
-            groups: list[GroupDTO] = []
-            for raw_id in selected_ids:
-                try:
-                    group_uuid = UUID(raw_id)
-                except ValueError:
-                    continue
-                group = await group_service.get(group_uuid)
-                if not group:
-                    continue
-                group = await group_service.ensure_metadata(group, bot_service)
-                groups.append(group)
+            groups = await group_service.list_by_ids(self._parse_uuids(selected_ids))
+            groups = await group_service.ensure_metadata_bulk(groups, bot_service)
             if not groups:
                 await callback.answer(ux.admin.distribution_groups_add_not_found_text(), show_alert=True)
                 return
@@ -833,7 +842,7 @@ class AdminRouter(BaseRouter):
                 for group_id, linked_dist in usage_map.items()
                 if linked_dist and linked_dist != dist_id
             ]
-            existing_ids = set(data.get("dist_edit_current_groups", []))
+            existing_ids = await selections.members(state.key, DIST_CURRENT_GROUPS)
             filtered_groups = [group for group in groups if str(group.id) not in existing_ids]
             if not filtered_groups:
                 await callback.answer(ux.admin.distribution_groups_add_nothing_text(), show_alert=True)
@@ -844,10 +853,7 @@ class AdminRouter(BaseRouter):
                 cleanup_group_ids=cleanup_ids,
             )
             skipped_total = len(skipped_chat_ids)
-            await state.update_data(
-                dist_edit_bindings_selected=[],
-                dist_edit_bindings_items=[],
-            )
+            await self._reset_bindings_pool(state, selections)
             await callback.answer(ux.admin.distribution_groups_add_result_text(created=created, skipped=skipped_total), show_alert=True)
             groups_page = data.get("dist_edit_groups_page", 1) or 1
             card_page = data.get("dist_edit_card_page", 1) or 1
@@ -866,6 +872,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -876,10 +883,7 @@ class AdminRouter(BaseRouter):
             data = await state.get_data()
             groups_page = data.get("dist_edit_groups_page", callback_data.page or 1) or 1
             card_page = data.get("dist_edit_card_page", callback_data.card_page or 1) or 1
-            await state.update_data(
-                dist_edit_bindings_selected=[],
-                dist_edit_bindings_items=[],
-            )
+            await self._reset_bindings_pool(state, selections)
             await self._render_distribution_groups_list(
                 callback,
                 ux,
@@ -895,6 +899,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -909,8 +914,8 @@ class AdminRouter(BaseRouter):
                 dist_edit_distribution=str(dist_id),
                 dist_edit_groups_page=groups_page,
                 dist_edit_card_page=card_page,
-                dist_delete_selection=[],
             )
+            await selections.clear(state.key, DIST_DELETE_SELECTION)
             await self._render_distribution_delete_mode(
                 callback,
                 ux,
@@ -918,6 +923,7 @@ class AdminRouter(BaseRouter):
                 page=groups_page,
                 card_page=card_page,
                 state=state,
+                selections=selections,
             )
 
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.GROUPS_DELETE_PAGE))
@@ -927,6 +933,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -944,6 +951,7 @@ class AdminRouter(BaseRouter):
                 page=page,
                 card_page=card_page,
                 state=state,
+                selections=selections,
             )
 
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.GROUPS_DELETE_TOGGLE))
@@ -953,6 +961,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -964,14 +973,8 @@ class AdminRouter(BaseRouter):
             if group_uuid is None:
                 await callback.answer("Группа не найдена", show_alert=True)
                 return
+            await selections.toggle(state.key, DIST_DELETE_SELECTION, str(group_uuid))
             data = await state.get_data()
-            selection: set[str] = set(data.get("dist_delete_selection", []))
-            key = str(group_uuid)
-            if key in selection:
-                selection.remove(key)
-            else:
-                selection.add(key)
-            await state.update_data(dist_delete_selection=list(selection))
             page = callback_data.page or data.get("dist_edit_groups_page", 1) or 1
             card_page = data.get("dist_edit_card_page", callback_data.card_page or 1) or 1
             await self._render_distribution_delete_mode(
@@ -981,6 +984,7 @@ class AdminRouter(BaseRouter):
                 page=page,
                 card_page=card_page,
                 state=state,
+                selections=selections,
             )
 
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.GROUPS_DELETE_CANCEL))
@@ -990,6 +994,7 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
@@ -998,6 +1003,7 @@ class AdminRouter(BaseRouter):
                 await callback.answer("Рассылка не найдена", show_alert=True)
                 return
             await state.clear()
+            await selections.clear(state.key, DIST_DELETE_SELECTION)
             page = callback_data.page or 1
             card_page = callback_data.card_page or 1
             await self._render_distribution_groups_list(
@@ -1015,13 +1021,14 @@ class AdminRouter(BaseRouter):
             state: FSMContext,
             ux: UXContext,
             post_service: PostService,
+            selections: SelectionStore,
         ):
             dist_id = await self._resolve_distribution_id_from_callback(callback_data, post_service)
             if dist_id is None:
                 await callback.answer("Рассылка не найдена", show_alert=True)
                 return
             data = await state.get_data()
-            selection: list[str] = data.get("dist_delete_selection", [])
+            selection = await selections.members(state.key, DIST_DELETE_SELECTION)
             if not selection:
                 await callback.answer(ux.admin.distribution_groups_delete_none_text(), show_alert=True)
                 return
@@ -1029,15 +1036,11 @@ class AdminRouter(BaseRouter):
             card_page = callback_data.card_page or data.get("dist_edit_card_page", 1) or 1
             choice = (callback_data.choice or "").lower()
             if choice == "yes":
-                group_ids: list[UUID] = []
-                for raw_id in selection:
-                    try:
-                        group_ids.append(UUID(raw_id))
-                    except ValueError:
-                        continue
+                group_ids = self._parse_uuids(selection)
                 deleted = await post_service.delete_distribution_groups(dist_id, group_ids)
                 await callback.answer(ux.admin.distribution_groups_delete_done_text(deleted), show_alert=True)
                 await state.clear()
+                await selections.clear(state.key, DIST_DELETE_SELECTION)
                 await self._render_distribution_groups_list(
                     callback,
                     ux,
@@ -1054,6 +1057,7 @@ class AdminRouter(BaseRouter):
                     page=page,
                     card_page=card_page,
                     state=state,
+                    selections=selections,
                 )
                 return
             confirm_text = ux.admin.distribution_groups_delete_confirm_text(len(selection))
@@ -1074,16 +1078,14 @@ class AdminRouter(BaseRouter):
 
         # старт создания
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.START_CREATE))
-        async def dist_start_create(callback: CallbackQuery, state: FSMContext, ux: UXContext):
+        async def dist_start_create(callback: CallbackQuery, state: FSMContext, ux: UXContext, selections: SelectionStore):
             await state.clear()
+            await selections.clear(state.key, DIST_GROUPS, DIST_SELECTED_BOTS)
             await state.set_state(AdminStates.DISTRIBUTION_WAIT_NAME)
             await state.update_data(
                 dist_name=None,
                 dist_mode="replace",
                 dist_target=None,
-                dist_groups=[],
-                dist_selected_bots=[],
-                dist_bot_list=[],
                 dist_bot_page=1,
                 dist_summary_prefix="",
                 dist_pause_between_attempts_s=60,
@@ -1132,13 +1134,13 @@ class AdminRouter(BaseRouter):
             ux: UXContext,
             bot_service: BotService,
             group_service: GroupService,
+            selections: SelectionStore,
         ):
             if not callback_data.target:
                 return
             target = callback_data.target
-            data = await state.get_data()
-            mode = "replace"
-            await state.update_data(dist_target=target, dist_groups=[], dist_mode="replace")
+            await state.update_data(dist_target=target, dist_mode="replace")
+            await selections.clear(state.key, DIST_GROUPS)
 
             # 1) выбор групп вручную
             if target == "groups":
@@ -1148,37 +1150,23 @@ class AdminRouter(BaseRouter):
 
             # 2) выбор ботов -> из них получаем группы
             if target == "bots":
-                bots = await bot_service.list(limit=1000)
-                bot_entries = [
-                    {
-                        "id": bot.telegram_id,
-                        "uuid": str(bot.id),
-                        "label": ux.admin.format_bot_label(bot),
-                    }
-                    for bot in bots
-                ]
                 await state.set_state(AdminStates.DISTRIBUTION_SELECT_BOTS)
-                await state.update_data(
-                    dist_bot_list=bot_entries,
-                    dist_selected_bots=[],
-                    dist_bot_page=callback_data.page or 1,
+                await state.update_data(dist_bot_page=callback_data.page or 1)
+                await selections.clear(state.key, DIST_SELECTED_BOTS)
+                await self._render_distribution_bot_select(
+                    callback, ux, state, selections, bot_service, page=callback_data.page or 1
                 )
-                await self._render_distribution_bot_select(callback, ux, state, page=callback_data.page or 1)
                 return
 
             # 3) all -> собираем все привязанные группы
             if target == "all":
                 groups = await group_service.list_bound(limit=2000)
-                groups = await group_service.ensure_metadata_bulk(groups, bot_service)
                 if not groups:
                     await callback.answer(ux.admin.distribution_error_no_groups_text(), show_alert=True)
                     return
-                packed = [self._pack_group_dto(g) for g in groups]
-                summary = ux.admin.distribution_all_groups_selected_text(len(packed))
-                await state.update_data(
-                    dist_groups=packed,
-                    dist_summary_prefix=summary,
-                )
+                await selections.set_items(state.key, DIST_GROUPS, [str(g.id) for g in groups])
+                summary = ux.admin.distribution_all_groups_selected_text(len(groups))
+                await state.update_data(dist_summary_prefix=summary)
                 await state.set_state(AdminStates.DISTRIBUTION_WAIT_PAUSE)
                 await self._prompt_distribution_pause(callback, ux, summary)
                 return
@@ -1214,28 +1202,35 @@ class AdminRouter(BaseRouter):
 
         # выбор бота из списка при target == bots
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.SELECT_BOT))
-        async def dist_select_bot(callback: CallbackQuery, callback_data: AdminDistributionsCallback, state: FSMContext, ux: UXContext, group_service: GroupService):
-            data = await state.get_data()
-            bot_list: list[dict] = data.get("dist_bot_list", [])
-            if not bot_list:
+        async def dist_select_bot(
+            callback: CallbackQuery,
+            callback_data: AdminDistributionsCallback,
+            state: FSMContext,
+            ux: UXContext,
+            bot_service: BotService,
+            selections: SelectionStore,
+        ):
+            if not callback_data.bot_id:
                 await callback.answer()
                 return
-            selected: set[str] = set(data.get("dist_selected_bots", []))
-            bot_id = callback_data.bot_id or ''
-            if bot_id in selected:
-                selected.remove(bot_id)
-            else:
-                selected.add(bot_id)
-            await state.update_data(dist_selected_bots=list(selected))
+            await selections.toggle(state.key, DIST_SELECTED_BOTS, callback_data.bot_id)
+            data = await state.get_data()
             page = callback_data.page or data.get("dist_bot_page", 1) or 1
-            await self._render_distribution_bot_select(callback, ux, state, page=page)
+            await self._render_distribution_bot_select(callback, ux, state, selections, bot_service, page=page)
 
         # пагинация по ботам при выборе цели "bots"
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.BOT_PAGE))
-        async def dist_bot_page(callback: CallbackQuery, callback_data: AdminDistributionsCallback, state: FSMContext, ux: UXContext):
+        async def dist_bot_page(
+            callback: CallbackQuery,
+            callback_data: AdminDistributionsCallback,
+            state: FSMContext,
+            ux: UXContext,
+            bot_service: BotService,
+            selections: SelectionStore,
+        ):
             data = await state.get_data()
             page = callback_data.page or data.get("dist_bot_page", 1) or 1
-            await self._render_distribution_bot_select(callback, ux, state, page=page)
+            await self._render_distribution_bot_select(callback, ux, state, selections, bot_service, page=page)
 
         # завершить выбор ботов -> получить группы по этим ботам
         @self.callback_query(AdminDistributionsCallback.filter(F.action == AdminDistributionsAction.FINISH_BOT_SELECTION))
@@ -1245,50 +1240,25 @@ class AdminRouter(BaseRouter):
             ux: UXContext,
             group_service: GroupService,
             bot_service: BotService,
+            selections: SelectionStore,
         ):
-            data = await state.get_data()
-            selected_ids: list[str] = data.get("dist_selected_bots", [])
-            bot_list: list[dict] = data.get("dist_bot_list", [])
+            selected_ids = await selections.members(state.key, DIST_SELECTED_BOTS)
             if not selected_ids:
                 await callback.answer(ux.admin.distribution_bot_selection_empty_text(), show_alert=True)
                 return
-            groups_map: dict[str, dict] = {}
-            uuid_lookup = {
-                entry["id"]: entry.get("uuid") or entry.get("id")
-                for entry in bot_list
-                if entry.get("id")
-            }
-            resolved_cache: dict[str, UUID] = {}
+            group_ids: dict[str, None] = {}
             for bot_key in selected_ids:
-                if bot_key in resolved_cache:
-                    bot_uuid = resolved_cache[bot_key]
-                else:
-                    bot_uuid: UUID | None = None
-                    for candidate in (uuid_lookup.get(bot_key), bot_key):
-                        if not candidate:
-                            continue
-                        try:
-                            bot_uuid = UUID(candidate)
-                            break
-                        except ValueError:
-                            continue
-                    if bot_uuid is None:
-                        bot = await bot_service.get_by_telegram_id(bot_key)
-                        if bot:
-                            bot_uuid = bot.id
-                    if bot_uuid is None:
-                        continue
-                    resolved_cache[bot_key] = bot_uuid
-                bot_groups = await group_service.list_by_bot(bot_uuid, limit=1000)
-                bot_groups = await group_service.ensure_metadata_bulk(bot_groups, bot_service)
-                for group in bot_groups:
-                    groups_map[str(group.id)] = self._pack_group_dto(group)
-            if not groups_map:
+                bot = await bot_service.get_by_telegram_id(bot_key)
+                if bot is None:
+                    continue
+                for group in await group_service.list_by_bot(bot.id, limit=1000):
+                    group_ids[str(group.id)] = None
+            if not group_ids:
                 await callback.answer(ux.admin.distribution_bot_selection_no_groups_text(), show_alert=True)
                 return
-            packed = list(groups_map.values())
-            info = ux.admin.distribution_groups_resolved_text(len(packed))
-            await state.update_data(dist_groups=packed, dist_summary_prefix=info)
+            await selections.set_items(state.key, DIST_GROUPS, group_ids)
+            info = ux.admin.distribution_groups_resolved_text(len(group_ids))
+            await state.update_data(dist_summary_prefix=info)
             await state.set_state(AdminStates.DISTRIBUTION_WAIT_PAUSE)
             await self._prompt_distribution_pause(callback, ux, info)
 
@@ -1402,8 +1372,8 @@ class AdminRouter(BaseRouter):
             message: Message,
             state: FSMContext,
             group_service: GroupService,
-            bot_service: BotService,
             ux: UXContext,
+            selections: SelectionStore,
         ):
             text = message.text or ""
             chat_ids: list[int] = []
@@ -1424,20 +1394,20 @@ class AdminRouter(BaseRouter):
                 await message.answer(ux.admin.distribution_groups_not_found_text())
                 return
             unique_ids = list(dict.fromkeys(chat_ids))
-            groups: list[dict] = []
+            group_ids: list[str] = []
             missing: list[int] = []
             for chat_id in unique_ids:
                 group = await group_service.get_by_tg_chat_id(chat_id)
                 if not group:
                     missing.append(chat_id)
                     continue
-                group = await group_service.ensure_metadata(group, bot_service)
-                groups.append(self._pack_group_dto(group))
-            if not groups:
+                group_ids.append(str(group.id))
+            if not group_ids:
                 await message.answer(ux.admin.distribution_groups_not_found_text())
                 return
-            await state.update_data(dist_groups=groups, dist_target="groups")
-            summary = ux.admin.distribution_groups_resolved_text(len(groups))
+            await selections.set_items(state.key, DIST_GROUPS, group_ids)
+            await state.update_data(dist_target="groups")
+            summary = ux.admin.distribution_groups_resolved_text(len(group_ids))
             if missing:
                 summary += "\n" + ux.admin.distribution_groups_missing_text(missing)
             await state.update_data(dist_summary_prefix=summary)
@@ -1535,8 +1505,10 @@ class AdminRouter(BaseRouter):
         async def distribution_receive_source(
             message: Message,
             state: FSMContext,
+            group_service: GroupService,
             post_service: PostService,
             ux: UXContext,
+            selections: SelectionStore,
         ):
             parsed = self._extract_distribution_source(message)
             if parsed is None:
@@ -1544,8 +1516,8 @@ class AdminRouter(BaseRouter):
                 return
             source_username, source_channel_id, source_message_id = parsed
             data = await state.get_data()
-            groups: list[dict] = data.get("dist_groups", [])
-            if not groups:
+            group_ids = self._parse_uuids(await selections.items(state.key, DIST_GROUPS))
+            if not group_ids:
                 await message.reply(ux.admin.distribution_error_no_groups_text())
                 await state.clear()
                 return
@@ -1557,7 +1529,6 @@ class AdminRouter(BaseRouter):
             target_attempts = int(data.get("dist_target_attempts", 1))
             distribution_name = data.get("dist_name") or self._generate_distribution_name()
             notify_on_failure = bool(data.get("dist_notify_on_failure", True))
-            group_ids = [UUID(group["id"]) for group in groups]
             deleted_count = 0
             if mode == "replace" and group_ids:
                 deleted_count = await post_service.delete_active_by_groups(group_ids)
@@ -1565,20 +1536,23 @@ class AdminRouter(BaseRouter):
             created = 0
             skipped = 0
             errors: list[str] = []
+            groups: list[GroupDTO] = []
+            for offset in range(0, len(group_ids), DIST_GROUPS_CHUNK):
+                groups.extend(await group_service.list_by_ids(group_ids[offset:offset + DIST_GROUPS_CHUNK]))
+            skipped += len(group_ids) - len(groups)
             for group in groups:
-                assigned_bot_id = group.get("assigned_bot_id")
-                if not assigned_bot_id:
+                if not group.assigned_bot_id:
                     skipped += 1
                     continue
                 try:
                     await post_service.create(
-                        group_id=UUID(group["id"]),
-                        target_chat_id=group["tg_chat_id"],
+                        group_id=group.id,
+                        target_chat_id=group.tg_chat_id,
                         distribution_name=distribution_name,
                         source_channel_username=source_username,
                         source_channel_id=source_channel_id,
                         source_message_id=source_message_id,
-                        bot_id=UUID(assigned_bot_id),
+                        bot_id=group.assigned_bot_id,
                         pause_between_attempts_s=pause_between_attempts_s,
                         delete_last_attempt=delete_last_attempt,
                         pin_after_post=pin_after_post,
@@ -1589,9 +1563,10 @@ class AdminRouter(BaseRouter):
                     created += 1
                 except Exception as exc:  # оставляю, чтобы не ломать твой UX
                     skipped += 1
-                    errors.append(f"{group['tg_chat_id']}: {exc}")
+                    errors.append(f"{group.tg_chat_id}: {exc}")
 
             await state.clear()
+            await selections.clear(state.key, DIST_GROUPS, DIST_SELECTED_BOTS)
             result_text = ux.admin.distribution_result_text(
                 mode=mode,
                 deleted_count=deleted_count,
@@ -1704,14 +1679,13 @@ class AdminRouter(BaseRouter):
     async def _prepare_bindings_pool(
         self,
         state: FSMContext,
+        selections: SelectionStore,
         distribution_id: UUID,
         group_service: GroupService,
-        bot_service: BotService,
         post_service: PostService,
-        ux: UXContext,
     ) -> None:
         data = await state.get_data()
-        if data.get("dist_edit_bindings_items"):
+        if data.get("dist_edit_bindings_for") == str(distribution_id) and await selections.size(state.key, DIST_BINDINGS_POOL):
             return
         summary = await post_service.get_distribution_summary(distribution_id)
         if summary is None:
@@ -1721,50 +1695,42 @@ class AdminRouter(BaseRouter):
         )
         existing_ids = {str(post.group_id) for post in posts if post.group_id}
         groups = await group_service.list_bound(limit=2000)
-        groups = await group_service.ensure_metadata_bulk(groups, bot_service)
         usage_map = await post_service.groups_distribution_usage([group.id for group in groups])
-        items: list[dict[str, object]] = []
+        pool: list[str] = []
         for group in groups:
             if not group.assigned_bot_id:
                 continue
             group_id_str = str(group.id)
-            if group_id_str in existing_ids:
+            if group_id_str in existing_ids or usage_map.get(group.id) == distribution_id:
                 continue
-            status = "free"
-            linked = usage_map.get(group.id)
-            if linked and linked != distribution_id:
-                status = "busy"
-            elif linked == distribution_id:
-                continue
-            title = group.title or (group.username and f"@{group.username}") or str(group.tg_chat_id)
-            items.append(
-                {
-                    "uuid": group_id_str,
-                    "title": title,
-                    "chat_id": group.tg_chat_id,
-                    "status": status,
-                }
-            )
-        await state.update_data(
-            dist_edit_bindings_items=items,
-            dist_edit_current_groups=list(existing_ids),
-            dist_edit_bindings_selected=data.get("dist_edit_bindings_selected", []),
-        )
+            pool.append(group_id_str)
+        # Названия и статусы групп подтягиваются постранично в _render_bindings_selection
+        await selections.set_items(state.key, DIST_BINDINGS_POOL, pool)
+        await selections.set_members(state.key, DIST_CURRENT_GROUPS, existing_ids)
+        await state.update_data(dist_edit_bindings_for=str(distribution_id))
+
+    async def _reset_bindings_pool(self, state: FSMContext, selections: SelectionStore) -> None:
+        await selections.clear(state.key, DIST_BINDINGS_POOL, DIST_BINDINGS_SELECTED, DIST_CURRENT_GROUPS)
+        await state.update_data(dist_edit_bindings_for=None)
 
     async def _render_bindings_selection(
         self,
         event: CallbackQuery,
         ux: UXContext,
         state: FSMContext,
+        selections: SelectionStore,
+        group_service: GroupService,
+        bot_service: BotService,
+        post_service: PostService,
         *,
         distribution_id: UUID,
         page: int,
     ) -> None:
         data = await state.get_data()
-        items: list[dict] = data.get("dist_edit_bindings_items", [])
+        total = await selections.size(state.key, DIST_BINDINGS_POOL)
         groups_page = data.get("dist_edit_groups_page", 1) or 1
         card_page = data.get("dist_edit_card_page", 1) or 1
-        if not items:
+        if not total:
             keyboard = AdminInlineKeyboards.build_admin_distribution_groups_add_method_keyboard(
                 distribution_id=distribution_id,
                 groups_page=groups_page,
@@ -1773,18 +1739,21 @@ class AdminRouter(BaseRouter):
             await edit_message(event, ux.admin.distribution_groups_add_not_found_text(), reply_markup=keyboard)
             return
         page_size = 6
-        total_pages = max(1, math.ceil(len(items) / page_size))
+        total_pages = max(1, math.ceil(total / page_size))
         page = max(1, min(page, total_pages))
         start = (page - 1) * page_size
-        subset = items[start:start + page_size]
-        selected = set(data.get("dist_edit_bindings_selected", []))
+        page_ids = self._parse_uuids(await selections.items(state.key, DIST_BINDINGS_POOL, start, start + page_size))
+        groups = await group_service.list_by_ids(page_ids)
+        groups = await group_service.ensure_metadata_bulk(groups, bot_service)
+        usage_map = await post_service.groups_distribution_usage(page_ids)
+        selected = await selections.members(state.key, DIST_BINDINGS_SELECTED)
         rows: list[tuple[str, str, bool]] = []
-        for item in subset:
-            status_icon = "🟢" if item.get("status") == "free" else "🟠"
-            title = item.get("title") or "—"
-            chat_id = item.get("chat_id")
-            group_uuid = str(item.get("uuid"))
-            label = f"{status_icon} {title} • {chat_id}"
+        for group in groups:
+            linked = usage_map.get(group.id)
+            status_icon = "🟠" if linked and linked != distribution_id else "🟢"
+            title = group.title or (group.username and f"@{group.username}") or str(group.tg_chat_id)
+            group_uuid = str(group.id)
+            label = f"{status_icon} {title} • {group.tg_chat_id}"
             rows.append((group_uuid, label, group_uuid in selected))
         keyboard = AdminInlineKeyboards.build_admin_distribution_groups_bindings_keyboard(
             rows,
@@ -1810,10 +1779,10 @@ class AdminRouter(BaseRouter):
         page: int,
         card_page: int,
         state: FSMContext,
+        selections: SelectionStore,
     ) -> None:
         view = await ux.admin.show_distribution_groups(distribution_id, page=page)
-        data = await state.get_data()
-        selection = set(data.get("dist_delete_selection", []))
+        selection = await selections.members(state.key, DIST_DELETE_SELECTION)
         text_lines = [
             ux.admin.distribution_groups_delete_intro_text(),
             ux.admin.distribution_groups_delete_hint_text(len(selection)),
@@ -1859,11 +1828,18 @@ class AdminRouter(BaseRouter):
         keyboard = AdminInlineKeyboards.build_admin_distribution_groups_input_keyboard()
         await edit_message(event, text, reply_markup=keyboard)
 
-    async def _render_distribution_bot_select(self, event: CallbackQuery | Message, ux: UXContext, state: FSMContext, *, page: int) -> None:
-        data = await state.get_data()
-        bot_entries: list[dict] = data.get('dist_bot_list', [])
-        selected_ids = set(data.get('dist_selected_bots', []))
-        if not bot_entries:
+    async def _render_distribution_bot_select(
+        self,
+        event: CallbackQuery | Message,
+        ux: UXContext,
+        state: FSMContext,
+        selections: SelectionStore,
+        bot_service: BotService,
+        *,
+        page: int,
+    ) -> None:
+        total = await bot_service.count()
+        if not total:
             await edit_message(
                 event,
                 ux.admin.distribution_bot_selection_no_groups_text(),
@@ -1872,11 +1848,14 @@ class AdminRouter(BaseRouter):
             return
 
         page_size = 6
-        total_pages = max(1, math.ceil(len(bot_entries) / page_size))
+        total_pages = max(1, math.ceil(total / page_size))
         page = max(1, min(page, total_pages))
-        start = (page - 1) * page_size
-        subset = bot_entries[start:start + page_size]
-        items = [(entry['id'], entry['label'], entry['id'] in selected_ids) for entry in subset]
+        bots = await bot_service.list(limit=page_size, offset=(page - 1) * page_size)
+        selected_ids = await selections.members(state.key, DIST_SELECTED_BOTS)
+        items = [
+            (bot.telegram_id, ux.admin.format_bot_label(bot), bot.telegram_id in selected_ids)
+            for bot in bots
+        ]
         keyboard = AdminInlineKeyboards.build_admin_distribution_bot_select_keyboard(items, page=page, total_pages=total_pages)
 
         text_lines = [ux.admin.distribution_bot_selection_intro()]
@@ -1946,15 +1925,15 @@ class AdminRouter(BaseRouter):
             return await post_service.resolve_distribution_id_by_post(post_id)
         return None
 
-    def _pack_group_dto(self, group) -> dict[str, object]:
-        assigned_bot_id = str(group.assigned_bot_id) if group.assigned_bot_id else None
-        return {
-            "id": str(group.id),
-            "tg_chat_id": group.tg_chat_id,
-            "assigned_bot_id": assigned_bot_id,
-            "title": group.title or "",
-            "username": getattr(group, "username", None) or "",
-        }
+    @staticmethod
+    def _parse_uuids(raw_ids) -> list[UUID]:
+        result: list[UUID] = []
+        for raw_id in raw_ids:
+            try:
+                result.append(UUID(raw_id))
+            except ValueError:
+                continue
+        return result
 
     def _extract_distribution_source(self, message: Message) -> tuple[str, int, int] | None:
         if message.forward_from_chat and message.forward_from_message_id:
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional
+
+from aiogram.fsm.storage.base import StorageKey
+from redis.asyncio import Redis
+
+
+class SelectionStore(ABC):
+    """
+    Серверное хранилище крупных данных мастеров (выбранные id, пулы групп).
+
+    FSM-данные пересохраняются целиком при каждом update_data, поэтому в FSM
+    держим только скаляры, а множества и списки id живут здесь: переключение
+    галочки — одна операция над множеством, страница списка — срез.
+    Ключи привязаны к StorageKey пользователя (bot_id, chat_id, user_id).
+    """
+
+    @abstractmethod
+    async def toggle(self, key: StorageKey, name: str, member: str) -> bool:
+        """Переключить member в множестве name; True — если элемент теперь выбран."""
+
+    @abstractmethod
+    async def members(self, key: StorageKey, name: str) -> set[str]: ...
+
+    @abstractmethod
+    async def count(self, key: StorageKey, name: str) -> int: ...
+
+    @abstractmethod
+    async def set_members(self, key: StorageKey, name: str, members: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    async def set_items(self, key: StorageKey, name: str, items: Iterable[str]) -> None:
+        """Сохранить упорядоченный список id (заменяет прежний)."""
+
+    @abstractmethod
+    async def items(self, key: StorageKey, name: str, start: int = 0, stop: Optional[int] = None) -> list[str]:
+        """Срез упорядоченного списка [start:stop]."""
+
+    @abstractmethod
+    async def size(self, key: StorageKey, name: str) -> int: ...
+
+    @abstractmethod
+    async def clear(self, key: StorageKey, *names: str) -> None: ...
+
+
+class MemorySelectionStore(SelectionStore):
+    """
+    Хранилище в памяти процесса (без Redis).
+
+    Как и в RedisSelectionStore, запись живёт ttl_s с последнего изменения:
+    выборки брошенных мастеров иначе копились бы до перезапуска. Истёкшие
+    записи удаляются при обращении и проходом по всем ключам не чаще раза
+    в sweep_s.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = 24 * 3600,
+        sweep_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sets: dict[tuple[StorageKey, str], set[str]] = {}
+        self._lists: dict[tuple[StorageKey, str], list[str]] = {}
+        self._expires: dict[tuple[StorageKey, str], float] = {}
+        self._ttl_s = ttl_s
+        self._sweep_s = sweep_s
+        self._clock = clock
+        self._last_sweep = clock()
+
+    async def toggle(self, key: StorageKey, name: str, member: str) -> bool:
+        selected = self._sets.setdefault(self._live(key, name), set())
+        if member in selected:
+            selected.discard(member)
+            return False
+        selected.add(member)
+        self._touch(key, name)
+        return True
+
+    async def members(self, key: StorageKey, name: str) -> set[str]:
+        return set(self._sets.get(self._live(key, name), ()))
+
+    async def count(self, key: StorageKey, name: str) -> int:
+        return len(self._sets.get(self._live(key, name), ()))
+
+    async def set_members(self, key: StorageKey, name: str, members: Iterable[str]) -> None:
+        self._sets[self._live(key, name)] = set(members)
+        self._touch(key, name)
+
+    async def set_items(self, key: StorageKey, name: str, items: Iterable[str]) -> None:
+        self._lists[self._live(key, name)] = list(items)
+        self._touch(key, name)
+
+    async def items(self, key: StorageKey, name: str, start: int = 0, stop: Optional[int] = None) -> list[str]:
+        return self._lists.get(self._live(key, name), [])[start:stop]
+
+    async def size(self, key: StorageKey, name: str) -> int:
+        return len(self._lists.get(self._live(key, name), ()))
+
+    async def clear(self, key: StorageKey, *names: str) -> None:
+        for name in names:
+            self._drop((key, name))
+
+    def _live(self, key: StorageKey, name: str) -> tuple[StorageKey, str]:
+        now = self._clock()
+        if now - self._last_sweep >= self._sweep_s:
+            self._last_sweep = now
+            for expired in [k for k, deadline in self._expires.items() if deadline <= now]:
+                self._drop(expired)
+        store_key = (key, name)
+        deadline = self._expires.get(store_key)
+        if deadline is not None and deadline <= now:
+            self._drop(store_key)
+        return store_key
+
+    def _touch(self, key: StorageKey, name: str) -> None:
+        self._expires[(key, name)] = self._clock() + self._ttl_s
+
+    def _drop(self, store_key: tuple[StorageKey, str]) -> None:
+        self._sets.pop(store_key, None)
+        self._lists.pop(store_key, None)
+        self._expires.pop(store_key, None)
+
+
+class RedisSelectionStore(SelectionStore):
+    def __init__(self, redis: Redis, *, prefix: str = "autoposter:wizard", ttl_s: int = 24 * 3600) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl_s = ttl_s
+
+    def _key(self, key: StorageKey, name: str) -> str:
+        return f"{self._prefix}:{key.bot_id}:{key.chat_id}:{key.user_id}:{name}"
+
+    async def toggle(self, key: StorageKey, name: str, member: str) -> bool:
+        redis_key = self._key(key, name)
+        if await self._redis.srem(redis_key, member):
+            return False
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(redis_key, member)
+            pipe.expire(redis_key, self._ttl_s)
+            await pipe.execute()
+        return True
+
+    async def members(self, key: StorageKey, name: str) -> set[str]:
+        raw = await self._redis.smembers(self._key(key, name))
+        return {m.decode() if isinstance(m, bytes) else m for m in raw}
+
+    async def count(self, key: StorageKey, name: str) -> int:
+        return int(await self._redis.scard(self._key(key, name)))
+
+    async def set_members(self, key: StorageKey, name: str, members: Iterable[str]) -> None:
+        await self._replace(self._key(key, name), "sadd", list(members))
+
+    async def set_items(self, key: StorageKey, name: str, items: Iterable[str]) -> None:
+        await self._replace(self._key(key, name), "rpush", list(items))
+
+    async def items(self, key: StorageKey, name: str, start: int = 0, stop: Optional[int] = None) -> list[str]:
+        end = -1 if stop is None else stop - 1
+        if stop is not None and end < start:
+            return []
+        raw = await self._redis.lrange(self._key(key, name), start, end)
+        return [m.decode() if isinstance(m, bytes) else m for m in raw]
+
+    async def size(self, key: StorageKey, name: str) -> int:
+        return int(await self._redis.llen(self._key(key, name)))
+
+    async def clear(self, key: StorageKey, *names: str) -> None:
+        if names:
+            await self._redis.delete(*(self._key(key, name) for name in names))
+
+    async def _replace(self, redis_key: str, command: str, values: list[str]) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(redis_key)
+            if values:
+                getattr(pipe, command)(redis_key, *values)
+                pipe.expire(redis_key, self._ttl_s)
+            await pipe.execute()
+
+
+_store: SelectionStore = MemorySelectionStore()
+
+
+def configure_selection_store(store: SelectionStore) -> None:
+    global _store
+    _store = store
+
+
+def get_selection_store() -> SelectionStore:
+    return _store
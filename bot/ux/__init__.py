@@ -1,6 +1,12 @@
 from .context import UXContext, AdminUX
+from .texts import AdminTexts, RU_ADMIN_TEXTS
+from .use_cases import AdminUseCases, AdminReadServices
 
 __all__ = [
     "UXContext",
     "AdminUX",
+    "AdminTexts",
+    "AdminUseCases",
+    "AdminReadServices",
+    "RU_ADMIN_TEXTS",
 ]
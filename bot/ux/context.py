@@ -7,101 +7,57 @@ from uuid import UUID
 
 from common.dto import BotDTO, GroupAssignResultDTO
 from common.enums import AdminMenuAction, AdminBotFreeMode
-from common.usecases import (
-    ShowMainMenuUseCase,
-    ShowBotsListUseCase,
-    ShowBotCardUseCase,
-    ShowGroupsListUseCase,
-    ShowGroupCardUseCase,
-    PrepareFreeBotUseCase,
-    FreeBotUseCase,
-    PrepareDeleteBotUseCase,
-    DeleteBotUseCase,
-    ShowPlaceholderUseCase,
-    ShowDistributionsListUseCase,
-    ShowDistributionCardUseCase,
-    ShowDistributionGroupsUseCase,
-    ShowDistributionGroupCardUseCase,
-)
 from services import BotService
 
+from .texts import AdminTexts
+from .use_cases import AdminUseCases
+
 
 class AdminUX:
     def __init__(
         self,
         *,
         bot_service: BotService,
-        main_menu_uc: ShowMainMenuUseCase,
-        bots_list_uc: ShowBotsListUseCase,
-        bot_card_uc: ShowBotCardUseCase,
-        groups_list_uc: ShowGroupsListUseCase,
-        group_card_uc: ShowGroupCardUseCase,
-        distributions_list_uc: ShowDistributionsListUseCase,
-        distribution_card_uc: ShowDistributionCardUseCase,
-        distribution_groups_uc: ShowDistributionGroupsUseCase,
-        distribution_group_card_uc: ShowDistributionGroupCardUseCase,
-
-        free_prompt_uc: PrepareFreeBotUseCase,
-        free_uc: FreeBotUseCase,
-        delete_prompt_uc: PrepareDeleteBotUseCase,
-        delete_uc: DeleteBotUseCase,
-        placeholder_uc: ShowPlaceholderUseCase,
-        admin_texts: dict[str, str] | None = None,
-        menu_texts: dict[str, str] | None = None,
-        bots_texts: dict[str, str] | None = None,
-        groups_texts: dict[str, str] | None = None,
-        distributions_texts: dict[str, str] | None = None,
+        use_cases: AdminUseCases,
+        texts: AdminTexts,
     ) -> None:
-        self._main_menu_uc = main_menu_uc
-        self._bots_list_uc = bots_list_uc
-        self._bot_card_uc = bot_card_uc
-        self._groups_list_uc = groups_list_uc
-        self._group_card_uc = group_card_uc
-        self._distributions_list_uc = distributions_list_uc
-        self._distribution_card_uc = distribution_card_uc
-        self._distribution_groups_uc = distribution_groups_uc
-        self._distribution_group_card_uc = distribution_group_card_uc
-        self._free_prompt_uc = free_prompt_uc
-        self._free_uc = free_uc
-        self._delete_prompt_uc = delete_prompt_uc
-        self._delete_uc = delete_uc
-        self._placeholder_uc = placeholder_uc
+        self._use_cases = use_cases
         self._bot_service = bot_service
-        self._admin_texts = admin_texts or {}
-        self._menu_texts = menu_texts or {}
-        self._bots_texts = bots_texts or {}
-        self._groups_texts = groups_texts or {}
-        self._distributions_texts = distributions_texts or {}
+        self._admin_texts = texts.admin
+        self._menu_texts = texts.menu
+        self._bots_texts = texts.bots
+        self._groups_texts = texts.groups
+        self._distributions_texts = texts.distributions
 
     async def show_main_menu(self):
-        return await self._main_menu_uc()
+        return await self._use_cases.main_menu()
 
     async def show_bots_list(self, page: int = 1):
-        return await self._bots_list_uc(page)
+        return await self._use_cases.bots_list(page)
 
     async def show_bot_card(self, bot_id: UUID):
-        return await self._bot_card_uc(bot_id)
+        return await self._use_cases.bot_card(bot_id)
 
     async def show_groups_list(self, page: int = 1):
-        return await self._groups_list_uc(page)
+        return await self._use_cases.groups_list(page)
 
     async def show_group_card(self, group_id: UUID):
-        return await self._group_card_uc(group_id)
+        return await self._use_cases.group_card(group_id)
 
     async def prepare_free_bot(self, bot_id: UUID):
-        return await self._free_prompt_uc(bot_id)
+        return await self._use_cases.free_prompt(bot_id)
 
     async def free_bot(self, bot_id: UUID, mode: AdminBotFreeMode):
-        return await self._free_uc(bot_id, mode)
+        return await self._use_cases.free(bot_id, mode)
 
     async def prepare_delete_bot(self, bot_id: UUID):
-        return await self._delete_prompt_uc(bot_id)
+        return await self._use_cases.delete_prompt(bot_id)
 
     async def delete_bot(self, bot_id: UUID):
-        return await self._delete_uc(bot_id)
+        return await self._use_cases.delete(bot_id)
 
     async def placeholder(self, action: AdminMenuAction) -> str:
-        return await self._placeholder_uc(action)
+        return await self._use_cases.placeholder(action)
 
     async def resolve_bot_uuid(self, telegram_id: str) -> UUID | None:
         bot = await self._bot_service.get_by_telegram_id(telegram_id)
@@ -110,16 +66,16 @@ class AdminUX:
         return bot.id
 
     async def show_distributions_list(self, page: int = 1):
-        return await self._distributions_list_uc(page)
+        return await self._use_cases.distributions_list(page)
 
     async def show_distribution_card(self, distribution_id: UUID):
-        return await self._distribution_card_uc(distribution_id)
+        return await self._use_cases.distribution_card(distribution_id)
 
     async def show_distribution_groups(self, distribution_id: UUID, *, page: int = 1):
-        return await self._distribution_groups_uc(distribution_id, page)
+        return await self._use_cases.distribution_groups(distribution_id, page)
 
     async def show_distribution_group_card(self, distribution_id: UUID, post_id: UUID):
-        return await self._distribution_group_card_uc(distribution_id, post_id)
+        return await self._use_cases.distribution_group_card(distribution_id, post_id)
 
     async def get_start_text(self) -> str:
         return self._admin_texts.get("start", "")
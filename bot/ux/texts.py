@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from bot.locales import (
+    RU_TEXT,
+    RU_BUTTONS,
+    RU_STATUS,
+    RU_PAGINATION,
+    RU_CONFIRMATION,
+    RU_RESULTS,
+)
+from common.enums import AdminMenuAction
+
+
+@dataclass(frozen=True, slots=True)
+class AdminTexts:
+    """Locale bundle for the admin UX, resolved once at startup."""
+
+    admin: Mapping[str, str]
+    menu: Mapping[str, str]
+    bots: Mapping[str, str]
+    groups: Mapping[str, str]
+    posts: Mapping[str, Any]
+    distributions: Mapping[str, str]
+    status: Mapping[str, str]
+    pagination: Mapping[str, str]
+    confirmation: Mapping[str, str]
+    results: Mapping[str, str]
+    menu_buttons: Mapping[AdminMenuAction, str]
+    bot_metrics: Mapping[str, str]
+    placeholders: Mapping[AdminMenuAction | str, str]
+    status_short: Mapping[str, str]
+    status_labels: Mapping[str, str]
+
+    @classmethod
+    def from_locale(
+        cls,
+        *,
+        text: Mapping[str, Any],
+        buttons: Mapping[str, Mapping[str, str]],
+        status: Mapping[str, str],
+        pagination: Mapping[str, str],
+        confirmation: Mapping[str, str],
+        results: Mapping[str, str],
+    ) -> "AdminTexts":
+        menu_buttons = buttons["menu"]
+        bots = text["bots"]
+        posts = text["posts"]
+        placeholder_base = text["menu"].get("placeholder", "Раздел в разработке")
+        return cls(
+            admin=text["admin"],
+            menu=text["menu"],
+            bots=bots,
+            groups=text["groups"],
+            posts=posts,
+            distributions=text["distributions"],
+            status=status,
+            pagination=pagination,
+            confirmation=confirmation,
+            results=results,
+            menu_buttons={
+                AdminMenuAction.DISTRIBUTIONS: menu_buttons["distributions"],
+                AdminMenuAction.BOTS: menu_buttons["bots"],
+                AdminMenuAction.GROUPS: menu_buttons["groups"],
+                AdminMenuAction.STATS: menu_buttons["stats"],
+                AdminMenuAction.SETTINGS: menu_buttons["settings"],
+            },
+            bot_metrics={
+                "last_send": bots["card_metrics_last"],
+                "success_min": bots["card_metrics_success_min"],
+                "success_total": bots["card_metrics_success_total"],
+                "fail_min": bots["card_metrics_fail_min"],
+                "fail_total": bots["card_metrics_fail_total"],
+            },
+            placeholders={
+                AdminMenuAction.STATS: f"{menu_buttons['stats']} — {placeholder_base}",
+                AdminMenuAction.SETTINGS: f"{menu_buttons['settings']} — {placeholder_base}",
+                "placeholder": placeholder_base,
+            },
+            status_short=posts.get("status_short", {}),
+            status_labels=posts.get("status_labels", {}),
+        )
+
+
+RU_ADMIN_TEXTS = AdminTexts.from_locale(
+    text=RU_TEXT,
+    buttons=RU_BUTTONS,
+    status=RU_STATUS,
+    pagination=RU_PAGINATION,
+    confirmation=RU_CONFIRMATION,
+    results=RU_RESULTS,
+)
+
+
+__all__ = ["AdminTexts", "RU_ADMIN_TEXTS"]
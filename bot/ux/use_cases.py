@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Optional
+
+from common.usecases import (
+    ShowMainMenuUseCase,
+    ShowBotsListUseCase,
+    ShowBotCardUseCase,
+    ShowGroupsListUseCase,
+    ShowGroupCardUseCase,
+    PrepareFreeBotUseCase,
+    FreeBotUseCase,
+    PrepareDeleteBotUseCase,
+    DeleteBotUseCase,
+    ShowPlaceholderUseCase,
+    ShowDistributionsListUseCase,
+    ShowDistributionCardUseCase,
+    ShowDistributionGroupsUseCase,
+    ShowDistributionGroupCardUseCase,
+    ShowPostCardUseCase,
+    ShowPostsListUseCase,
+)
+from services import BotService, GroupService, PostService, PostAttemptService, SettingsService
+
+from .texts import AdminTexts
+
+
+@dataclass(frozen=True, slots=True)
+class AdminReadServices:
+    """Services bound to a read-only unit of work, used by the Show* screens."""
+
+    bot_service: BotService
+    post_service: PostService
+    post_attempt_service: PostAttemptService
+    settings_service: SettingsService
+
+
+class AdminUseCases:
+    """Per-update registry of admin use cases.
+
+    Each use case is built on first access, so an update that only renders
+    the main menu never pays for constructing the other screens.
+
+    Show* screens read through the services ``readers`` returns when the
+    screen is first built: the replica while the update has written nothing,
+    the primary services otherwise. group_service always stays on the primary
+    because rendering refreshes group metadata. Free/delete flows use the
+    primary services.
+    """
+
+    def __init__(
+        self,
+        *,
+        bot_service: BotService,
+        group_service: GroupService,
+        post_service: PostService,
+        post_attempt_service: PostAttemptService,
+        settings_service: SettingsService,
+        texts: AdminTexts,
+        readers: Optional[Callable[[], AdminReadServices]] = None,
+    ) -> None:
+        self._bot_service = bot_service
+        self._group_service = group_service
+        self._post_service = post_service
+        self._post_attempt_service = post_attempt_service
+        self._settings_service = settings_service
+        self._texts = texts
+        self._select_readers = readers
+
+    @property
+    def _readers(self) -> AdminReadServices:
+        if self._select_readers is not None:
+            return self._select_readers()
+        return AdminReadServices(
+            bot_service=self._bot_service,
+            post_service=self._post_service,
+            post_attempt_service=self._post_attempt_service,
+            settings_service=self._settings_service,
+        )
+
+    @cached_property
+    def main_menu(self) -> ShowMainMenuUseCase:
+        return ShowMainMenuUseCase(
+            prompt_text=self._texts.menu["main_prompt"],
+            buttons=self._texts.menu_buttons,
+        )
+
+    @cached_property
+    def bots_list(self) -> ShowBotsListUseCase:
+        return ShowBotsListUseCase(
+            bot_service=self._readers.bot_service,
+            post_service=self._readers.post_service,
+            settings_service=self._readers.settings_service,
+            texts=self._texts.bots,
+            status_texts=self._texts.status,
+            pagination_texts=self._texts.pagination,
+        )
+
+    @cached_property
+    def bot_card(self) -> ShowBotCardUseCase:
+        return ShowBotCardUseCase(
+            bot_service=self._readers.bot_service,
+            post_service=self._readers.post_service,
+            post_attempt_service=self._readers.post_attempt_service,
+            settings_service=self._readers.settings_service,
+            texts=self._texts.bots,
+            metrics_texts=self._texts.bot_metrics,
+            status_texts=self._texts.status,
+        )
+
+    @cached_property
+    def groups_list(self) -> ShowGroupsListUseCase:
+        return ShowGroupsListUseCase(
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            settings_service=self._readers.settings_service,
+            texts=self._texts.groups,
+            pagination_texts=self._texts.pagination,
+        )
+
+    @cached_property
+    def group_card(self) -> ShowGroupCardUseCase:
+        return ShowGroupCardUseCase(
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            texts=self._texts.groups,
+        )
+
+    @cached_property
+    def posts_list(self) -> ShowPostsListUseCase:
+        return ShowPostsListUseCase(
+            post_service=self._readers.post_service,
+            settings_service=self._readers.settings_service,
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            texts=self._texts.posts,
+            pagination_texts=self._texts.pagination,
+        )
+
+    @cached_property
+    def post_card(self) -> ShowPostCardUseCase:
+        return ShowPostCardUseCase(
+            post_service=self._readers.post_service,
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            texts=self._texts.posts,
+        )
+
+    @cached_property
+    def distributions_list(self) -> ShowDistributionsListUseCase:
+        return ShowDistributionsListUseCase(
+            post_service=self._readers.post_service,
+            settings_service=self._readers.settings_service,
+            texts=self._texts.distributions,
+            pagination_texts=self._texts.pagination,
+            status_short_texts=self._texts.status_short,
+        )
+
+    @cached_property
+    def distribution_card(self) -> ShowDistributionCardUseCase:
+        return ShowDistributionCardUseCase(
+            post_service=self._readers.post_service,
+            texts=self._texts.distributions,
+            status_labels=self._texts.status_labels,
+            status_short=self._texts.status_short,
+        )
+
+    @cached_property
+    def distribution_groups(self) -> ShowDistributionGroupsUseCase:
+        return ShowDistributionGroupsUseCase(
+            post_service=self._readers.post_service,
+            settings_service=self._readers.settings_service,
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            texts=self._texts.distributions,
+            pagination_texts=self._texts.pagination,
+            status_short_texts=self._texts.status_short,
+        )
+
+    @cached_property
+    def distribution_group_card(self) -> ShowDistributionGroupCardUseCase:
+        return ShowDistributionGroupCardUseCase(
+            post_service=self._readers.post_service,
+            group_service=self._group_service,
+            bot_service=self._readers.bot_service,
+            texts=self._texts.distributions,
+            status_labels=self._texts.status_labels,
+        )
+
+    @cached_property
+    def free_prompt(self) -> PrepareFreeBotUseCase:
+        return PrepareFreeBotUseCase(
+            bot_service=self._bot_service,
+            texts=self._texts.bots,
+            confirmation_texts=self._texts.confirmation,
+        )
+
+    @cached_property
+    def free(self) -> FreeBotUseCase:
+        return FreeBotUseCase(
+            bot_service=self._bot_service,
+            post_service=self._post_service,
+            result_texts=self._texts.results,
+        )
+
+    @cached_property
+    def delete_prompt(self) -> PrepareDeleteBotUseCase:
+        return PrepareDeleteBotUseCase(
+            bot_service=self._bot_service,
+            texts=self._texts.bots,
+            confirmation_texts=self._texts.confirmation,
+        )
+
+    @cached_property
+    def delete(self) -> DeleteBotUseCase:
+        return DeleteBotUseCase(
+            bot_service=self._bot_service,
+            post_service=self._post_service,
+            result_texts=self._texts.results,
+        )
+
+    @cached_property
+    def placeholder(self) -> ShowPlaceholderUseCase:
+        return ShowPlaceholderUseCase(texts=self._texts.placeholders)
+
+
+__all__ = ["AdminUseCases", "AdminReadServices"]
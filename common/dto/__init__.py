@@ -1,8 +1,10 @@
-from .bot import BotDTO
+from .bot import BotDTO, BotHeartbeatDTO
 from .user import UserDTO
 from .group import GroupDTO, GroupAssignResultDTO, GroupReassignmentDTO
 from .post import PostDTO
 from .post_attempt import PostAttemptDTO
+from .posting_job import PostingJob
+from .git_remote_head import GitRemoteHeadDTO
 from .settings import SettingDTO
 from .bot_initialization import BotInitializationResult
 from .admin.menu import MenuItemDTO, MenuViewDTO
@@ -29,12 +31,15 @@ from .admin.distributions import (
 
 __all__ = [
     "BotDTO",
+    "BotHeartbeatDTO",
     "UserDTO",
     "GroupDTO",
     "GroupAssignResultDTO",
     "GroupReassignmentDTO",
     "PostDTO",
     "PostAttemptDTO",
+    "PostingJob",
+    "GitRemoteHeadDTO",
     "SettingDTO",
     "BotInitializationResult",
     "MenuItemDTO",
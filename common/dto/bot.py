@@ -2,12 +2,37 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from itertools import starmap
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
 from infra.db.models import Bot
 
 
+# Колонки для select() в порядке полей BotDTO — строка маппится позиционно
+BOT_DTO_COLUMNS = (
+    Bot.id,
+    Bot.bot_id,
+    Bot.username,
+    Bot.name,
+    Bot.token,
+    Bot.server_ip,
+    Bot.last_heartbeat_at,
+    Bot.self_destruction,
+    Bot.deactivated,
+    Bot.settings_id,
+    Bot.max_posts,
+    Bot.tracked_branch,
+    Bot.current_commit_hash,
+    Bot.latest_available_commit_hash,
+    Bot.commits_behind,
+    Bot.last_update_check_at,
+    Bot.force_update,
+    Bot.created_at,
+    Bot.updated_at,
+)
+
+
 @dataclass(slots=True)
 class BotDTO:
     id: UUID
@@ -54,9 +79,27 @@ class BotDTO:
             updated_at=model.updated_at,
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence) -> "BotDTO":
+        """Строка select(*BOT_DTO_COLUMNS)."""
+        return cls(*row)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> list["BotDTO"]:
+        return list(starmap(cls, rows))
+
     @property
     def telegram_id(self) -> str:
         prefix, _, _ = self.token.partition(":")
         if not prefix:
             raise ValueError("Bot token does not contain Telegram bot ID part")
         return prefix
+
+
+@dataclass(slots=True)
+class BotHeartbeatDTO:
+    """Результат heartbeat: то, что воркеру нужно после отметки."""
+
+    id: UUID
+    force_update: bool
+    heartbeat_interval_s: Optional[int]  # из текущих settings; None — настроек нет
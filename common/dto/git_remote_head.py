@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from infra.db.models import GitRemoteHead
+
+
+@dataclass(frozen=True, slots=True)
+class GitRemoteHeadDTO:
+    branch: str
+    commit_hash: Optional[str]
+    checked_at: Optional[datetime]
+    checked_by: Optional[str]
+
+    @classmethod
+    def from_model(cls, model: GitRemoteHead) -> "GitRemoteHeadDTO":
+        return cls(
+            branch=model.branch,
+            commit_hash=model.commit_hash,
+            checked_at=model.checked_at,
+            checked_by=model.checked_by,
+        )
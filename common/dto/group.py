@@ -2,12 +2,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from itertools import starmap
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
 from infra.db.models import Group
 
 
+# Колонки для select() в порядке полей GroupDTO — строка маппится позиционно
+GROUP_DTO_COLUMNS = (
+    Group.id,
+    Group.tg_chat_id,
+    Group.type,
+    Group.title,
+    Group.username,
+    Group.last_post_at,
+    Group.assigned_bot_id,
+    Group.created_at,
+    Group.updated_at,
+    Group.metadata_refreshed_at,
+)
+
+
 @dataclass(slots=True)
 class GroupDTO:
     id: UUID
@@ -36,6 +52,15 @@ class GroupDTO:
             metadata_refreshed_at=getattr(model, "metadata_refreshed_at", None),
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence) -> "GroupDTO":
+        """Строка select(*GROUP_DTO_COLUMNS)."""
+        return cls(*row)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> list["GroupDTO"]:
+        return list(starmap(cls, rows))
+
 
 @dataclass(slots=True)
 class GroupReassignmentDTO:
@@ -2,10 +2,49 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
-from infra.db.models import Post
+from infra.db.models import Bot, Group, Post
+
+# Колонки для select() в порядке полей PostDTO; последняя — токен бота,
+# из которого вычисляется bot_telegram_id. Группа и бот — через outer join.
+POST_DTO_COLUMNS = (
+    Post.id,
+    Post.group_id,
+    Post.bot_id,
+    Post.status,
+    Post.target_chat_id,
+    Post.distribution_name,
+    Post.source_channel_username,
+    Post.source_channel_id,
+    Post.source_message_id,
+    Post.last_attempt_at,
+    Post.last_error,
+    Post.count_attempts,
+    Post.target_attempts,
+    Post.delete_last_attempt,
+    Post.pin_after_post,
+    Post.num_attempt_for_pin_post,
+    Post.pause_between_attempts_s,
+    Post.notify_on_failure,
+    Post.created_at,
+    Post.updated_at,
+    Group.tg_chat_id,
+    Group.title,
+    Group.username,
+    Bot.username,
+    Bot.name,
+    Bot.token,
+)
+_BOT_TOKEN_POS = len(POST_DTO_COLUMNS) - 1
+
+
+def _telegram_id(token: Optional[str]) -> Optional[str]:
+    if not token:
+        return None
+    prefix, _, _ = token.partition(":")
+    return prefix or None
 
 
 @dataclass(slots=True)
@@ -41,11 +80,7 @@ class PostDTO:
     def from_model(cls, model: Post) -> "PostDTO":
         group = getattr(model, "group", None)
         bot = getattr(model, "bot", None)
-        bot_token = getattr(bot, "token", None) if bot else None
-        bot_telegram_id = None
-        if bot_token:
-            prefix, _, _ = bot_token.partition(":")
-            bot_telegram_id = prefix or None
+        bot_telegram_id = _telegram_id(getattr(bot, "token", None) if bot else None)
         return cls(
             id=model.id,
             group_id=model.group_id,
@@ -74,3 +109,13 @@ class PostDTO:
             bot_name=getattr(bot, "name", None),
             bot_telegram_id=bot_telegram_id,
         )
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "PostDTO":
+        """Строка select(*POST_DTO_COLUMNS)."""
+        return cls(*row[:_BOT_TOKEN_POS], _telegram_id(row[_BOT_TOKEN_POS]))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> list["PostDTO"]:
+        pos = _BOT_TOKEN_POS
+        return [cls(*row[:pos], _telegram_id(row[pos])) for row in rows]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class PostingJob:
+    """
+    Снимок поста для PostingRunner: только поля, нужные для отправки.
+
+    Строится напрямую из строки Core select() (порядок полей совпадает с
+    колонками запроса в SQLAlchemyPostRepository.list_posting_jobs), без
+    identity map и отслеживания изменений в сессии.
+    """
+
+    id: UUID
+    group_id: UUID
+    status: str
+    target_chat_id: int
+    distribution_name: Optional[str]
+    source_channel_id: Optional[int]
+    source_message_id: int
+    last_attempt_at: Optional[datetime]
+    count_attempts: int
+    target_attempts: int
+    pause_between_attempts_s: int
+    delete_last_attempt: bool
+    pin_after_post: bool
+    num_attempt_for_pin_post: Optional[int]
+    notify_on_failure: bool
+    # Последняя не удалённая отправка (для delete_last_attempt)
+    last_sent_attempt_id: Optional[UUID] = None
+    last_sent_chat_id: Optional[int] = None
+    last_sent_message_id: Optional[int] = None
@@ -7,6 +7,7 @@ from .admin import (
     AdminGroupsAction,
     AdminDistributionsAction,
 )
+from .control_event import ControlEvent
 from .telegram_error import TelegramErrorType, classify_telegram_error, is_critical_error
 
 __all__ = [
@@ -17,6 +18,7 @@ __all__ = [
     "AdminBotFreeMode",
     "AdminGroupsAction",
     "AdminDistributionsAction",
+    "ControlEvent",
     "TelegramErrorType",
     "classify_telegram_error",
     "is_critical_error",
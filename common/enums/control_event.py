@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ControlEvent(str, Enum):
+    """События, которые админка рассылает узлам через Postgres NOTIFY."""
+
+    FORCE_UPDATE = "force_update"
+    SETTINGS_CHANGED = "settings_changed"
+    BOT_DEACTIVATED = "bot_deactivated"
+    POSTS_PAUSED = "posts_paused"
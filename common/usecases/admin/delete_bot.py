@@ -5,8 +5,10 @@ from typing import Dict
 
 from common.dto import BotDeletePromptDTO, ActionResultDTO
 from services import BotService, PostService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class PrepareDeleteBotUseCase:
     def __init__(
         self,
@@ -34,6 +36,7 @@ class PrepareDeleteBotUseCase:
         return BotDeletePromptDTO(bot_id=bot_id, telegram_id=bot.telegram_id, text=text)
 
 
+@traced_use_case
 class DeleteBotUseCase:
     def __init__(
         self,
@@ -6,8 +6,10 @@ from typing import Dict
 from common.dto import BotFreePromptDTO, ActionResultDTO
 from common.enums import AdminBotFreeMode
 from services import BotService, PostService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class PrepareFreeBotUseCase:
     def __init__(
         self,
@@ -39,6 +41,7 @@ class PrepareFreeBotUseCase:
         return BotFreePromptDTO(bot_id=bot_id, telegram_id=bot.telegram_id, text=text)
 
 
+@traced_use_case
 class FreeBotUseCase:
     def __init__(
         self,
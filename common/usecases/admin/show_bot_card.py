@@ -11,8 +11,10 @@ from services import (
     PostAttemptService,
     SettingsService,
 )
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowBotCardUseCase:
     def __init__(
         self,
@@ -6,8 +6,10 @@ from typing import Dict
 
 from common.dto import BotListItemDTO, BotsListViewDTO
 from services import BotService, PostService, SettingsService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowBotsListUseCase:
     def __init__(
         self,
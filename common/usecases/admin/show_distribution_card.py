@@ -9,8 +9,10 @@ from common.dto import DistributionCardDTO
 from services import PostService
 
 from logging import getLogger
+from infra.tracing import traced_use_case
 logger = getLogger(__name__)
 
+@traced_use_case
 class ShowDistributionCardUseCase:
     def __init__(
         self,
@@ -8,10 +8,12 @@ from uuid import UUID
 
 from common.dto import DistributionGroupListItemDTO, DistributionGroupsViewDTO, PostDTO, GroupDTO
 from services import PostService, SettingsService, GroupService, BotService
+from infra.tracing import traced_use_case
 
 logger = getLogger(__name__)
 
 
+@traced_use_case
 class ShowDistributionGroupsUseCase:
     def __init__(
         self,
@@ -7,8 +7,10 @@ from uuid import UUID
 
 from common.dto import DistributionListItemDTO, DistributionsListViewDTO
 from services import PostService, SettingsService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowDistributionsListUseCase:
     def __init__(
         self,
@@ -6,8 +6,10 @@ from uuid import UUID
 
 from common.dto import BotDTO, GroupCardDTO
 from services import GroupService, BotService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowGroupCardUseCase:
     def __init__(
         self,
@@ -8,10 +8,12 @@ from uuid import UUID
 
 from common.dto import BotDTO, GroupListItemDTO, GroupsListViewDTO
 from services import GroupService, BotService, SettingsService
+from infra.tracing import traced_use_case
 
 logger = getLogger(__name__)
 
 
+@traced_use_case
 class ShowGroupsListUseCase:
     def __init__(
         self,
@@ -4,8 +4,10 @@ from typing import Dict
 
 from common.dto import MenuItemDTO, MenuViewDTO
 from common.enums import AdminMenuAction
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowMainMenuUseCase:
     def __init__(
         self,
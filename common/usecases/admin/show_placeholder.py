@@ -3,8 +3,10 @@ from __future__ import annotations
 from typing import Dict
 
 from common.enums import AdminMenuAction
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowPlaceholderUseCase:
     def __init__(self, *, texts: Dict[AdminMenuAction | str, str]) -> None:
         self._texts = texts
@@ -6,8 +6,10 @@ from uuid import UUID
 
 from common.dto import PostCardDTO, PostDTO
 from services import PostService, GroupService, BotService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowPostCardUseCase:
     def __init__(
         self,
@@ -6,8 +6,10 @@ from uuid import UUID
 
 from common.dto import PostDTO, PostListItemDTO, PostsListViewDTO, GroupDTO
 from services import PostService, SettingsService, GroupService, BotService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class ShowPostsListUseCase:
     def __init__(
         self,
@@ -11,8 +11,10 @@ from common.exceptions import (
 )
 from infra.db.models import Bot
 from services import BotService, SettingsService, SystemService
+from infra.tracing import traced_use_case
 
 
+@traced_use_case
 class BotInitializationUseCase:
     def __init__(
         self,
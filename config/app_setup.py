@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any, Coroutine, TypeVar
 
 from config.logging_setup import setup_logging
 from config.settings import Config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def setup_application(settings: Config) -> None:
     """Prepare application environment using loaded settings."""
-    setup_logging(settings.log_file_path, level=settings.log_level)
+    setup_logging(
+        settings.log_file_path,
+        level=settings.log_level,
+        json_format=settings.LOG_JSON,
+        module_levels=settings.LOG_LEVELS,
+        use_queue=settings.LOG_QUEUE,
+        throttle=settings.LOG_THROTTLE,
+        throttle_window_s=settings.LOG_THROTTLE_WINDOW_S,
+    )
 
     logger.debug(
         "Application setup completed (log_file=%s, log_level=%s)",
@@ -19,4 +31,26 @@ def setup_application(settings: Config) -> None:
     )
 
 
-__all__ = ["setup_application"]
+def run_event_loop(settings: Config, main: Coroutine[Any, Any, T]) -> T:
+    """Запускает main: uvloop.run при USE_UVLOOP и установленном uvloop, иначе asyncio.run."""
+    if settings.USE_UVLOOP:
+        try:
+            import uvloop
+        except ImportError:
+            # Логирование ещё не настроено — предупреждение пишет log_event_loop
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def log_event_loop(settings: Config) -> None:
+    """Сообщает, на каком цикле запущено приложение; вызывать после setup_application."""
+    loop = asyncio.get_running_loop()
+    if type(loop).__module__.startswith("uvloop"):
+        logger.info("Running on the uvloop event loop")
+    elif settings.USE_UVLOOP:
+        logger.warning("USE_UVLOOP is set but uvloop is not installed, using the default event loop")
+
+
+__all__ = ["setup_application", "run_event_loop", "log_event_loop"]
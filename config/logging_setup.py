@@ -1,13 +1,157 @@
 from __future__ import annotations
 
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Callable, Mapping, Optional
 
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Флаг для предотвращения повторной инициализации
 _logging_configured = False
+_listener: Optional[QueueListener] = None
+_throttle_filters: list["LogThrottleFilter"] = []
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна JSON-строка на запись: ts, level, logger, message (+ exc, если есть)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    # Стандартный prepare() склеивает traceback с message; оставляем их раздельными,
+    # чтобы JSON-форматтер положил traceback в поле exc. exc_info всё равно
+    # сбрасываем: объекты traceback не должны жить в очереди
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_CHAT_RE = re.compile(r"chat(?:_id)?[ =:]+(-?\d+)")
+
+
+@dataclass(slots=True)
+class _ThrottleWindow:
+    started_at: float
+    level: int
+    count: int = 0
+    suppressed: int = 0
+
+
+class LogThrottleFilter(logging.Filter):
+    """
+    Ограничивает повторяющиеся сообщения логгера.
+
+    Ключ — (логгер, шаблон сообщения, чат). Шаблон — msg до подстановки
+    аргументов, а для f-строк — текст с числами и UUID, заменёнными на
+    плейсхолдеры; чат берётся из extra={"chat_id": ...} или из текста
+    ("in chat -100..."). За окно window_s по ключу проходят первые burst
+    записей, остальные отбрасываются и считаются; по истечении окна
+    логгер пишет "suppressed N similar messages" с примером шаблона.
+    """
+
+    def __init__(
+        self,
+        burst: int = 5,
+        window_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.burst = burst
+        self.window_s = window_s
+        self._clock = clock
+        self._windows: dict[tuple[str, str, Optional[int]], _ThrottleWindow] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = clock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "throttle_summary", False):
+            return True
+        now = self._clock()
+        key = (record.name, self._template(record), self._chat_id(record))
+        with self._lock:
+            expired = self._sweep(now) if now - self._last_sweep >= self.window_s else []
+            window = self._windows.get(key)
+            if window is None or now - window.started_at >= self.window_s:
+                if window is not None and window.suppressed:
+                    expired.append((key, window))
+                window = self._windows[key] = _ThrottleWindow(started_at=now, level=record.levelno)
+            window.count += 1
+            allowed = window.count <= self.burst
+            if not allowed:
+                window.suppressed += 1
+        for expired_key, expired_window in expired:
+            self._emit_summary(expired_key, expired_window)
+        return allowed
+
+    def flush(self) -> None:
+        """Пишет сводки по всем окнам с отброшенными записями (например, при остановке)."""
+        with self._lock:
+            pending = [(key, window) for key, window in self._windows.items() if window.suppressed]
+            self._windows.clear()
+        for key, window in pending:
+            self._emit_summary(key, window)
+
+    def _sweep(self, now: float) -> list[tuple[tuple[str, str, Optional[int]], _ThrottleWindow]]:
+        # Закрываем истёкшие окна, чтобы сводка не ждала следующего такого же сообщения
+        self._last_sweep = now
+        expired = []
+        for key, window in list(self._windows.items()):
+            if now - window.started_at >= self.window_s:
+                del self._windows[key]
+                if window.suppressed:
+                    expired.append((key, window))
+        return expired
+
+    def _emit_summary(self, key: tuple[str, str, Optional[int]], window: _ThrottleWindow) -> None:
+        name, template, chat_id = key
+        chat = f" in chat {chat_id}" if chat_id is not None else ""
+        logging.getLogger(name).log(
+            window.level,
+            f"suppressed {window.suppressed} similar messages{chat} in {self.window_s:.0f}s: {template}",
+            extra={"throttle_summary": True},
+        )
+
+    @staticmethod
+    def _template(record: logging.LogRecord) -> str:
+        if record.args:
+            return str(record.msg)
+        text = _UUID_RE.sub("<id>", str(record.msg))
+        return _NUMBER_RE.sub("<n>", text)[:300]
+
+    @staticmethod
+    def _chat_id(record: logging.LogRecord) -> Optional[int]:
+        chat_id = getattr(record, "chat_id", None)
+        if chat_id is not None:
+            return chat_id
+        match = _CHAT_RE.search(str(record.msg))
+        return int(match.group(1)) if match else None
 
 
 def setup_logging(
@@ -16,17 +160,31 @@ def setup_logging(
     level: int = logging.INFO,
     max_bytes: int = 5 * 1024 * 1024,
     backup_count: int = 5,
+    json_format: bool = False,
+    module_levels: Optional[Mapping[str, int | str]] = None,
+    use_queue: bool = True,
+    throttle: Optional[Mapping[str, int]] = None,
+    throttle_window_s: float = 60.0,
 ) -> None:
-    global _logging_configured
-    
+    """
+    Настраивает корневой логгер: файл с ротацией и консоль.
+
+    С use_queue в корневом логгере только QueueHandler: запись в очередь не
+    блокирует event loop, а форматирование, запись в файл и ротацию выполняет
+    QueueListener в фоновом потоке. module_levels — уровни для отдельных
+    логгеров, например {"aiogram.event": "WARNING"}; throttle — логгеры с
+    LogThrottleFilter и числом записей на ключ за throttle_window_s.
+    """
+    global _logging_configured, _listener
+
     # Если логирование уже настроено, пропускаем повторную инициализацию
     if _logging_configured:
         return
-    
+
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    formatter = logging.Formatter(LOG_FORMAT)
+    formatter: logging.Formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
 
     file_handler = RotatingFileHandler(
         log_path,
@@ -51,11 +209,41 @@ def setup_logging(
     root_logger.lastResort = None
 
     # Добавляем обработчики (после очистки они гарантированно отсутствуют)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-    
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(_QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+    else:
+        root_logger.addHandler(file_handler)
+        root_logger.addHandler(console_handler)
+
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(
+            module_level.upper() if isinstance(module_level, str) else module_level
+        )
+
+    for name, burst in (throttle or {}).items():
+        throttle_filter = LogThrottleFilter(burst=burst, window_s=throttle_window_s)
+        logging.getLogger(name).addFilter(throttle_filter)
+        _throttle_filters.append(throttle_filter)
+
     # Помечаем, что логирование настроено
     _logging_configured = True
 
 
-__all__ = ["setup_logging"]
+def stop_logging() -> None:
+    """Дописывает очередь и останавливает фоновый поток логирования."""
+    global _listener
+    for throttle_filter in _throttle_filters:
+        throttle_filter.flush()
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+__all__ = ["setup_logging", "stop_logging", "JsonFormatter", "LogThrottleFilter"]
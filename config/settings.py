@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,10 +14,68 @@ class Config(BaseSettings):
     DATABASE_URL: str = "DATABASE_URL"
     LOG_FILE: Path = Path("output.log")
     LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: dict[str, str] = {}  # Уровни по логгерам, например {"aiogram.event": "WARNING"}
+    LOG_JSON: bool = False  # Одна JSON-строка на запись вместо текстового формата
+    LOG_QUEUE: bool = True  # Запись в файл и консоль из фонового потока (QueueListener)
+    # Логгеры с ограничением повторов: сколько записей на (шаблон, чат) пропускать за LOG_THROTTLE_WINDOW_S.
+    # Фильтр вешается на логгер с точным именем (см. getLogger в services/posting)
+    LOG_THROTTLE: dict[str, int] = {
+        "PostingRunner": 5,
+        "PostingService": 5,
+    }
+    LOG_THROTTLE_WINDOW_S: float = 60.0
+    USE_UVLOOP: bool = False  # Цикл uvloop вместо стандартного asyncio (benchmarks.event_loop)
+    FAST_JSON: bool = False  # orjson для (де)сериализации запросов aiogram-сессии
+    TELEGRAM_API_BASE_URL: Optional[str] = None  # Например, http://127.0.0.1:8081 для benchmarks.fake_bot_api
     GIT_REMOTE: str = "origin"
     GIT_BRANCH: str = "main"
     GIT_CHECK_INTERVAL_S: int = 300
+    GIT_COMMAND_TIMEOUT_S: float = 10.0  # Локальные команды git (rev-parse, rev-list)
+    GIT_FETCH_TIMEOUT_S: float = 60.0  # Сетевые ls-remote / fetch
+    GIT_SHARED_REMOTE_HEAD: bool = True  # Брать коммит remote из общей записи в БД (обновляет одна нода)
     MAX_POSTS_PER_SECOND: int = 8  # Максимальное количество постов в секунду
+    USER_CACHE_SIZE: int = 1024
+    USER_CACHE_TTL_S: float = 300.0  # Через сколько секунд перечитывать пользователя (в т.ч. is_superuser)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_S: float = 30.0
+    DB_POOL_RECYCLE_S: int = 1800  # Пересоздавать соединения старше N секунд (-1 — никогда)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Кэш prepared statements asyncpg на соединение
+    DB_APPLICATION_NAME: str = "autoposter_node"
+    DB_PGBOUNCER: bool = False  # pgbouncer в режиме transaction: без кэша prepared statements
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 — без ограничения
+    # Отдельные пулы по типу нагрузки (get_uow(kind=...)), чтобы админка не отнимала соединения у рассылки
+    DB_POSTING_POOL_SIZE: int = 5
+    DB_POSTING_MAX_OVERFLOW: int = 5
+    DB_POSTING_STATEMENT_TIMEOUT_MS: int = 10_000
+    DB_HEARTBEAT_POOL_SIZE: int = 1
+    DB_HEARTBEAT_MAX_OVERFLOW: int = 1
+    DB_HEARTBEAT_STATEMENT_TIMEOUT_MS: int = 5_000
+    DB_ADMIN_POOL_SIZE: int = 2
+    DB_ADMIN_MAX_OVERFLOW: int = 3
+    DB_ADMIN_STATEMENT_TIMEOUT_MS: int = 30_000
+    DATABASE_REPLICA_URL: Optional[str] = None  # Реплика для read-only экранов админки (пул как у admin)
+    DB_REPLICA_MAX_LAG_S: float = 5.0  # При большем отставании чтение идёт в primary
+    DB_REPLICA_CHECK_INTERVAL_S: float = 10.0
+    CONTROL_LISTEN_ENABLED: bool = True  # LISTEN на управляющие события (force_update, паузы, настройки)
+    DB_LISTEN_URL: Optional[str] = None  # Прямое соединение для LISTEN, если DATABASE_URL идёт через pgbouncer
+    REDIS_URL: Optional[str] = None
+    USE_REDIS_STORAGE: bool = False  # FSM-состояние в Redis вместо памяти процесса (нужен REDIS_URL)
+    USE_REDIS_CACHE: bool = False  # Общий кэш настроек, нагрузки ботов и сводок рассылок (нужен REDIS_URL)
+    REDIS_CACHE_TTL_S: float = 30.0
+    METRICS_ENABLED: bool = False  # HTTP-эндпоинт Prometheus /metrics
+    METRICS_ADDR: str = "127.0.0.1"
+    METRICS_PORT: int = 9108
+    LOOP_WATCHDOG_ENABLED: bool = True  # Замер задержки event loop и стек при блокировке
+    LOOP_WATCHDOG_INTERVAL_S: float = 0.5  # Период замера event_loop_lag_seconds
+    LOOP_WATCHDOG_THRESHOLD_S: float = 0.5  # Задержка, после которой логируется стек блокирующего кода
+    ASYNCIO_DEBUG: bool = False  # Debug-режим asyncio (заметно медленнее, только для диагностики)
+    ASYNCIO_SLOW_CALLBACK_S: float = 0.1  # slow_callback_duration в debug-режиме
+    TRACING_ENABLED: bool = False  # OpenTelemetry: апдейты, use cases, репозитории, SQL, Bot API
+    TRACING_SAMPLE_RATIO: float = 0.1  # Доля сэмплируемых корневых спанов
+    TRACING_OTLP_ENDPOINT: Optional[str] = None  # По умолчанию OTEL_EXPORTER_OTLP_ENDPOINT
+    TRACING_SERVICE_NAME: str = "autoposter_node"
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -42,8 +101,12 @@ class Config(BaseSettings):
         return BASE_DIR / value
 
 
-settings = Config()
+_settings: Optional[Config] = None
 
 
 def get_settings() -> Config:
-    return settings
+    # Config() читает окружение и .env — не при импорте модуля, а при первом обращении
+    global _settings
+    if _settings is None:
+        _settings = Config()
+    return _settings
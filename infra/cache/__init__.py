@@ -0,0 +1,17 @@
+from .redis_cache import (
+    RedisCache,
+    configure_cache,
+    create_redis_client,
+    get_cache,
+    json_dumps,
+    json_loads,
+)
+
+__all__ = [
+    "RedisCache",
+    "configure_cache",
+    "create_redis_client",
+    "get_cache",
+    "json_dumps",
+    "json_loads",
+]
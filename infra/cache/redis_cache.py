@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+from logging import getLogger
+from typing import Any, Optional
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = getLogger(__name__)
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=_ORJSON_OPTIONS)
+
+
+def json_loads(value: bytes | str) -> Any:
+    return orjson.loads(value)
+
+
+def create_redis_client(url: str) -> Redis:
+    """Single connection pool shared by FSM storage and the cache layer."""
+    return Redis.from_url(url)
+
+
+class RedisCache:
+    """
+    Общий кэш поверх Redis.
+
+    Значения сгруппированы в «корзины» (hash-ключи): settings, bot_loads,
+    dist_summary. Каждое поле хранит свой срок жизни, а invalidate() сбрасывает
+    корзину целиком одной командой DEL. Ошибки Redis не пробрасываются:
+    кэш просто считается пустым и сервисы идут в БД.
+    """
+
+    def __init__(self, redis: Redis, *, prefix: str = "autoposter:cache", ttl: float = 30.0) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, bucket: str) -> str:
+        return f"{self._prefix}:{bucket}"
+
+    async def get(self, bucket: str, field: str) -> Optional[Any]:
+        try:
+            raw = await self._redis.hget(self._key(bucket), field)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {bucket}:{field}: {e}")
+            return None
+        if raw is None:
+            return None
+
+        expires_at, value = json_loads(raw)
+        if expires_at <= time.time():
+            return None
+        return value
+
+    async def set(self, bucket: str, field: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (ttl if ttl is not None else self.ttl)
+        try:
+            await self._redis.hset(self._key(bucket), field, json_dumps((expires_at, value)))
+        except RedisError as e:
+            logger.warning(f"Cache write failed for {bucket}:{field}: {e}")
+
+    async def invalidate(self, *buckets: str) -> None:
+        if not buckets:
+            return
+        try:
+            await self._redis.delete(*(self._key(bucket) for bucket in buckets))
+        except RedisError as e:
+            logger.warning(f"Cache invalidation failed for {buckets}: {e}")
+
+
+_cache: Optional[RedisCache] = None
+
+
+def configure_cache(cache: Optional[RedisCache]) -> None:
+    global _cache
+    _cache = cache
+
+
+def get_cache() -> Optional[RedisCache]:
+    return _cache
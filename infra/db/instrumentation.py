@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from typing import Any, Callable, TypeVar
+
+from infra import tracing
+from infra.metrics import DB_REPOSITORY_CALL_DURATION
+
+RepoT = TypeVar("RepoT", bound=type)
+
+
+def instrument_repository(cls: RepoT) -> RepoT:
+    """
+    Оборачивает публичные async-методы репозитория замером длительности
+    и, если включена трассировка, спаном repo.<repository>.<method>.
+
+    Метка repository — имя класса без SQLAlchemy/Repository (Post, Bot, ...),
+    method — имя метода; время включает ожидание соединения из пула.
+    """
+    repository = cls.__name__.removeprefix("SQLAlchemy").removesuffix("Repository")
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(value):
+            continue
+        setattr(cls, name, _timed(value, repository, name))
+    return cls
+
+
+def _timed(func: Callable[..., Any], repository: str, method: str) -> Callable[..., Any]:
+    histogram = DB_REPOSITORY_CALL_DURATION.labels(repository=repository, method=method)
+    span_name = f"repo.{repository}.{method}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            tracer = tracing.get_tracer()
+            if tracer is None:
+                return await func(*args, **kwargs)
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    return wrapper
+
+
+__all__ = ["instrument_repository"]
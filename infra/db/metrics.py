@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+
+from .session import pool_usages
+
+
+class PoolUsageCollector:
+    """Состояние пулов соединений по типу нагрузки; читается в момент сбора метрик."""
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "Configured size of the DB connection pool", labels=["kind"])
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "DB connections currently checked out of the pool", labels=["kind"]
+        )
+        overflow = GaugeMetricFamily("db_pool_overflow", "DB connections opened above pool_size", labels=["kind"])
+        for kind, usage in pool_usages().items():
+            size.add_metric([kind], usage.size)
+            checked_out.add_metric([kind], usage.checked_out)
+            overflow.add_metric([kind], usage.overflow)
+        yield size
+        yield checked_out
+        yield overflow
+
+
+REGISTRY.register(PoolUsageCollector())
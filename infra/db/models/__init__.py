@@ -4,6 +4,7 @@ from .group import Group
 from .post import Post, PostStatus
 from .post_attempt import PostAttempt
 from .settings import Setting
+from .git_remote_head import GitRemoteHead
 
 __all__ = [
     "User",
@@ -13,4 +14,5 @@ __all__ = [
     "PostStatus",
     "PostAttempt",
     "Setting",
+    "GitRemoteHead",
 ]
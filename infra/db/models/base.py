@@ -39,6 +39,11 @@ class TimestampMixin:
 
 
 class VersionedMixin:
+    # Optimistic locking только для строк, которые правят админы через ORM
+    # (settings, users). Горячие таблицы (posts, groups, bots) обновляются
+    # атомарными UPDATE по колонкам и версию не держат. Колонка version_id в них
+    # остаётся (server_default 1), пока на старом коде работает хоть один узел:
+    # удалять её — отдельной миграцией после обновления всех узлов.
     version_id: Mapped[int] = mapped_column(
         nullable=False,
         default=1,
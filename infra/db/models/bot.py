@@ -9,10 +9,10 @@ from sqlalchemy.sql import expression
 from sqlalchemy import DateTime, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
-from .base import Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin
+from .base import Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin
 
 
-class Bot(Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin):
+class Bot(Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin):
     bot_id: Mapped[int] = mapped_column(BigInteger, nullable=False, unique=True, index=True)
     username: Mapped[Optional[str]] = mapped_column(String(64), index=True)
     name: Mapped[Optional[str]] = mapped_column(String(100))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin, ModelHelpersMixin
+
+
+class GitRemoteHead(Base, TimestampMixin, ModelHelpersMixin):
+    """
+    Последний коммит отслеживаемой ветки на remote, общий для всего флота.
+
+    Обновляет его одна нода, взявшая lease (lease_owner / lease_until), когда
+    запись старше GIT_CHECK_INTERVAL_S; остальные только читают commit_hash и
+    считают commits_behind локально.
+    """
+
+    __tablename__ = "git_remote_heads"
+
+    branch: Mapped[str] = mapped_column(String(64), primary_key=True)
+    commit_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    checked_by: Mapped[Optional[str]] = mapped_column(String(128))
+
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(128))
+    lease_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
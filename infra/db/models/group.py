@@ -10,10 +10,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy import ForeignKey
 
-from .base import Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin
+from .base import Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin
 
 
-class Group(Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin):
+class Group(Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin):
     tg_chat_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False, index=True)
     type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)  # group | supergroup | channel
     title: Mapped[Optional[str]] = mapped_column(String(128))
@@ -11,10 +11,10 @@ from common.enums.post_status import PostStatus
 
 from datetime import datetime
 
-from .base import Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin
+from .base import Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin
 
 
-class Post(Base, TimestampMixin, VersionedMixin, UUIDPkMixin, ModelHelpersMixin):
+class Post(Base, TimestampMixin, UUIDPkMixin, ModelHelpersMixin):
     group_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), index=True)
     bot_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("bots.id", ondelete="SET NULL"), index=True)
 
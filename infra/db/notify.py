@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import defaultdict
+from logging import getLogger
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.enums import ControlEvent
+from config.settings import Config
+from infra.cache import json_dumps, json_loads
+
+logger = getLogger(__name__)
+
+CONTROL_CHANNEL = "autoposter_control"
+
+ControlHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+_NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+
+
+async def notify_control(session: AsyncSession, event: ControlEvent, **payload: Any) -> None:
+    """
+    Разослать событие всем узлам. NOTIFY транзакционный: сообщение уходит
+    только при commit транзакции, в которой выполнено изменение.
+    """
+    body = json_dumps({"event": event.value, **payload}).decode()
+    await session.execute(_NOTIFY_SQL, {"channel": CONTROL_CHANNEL, "payload": body})
+
+
+def listen_dsn(config: Config) -> str:
+    """DSN для asyncpg.connect: DB_LISTEN_URL (прямое соединение, мимо pgbouncer) или DATABASE_URL."""
+    url = make_url(config.DB_LISTEN_URL or config.DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class ControlListener:
+    """
+    Одно выделенное соединение с LISTEN на канал управляющих событий.
+
+    Обработчики вызываются отдельными задачами, чтобы медленный обработчик
+    не задерживал разбор следующих уведомлений. При обрыве соединение
+    переоткрывается; события, пришедшие в разрыв, теряются — периодические
+    проверки (heartbeat, цикл постинга) остаются запасным путём.
+    """
+
+    def __init__(self, dsn: str, *, channel: str = CONTROL_CHANNEL, reconnect_delay_s: float = 5.0) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._reconnect_delay_s = reconnect_delay_s
+        self._handlers: dict[str, list[ControlHandler]] = defaultdict(list)
+        self._tasks: set[asyncio.Task] = set()
+
+    def subscribe(self, event: ControlEvent, handler: ControlHandler) -> None:
+        self._handlers[event.value].append(handler)
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                conn = await asyncpg.connect(self._dsn)
+            except Exception as e:
+                logger.warning(f"Control listener: failed to connect: {e}")
+            else:
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                try:
+                    await conn.add_listener(self._channel, self._on_notify)
+                    logger.info(f"Control listener: listening on '{self._channel}'")
+                    await _wait_any(stop_event, lost)
+                except Exception as e:
+                    logger.warning(f"Control listener: connection error: {e}")
+                finally:
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+                if stop_event.is_set():
+                    break
+                logger.warning("Control listener: connection lost, reconnecting")
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=self._reconnect_delay_s)
+
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _on_notify(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            message = json_loads(payload)
+            event = message["event"]
+        except Exception:
+            logger.warning(f"Control listener: malformed payload {payload!r}")
+            return
+
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        logger.info(f"Control event received: {event}")
+        for handler in handlers:
+            task = asyncio.create_task(self._dispatch(handler, message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _dispatch(handler: ControlHandler, message: dict[str, Any]) -> None:
+        try:
+            await handler(message)
+        except Exception:
+            logger.exception(f"Control event handler failed for {message.get('event')}")
+
+
+async def _wait_any(*events: asyncio.Event) -> None:
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+__all__ = ["CONTROL_CHANNEL", "ControlListener", "listen_dsn", "notify_control"]
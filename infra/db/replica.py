@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config.settings import Config, get_settings
+
+from .session import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+# На primary отставание нулевое. На реплике равенство LSN значит «применено всё
+# полученное», но это верно и для реплики, у которой отвалился WAL receiver:
+# поэтому нулём считаем его только при живом стриминге, иначе берём возраст
+# последней применённой транзакции. NULL (ещё ничего не применено) — нездорова
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Выбирает фабрику сессий для read-only юнитов работы.
+
+    Отставание реплики проверяется фоном раз в check_interval_s, поэтому сам
+    выбор синхронный и бесплатный. Пока реплика не проверена, недоступна или
+    отстаёт больше max_lag_s, чтение идёт в primary.
+    """
+
+    def __init__(
+        self,
+        replica_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_lag_s: float,
+        check_interval_s: float,
+    ) -> None:
+        self._replica_factory = replica_factory
+        self._max_lag_s = max_lag_s
+        self._check_interval_s = max(1.0, check_interval_s)
+        self._healthy = False
+        self._lag_s: Optional[float] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self._healthy
+
+    @property
+    def lag_s(self) -> Optional[float]:
+        return self._lag_s
+
+    def pick(self, primary_factory: async_sessionmaker[AsyncSession]) -> async_sessionmaker[AsyncSession]:
+        return self._replica_factory if self._healthy else primary_factory
+
+    async def check(self) -> bool:
+        try:
+            async with self._replica_factory() as session:
+                raw_lag = (await session.execute(REPLICA_LAG_SQL)).scalar_one()
+        except Exception as e:
+            if self._healthy:
+                logger.warning(f"Replica check failed, reading from primary: {e}")
+            self._healthy = False
+            self._lag_s = None
+        else:
+            if raw_lag is None:
+                if self._healthy:
+                    logger.warning("Replica is not streaming and has replayed nothing, reading from primary")
+                self._healthy = False
+                self._lag_s = None
+                return False
+            lag = float(raw_lag)
+            healthy = lag <= self._max_lag_s
+            if healthy != self._healthy:
+                if healthy:
+                    logger.info(f"Replica is in sync (lag {lag:.1f}s), routing admin reads to it")
+                else:
+                    logger.warning(f"Replica lag {lag:.1f}s > {self._max_lag_s}s, reading from primary")
+            self._healthy = healthy
+            self._lag_s = lag
+        return self._healthy
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            await self.check()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=self._check_interval_s)
+
+
+_router: Optional[ReplicaRouter] = None
+
+
+def _create_router(config: Config) -> Optional[ReplicaRouter]:
+    if not config.DATABASE_REPLICA_URL:
+        return None
+    return ReplicaRouter(
+        get_session_factory("replica"),
+        max_lag_s=config.DB_REPLICA_MAX_LAG_S,
+        check_interval_s=config.DB_REPLICA_CHECK_INTERVAL_S,
+    )
+
+
+def get_replica_router() -> Optional[ReplicaRouter]:
+    """Router for the configured replica, or None when DATABASE_REPLICA_URL is not set."""
+    global _router
+    if _router is None:
+        _router = _create_router(get_settings())
+    return _router
+
+
+__all__ = ["ReplicaRouter", "get_replica_router", "REPLICA_LAG_SQL"]
@@ -4,6 +4,7 @@ from .bot_repo import SQLAlchemyBotRepository
 from .group_repo import SQLAlchemyGroupRepository
 from .post_repo import SQLAlchemyPostRepository
 from .post_attempt_repo import SQLAlchemyPostAttemptRepository
+from .git_remote_head_repo import SQLAlchemyGitRemoteHeadRepository
 
 __all__ = [
     "SQLAlchemyUserRepository",
@@ -12,4 +13,5 @@ __all__ = [
     "SQLAlchemyGroupRepository",
     "SQLAlchemyPostRepository",
     "SQLAlchemyPostAttemptRepository",
+    "SQLAlchemyGitRemoteHeadRepository",
 ]
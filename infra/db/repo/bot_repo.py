@@ -5,15 +5,20 @@ from logging import getLogger
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, update
+from sqlalchemy import Row, and_, func, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from infra.db.models import Bot, Post, Group
+from common.dto.bot import BOT_DTO_COLUMNS
+from common.enums import ControlEvent
+from infra.db.notify import notify_control
+from infra.db.models import Bot, Post, Group, Setting
+from infra.db.instrumentation import instrument_repository
 
 logger = getLogger(__name__)
 
 
+@instrument_repository
 class SQLAlchemyBotRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.__session = session
@@ -55,6 +60,25 @@ class SQLAlchemyBotRepository:
         await self.__session.flush()
         return bot
 
+    async def update_fields(self, bot_id: UUID, **fields) -> Optional[Bot]:
+        """Атомарно обновить колонки бота и вернуть строку (UPDATE ... RETURNING)."""
+        columns = Bot.__table__.columns
+        values = {k: v for k, v in fields.items() if k in columns}
+        if not values:
+            return await self.get(bot_id)
+        stmt = (
+            update(Bot)
+            .where(Bot.id == bot_id)
+            .values(**values)
+            .returning(Bot)
+            .execution_options(populate_existing=True)
+        )
+        res = await self.__session.execute(stmt)
+        bot = res.scalars().first()
+        if bot is not None and values.get("deactivated") is True:
+            await notify_control(self.__session, ControlEvent.BOT_DEACTIVATED, bot_id=str(bot_id))
+        return bot
+
     async def delete(self, bot_id: UUID) -> None:
         obj = await self.get(bot_id)
         if obj:
@@ -68,6 +92,31 @@ class SQLAlchemyBotRepository:
         )
         await self.__session.flush()
 
+    async def heartbeat(self, token: str, **fields) -> Optional[Row]:
+        """
+        Отметка heartbeat одним запросом: UPDATE bots SET last_heartbeat_at = now()
+        (+ переданные колонки, например git-статус) RETURNING id, force_update и
+        heartbeat_interval_s текущих settings. None — бота с таким токеном нет.
+        """
+        interval = (
+            select(Setting.heartbeat_interval_s)
+            .where(Setting.is_current.is_(True))
+            .limit(1)
+            .scalar_subquery()
+        )
+        columns = Bot.__table__.columns
+        values = {k: v for k, v in fields.items() if k in columns}
+        values["last_heartbeat_at"] = func.now()
+        stmt = (
+            update(Bot)
+            .where(Bot.token == token)
+            .values(**values)
+            .returning(Bot.id, Bot.force_update, interval)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.__session.execute(stmt)
+        return res.first()
+
     async def mark_self_destruction(self, bot_id: UUID) -> None:
         await self.__session.execute(
             update(Bot).where(Bot.id == bot_id).values(self_destruction=True)
@@ -79,6 +128,7 @@ class SQLAlchemyBotRepository:
             update(Bot).where(Bot.id == bot_id).values(deactivated=True)
         )
         await self.__session.flush()
+        await notify_control(self.__session, ControlEvent.BOT_DEACTIVATED, bot_id=str(bot_id))
 
     async def has_ip_conflict(self, server_ip: str, token: str) -> bool:
         # another active bot on the same IP with a different token
@@ -119,10 +169,11 @@ class SQLAlchemyBotRepository:
                 out[assigned_bot_id] = int(count)
         return out
 
-    async def list(self, *, limit: int = 100, offset: int = 0) -> list[Bot]:
-        stmt = select(Bot).order_by(Bot.created_at.desc()).limit(limit).offset(offset)
+    async def list(self, *, limit: int = 100, offset: int = 0) -> list[Row]:
+        """Строки select(*BOT_DTO_COLUMNS), без join настроек — для BotDTO.from_rows."""
+        stmt = select(*BOT_DTO_COLUMNS).order_by(Bot.created_at.desc()).limit(limit).offset(offset)
         res = await self.__session.execute(stmt)
-        return list(res.scalars().all())
+        return list(res.all())
 
     async def search(
         self,
@@ -132,8 +183,8 @@ class SQLAlchemyBotRepository:
         active_only: bool = False,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[Bot]:
-        stmt = select(Bot)
+    ) -> list[Row]:
+        stmt = select(*BOT_DTO_COLUMNS)
         if username_like:
             stmt = stmt.where(Bot.username.ilike(f"%{username_like}%"))
         if name_like:
@@ -142,7 +193,7 @@ class SQLAlchemyBotRepository:
             stmt = stmt.where(Bot.deactivated.is_(False))
         stmt = stmt.order_by(Bot.created_at.desc()).limit(limit).offset(offset)
         res = await self.__session.execute(stmt)
-        return list(res.scalars().all())
+        return list(res.all())
 
     async def count(
         self,
@@ -169,7 +220,10 @@ class SQLAlchemyBotRepository:
             .values(force_update=True)
         )
         await self.__session.flush()
-        return result.rowcount or 0
+        updated = result.rowcount or 0
+        if updated:
+            await notify_control(self.__session, ControlEvent.FORCE_UPDATE)
+        return updated
 
     async def clear_force_update(self, bot_id: UUID) -> None:
         """Clear force_update flag for a specific bot."""
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.db.models import GitRemoteHead
+from infra.db.instrumentation import instrument_repository
+
+
+@instrument_repository
+class SQLAlchemyGitRemoteHeadRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.__session = session
+
+    async def get(self, branch: str) -> Optional[GitRemoteHead]:
+        res = await self.__session.execute(select(GitRemoteHead).where(GitRemoteHead.branch == branch))
+        return res.scalars().first()
+
+    async def claim_refresh(self, branch: str, *, owner: str, max_age_s: float, lease_s: float) -> bool:
+        """
+        Берёт lease на обновление записи одним INSERT ... ON CONFLICT DO UPDATE.
+
+        Lease выдаётся, если записи ещё нет или она старше max_age_s и чужой
+        lease истёк. Конкурирующие ноды сериализуются на блокировке строки,
+        поэтому выигрывает ровно одна.
+        """
+        lease_until = func.now() + timedelta(seconds=lease_s)
+        stmt = pg_insert(GitRemoteHead).values(branch=branch, lease_owner=owner, lease_until=lease_until)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GitRemoteHead.branch],
+            set_={"lease_owner": owner, "lease_until": lease_until, "updated_at": func.now()},
+            where=and_(
+                or_(
+                    GitRemoteHead.checked_at.is_(None),
+                    GitRemoteHead.checked_at < func.now() - timedelta(seconds=max_age_s),
+                ),
+                or_(GitRemoteHead.lease_until.is_(None), GitRemoteHead.lease_until < func.now()),
+            ),
+        ).returning(GitRemoteHead.branch)
+        res = await self.__session.execute(stmt)
+        return res.first() is not None
+
+    async def publish(self, branch: str, commit_hash: str, *, owner: str) -> bool:
+        """Записывает коммит и снимает lease; False, если lease уже перехватила другая нода."""
+        stmt = (
+            update(GitRemoteHead)
+            .where(GitRemoteHead.branch == branch, GitRemoteHead.lease_owner == owner)
+            .values(
+                commit_hash=commit_hash,
+                checked_at=func.now(),
+                checked_by=owner,
+                lease_owner=None,
+                lease_until=None,
+                updated_at=func.now(),
+            )
+            .returning(GitRemoteHead.branch)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.__session.execute(stmt)
+        return res.first() is not None
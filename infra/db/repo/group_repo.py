@@ -9,9 +9,11 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update
+from sqlalchemy import Row, update
 
+from common.dto.group import GROUP_DTO_COLUMNS
 from infra.db.models import Group
+from infra.db.instrumentation import instrument_repository
 
 logger = getLogger(__name__)
 
@@ -23,6 +25,7 @@ class AssignToBotResult:
     reassigned: list[Tuple[Group, UUID]]
 
 
+@instrument_repository
 class SQLAlchemyGroupRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.__session = session
@@ -32,6 +35,13 @@ class SQLAlchemyGroupRepository:
         res = await self.__session.execute(stmt)
         return res.scalars().first()
 
+    async def list_by_ids(self, group_ids: list[UUID]) -> list[Group]:
+        if not group_ids:
+            return []
+        stmt = select(Group).where(Group.id.in_(group_ids))
+        res = await self.__session.execute(stmt)
+        return list(res.scalars().all())
+
     async def get_by_tg_chat_id(self, tg_chat_id: int) -> Optional[Group]:
         stmt = select(Group).where(Group.tg_chat_id == tg_chat_id)
         res = await self.__session.execute(stmt)
@@ -83,17 +93,18 @@ class SQLAlchemyGroupRepository:
         res = await self.__session.execute(stmt)
         return list(res.scalars().all())
 
-    async def list_bound(self, *, limit: int = 1000, offset: int = 0) -> list[Group]:
+    async def list_bound(self, *, limit: int = 1000, offset: int = 0) -> list[Row]:
+        """Строки select(*GROUP_DTO_COLUMNS) — для GroupDTO.from_rows."""
         start_time = time.perf_counter()
         stmt = (
-            select(Group)
+            select(*GROUP_DTO_COLUMNS)
             .where(Group.assigned_bot_id.is_not(None))
             .order_by(Group.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         res = await self.__session.execute(stmt)
-        groups = list(res.scalars().all())
+        groups = list(res.all())
         elapsed = time.perf_counter() - start_time
         logger.info(
             "list_bound: fetched %d groups (limit=%d, offset=%d) in %.3f seconds",
@@ -171,8 +182,6 @@ class SQLAlchemyGroupRepository:
         username: str | None = None,
         refreshed_at: datetime | None = None,
     ) -> Optional[Group]:
-        # Используем прямой UPDATE statement для избежания проблем с optimistic locking
-        # Это более эффективно и безопасно при параллельных обновлениях
         update_values = {}
         if title is not None and title:
             update_values["title"] = title
@@ -185,10 +194,13 @@ class SQLAlchemyGroupRepository:
             # Если нечего обновлять, просто возвращаем группу
             return await self.get(group_id)
         
-        # Выполняем прямой UPDATE - это избегает StaleDataError из-за optimistic locking
-        stmt = update(Group).where(Group.id == group_id).values(**update_values)
-        await self.__session.execute(stmt)
-        await self.__session.flush()
-        
-        # Перезагружаем обновленную запись
-        return await self.get(group_id)
+        # Атомарный UPDATE ... RETURNING: запись и чтение обновлённой строки одним запросом
+        stmt = (
+            update(Group)
+            .where(Group.id == group_id)
+            .values(**update_values)
+            .returning(Group)
+            .execution_options(populate_existing=True)
+        )
+        res = await self.__session.execute(stmt)
+        return res.scalars().first()
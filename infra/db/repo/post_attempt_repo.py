@@ -4,13 +4,15 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from infra.db.models import PostAttempt
+from infra.db.instrumentation import instrument_repository
 
 
+@instrument_repository
 class SQLAlchemyPostAttemptRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.__session = session
@@ -19,6 +21,11 @@ class SQLAlchemyPostAttemptRepository:
         self.__session.add(attempt)
         await self.__session.flush()
         return attempt
+
+    async def mark_deleted(self, attempt_id: UUID) -> None:
+        await self.__session.execute(
+            update(PostAttempt).where(PostAttempt.id == attempt_id).values(deleted=True)
+        )
     
     async def count_success_in_period(self, *, bot_id: Optional[UUID], seconds: int) -> int:
         since = datetime.now(timezone.utc) - timedelta(seconds=seconds)
@@ -6,20 +6,45 @@ from logging import getLogger
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, update, case, cast, String
+from sqlalchemy import Row, and_, func, update, case, cast, String, true
 from sqlalchemy import delete as sa_delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, noload
+from sqlalchemy.orm import selectinload
 
-from infra.db.models import Post, PostStatus, Group
+from common.dto.post import POST_DTO_COLUMNS
+from common.enums import ControlEvent
+from common.dto.posting_job import PostingJob
+from infra.db.models import Bot, Post, PostStatus, Group, PostAttempt
+from infra.db.notify import notify_control
+from infra.db.instrumentation import instrument_repository
 
 logger = getLogger(__name__)
 
 
 ACTIVE_STATUSES = (PostStatus.ACTIVE.value, PostStatus.PAUSED.value, PostStatus.ERROR.value)
 
-
+# Колонки в порядке полей PostingJob
+POSTING_JOB_COLUMNS = (
+    Post.id,
+    Post.group_id,
+    Post.status,
+    Post.target_chat_id,
+    Post.distribution_name,
+    Post.source_channel_id,
+    Post.source_message_id,
+    Post.last_attempt_at,
+    Post.count_attempts,
+    Post.target_attempts,
+    Post.pause_between_attempts_s,
+    Post.delete_last_attempt,
+    Post.pin_after_post,
+    Post.num_attempt_for_pin_post,
+    Post.notify_on_failure,
+)
+
+
+@instrument_repository
 class SQLAlchemyPostRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.__session = session
@@ -147,7 +172,10 @@ class SQLAlchemyPostRepository:
             .returning(Post.id)
         )
         await self.__session.flush()
-        return len(res.fetchall())
+        paused = len(res.fetchall())
+        if paused:
+            await notify_control(self.__session, ControlEvent.POSTS_PAUSED, bot_id=str(bot_id))
+        return paused
 
     def _distribution_filters(
         self,
@@ -185,7 +213,10 @@ class SQLAlchemyPostRepository:
             .returning(Post.id)
         )
         await self.__session.flush()
-        return len(res.fetchall())
+        paused = len(res.fetchall())
+        if paused:
+            await notify_control(self.__session, ControlEvent.POSTS_PAUSED, distribution_name=distribution_name)
+        return paused
 
     async def bulk_resume_by_distribution(
         self,
@@ -293,42 +324,63 @@ class SQLAlchemyPostRepository:
         )
         await self.__session.flush()
 
-    async def mark_done(self, post_id: UUID) -> None:
-        await self.__session.execute(
-            update(Post).where(Post.id == post_id).values(status=PostStatus.DONE.value)
-        )
-        await self.__session.flush()
-
     async def touch_attempt_time(self, post_id: UUID) -> None:
         await self.__session.execute(
             update(Post).where(Post.id == post_id).values(last_attempt_at=datetime.now(timezone.utc))
         )
         await self.__session.flush()
 
-    async def increment_attempt_count(self, post_id: UUID) -> None:
-        """Atomically increment count_attempts and update last_attempt_at."""
-        await self.__session.execute(
+    async def register_success(self, post_id: UUID) -> Optional[tuple[int, str]]:
+        """
+        Одним UPDATE увеличить count_attempts, обновить last_attempt_at и закрыть
+        пост, если достигнут target_attempts (отрицательный — бесконечно).
+        Возвращает (count_attempts, status) после обновления или None, если поста нет.
+        """
+        new_count = Post.count_attempts + 1
+        stmt = (
             update(Post)
             .where(Post.id == post_id)
             .values(
-                count_attempts=Post.count_attempts + 1,
-                last_attempt_at=datetime.now(timezone.utc)
+                count_attempts=new_count,
+                last_attempt_at=datetime.now(timezone.utc),
+                status=case(
+                    (and_(Post.target_attempts >= 0, new_count >= Post.target_attempts), PostStatus.DONE.value),
+                    else_=Post.status,
+                ),
             )
+            .returning(Post.count_attempts, Post.status)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self.__session.execute(stmt)).first()
+        return (row[0], row[1]) if row else None
+
+    async def list_posting_jobs(self, bot_id: UUID, *, limit: int = 100) -> list[PostingJob]:
+        """
+        Посты групп, закреплённых за ботом, в виде PostingJob (без ORM-сущностей).
+        Последняя не удалённая отправка подтягивается LATERAL-подзапросом.
+        """
+        last_sent = (
+            select(PostAttempt.id, PostAttempt.chat_id, PostAttempt.message_id)
+            .where(
+                PostAttempt.post_id == Post.id,
+                PostAttempt.deleted.is_(False),
+                PostAttempt.chat_id.is_not(None),
+                PostAttempt.message_id.is_not(None),
+            )
+            .order_by(PostAttempt.created_at.desc())
+            .limit(1)
+            .lateral("last_sent")
         )
-        await self.__session.flush()
-
-    async def list_by_bot(self, bot_id: UUID, *, limit: int = 100, offset: int = 0) -> list[Post]:
-        # Fetch posts by groups permanently assigned to the bot
         stmt = (
-            select(Post)
+            select(*POSTING_JOB_COLUMNS, last_sent.c.id, last_sent.c.chat_id, last_sent.c.message_id)
             .join(Group, Group.id == Post.group_id)
+            .outerjoin(last_sent, true())
             .where(Group.assigned_bot_id == bot_id)
             .order_by(Post.created_at.desc())
             .limit(limit)
-            .offset(offset)
         )
         res = await self.__session.execute(stmt)
-        return list(res.unique().scalars().all())
+        return [PostingJob(*row) for row in res.all()]
 
     async def list_by_group(self, group_id: UUID, *, limit: int = 100, offset: int = 0) -> list[Post]:
         stmt = (
@@ -494,14 +546,14 @@ class SQLAlchemyPostRepository:
         self,
         *,
         distribution_name: str | None,
-    ) -> list[Post]:
-        """List all posts in a distribution by name."""
+    ) -> list[Row]:
+        """List all posts in a distribution by name (rows of POST_DTO_COLUMNS)."""
         start_time = time.perf_counter()
-        # group и bot уже загружаются через lazy="joined" в модели
-        # post_attempts исключаем из загрузки через noload для ускорения запроса
+        # Только нужные колонки поста, группы и бота — без ORM-сущностей и post_attempts
         stmt = (
-            select(Post)
-            .options(noload(Post.post_attempts))
+            select(*POST_DTO_COLUMNS)
+            .join(Group, Group.id == Post.group_id)
+            .outerjoin(Bot, Bot.id == Post.bot_id)
         )
         if distribution_name is None:
             stmt = stmt.where(Post.distribution_name.is_(None))
@@ -510,9 +562,9 @@ class SQLAlchemyPostRepository:
 
         stmt = stmt.order_by(Post.created_at.desc())
         res = await self.__session.execute(stmt)
-        posts = list(res.unique().scalars().all())
+        posts = list(res.all())
         elapsed = time.perf_counter() - start_time
-        logger.info(
+        logger.debug(
             "list_distribution_posts: fetched %d posts (distribution_name=%s) in %.3f seconds",
             len(posts),
             distribution_name or "None",
@@ -544,6 +596,7 @@ class SQLAlchemyPostRepository:
             update(Post).where(Post.id == post_id).values(status=PostStatus.PAUSED.value)
         )
         await self.__session.flush()
+        await notify_control(self.__session, ControlEvent.POSTS_PAUSED, post_id=str(post_id))
 
     async def resume(self, post_id: UUID) -> None:
         await self.__session.execute(
@@ -8,11 +8,15 @@ from sqlalchemy import and_, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from common.enums import ControlEvent
 from infra.db.models import Setting
+from infra.db.notify import notify_control
+from infra.db.instrumentation import instrument_repository
 
 logger = getLogger(__name__)
 
 
+@instrument_repository
 class SQLAlchemySettingsRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.__session = session
@@ -37,6 +41,7 @@ class SQLAlchemySettingsRepository:
             .values(is_current=True)
         )
         await self.__session.flush()
+        await notify_control(self.__session, ControlEvent.SETTINGS_CHANGED, setting_id=str(setting_id))
         obj = await self.get(setting_id)
         assert obj is not None
         return obj
@@ -48,6 +53,7 @@ class SQLAlchemySettingsRepository:
 
     async def update(self, setting: Setting) -> Setting:
         await self.__session.flush()
+        await notify_control(self.__session, ControlEvent.SETTINGS_CHANGED, setting_id=str(setting.id))
         return setting
 
     async def delete(self, setting_id: UUID) -> None:
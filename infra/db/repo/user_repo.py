@@ -8,10 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from infra.db.models import User
+from infra.db.instrumentation import instrument_repository
 
 logger = getLogger(__name__)
 
 
+@instrument_repository
 class SQLAlchemyUserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -1,21 +1,182 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from config.settings import get_settings
+from __future__ import annotations
 
-settings = get_settings()
+import time
+from dataclasses import dataclass
+from typing import Any, Literal, Optional
+from uuid import uuid4
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-)
+from config.settings import Config, get_settings
+from infra.metrics import DB_POOL_CHECKOUT_WAIT
+from infra.tracing import instrument_engine
 
-SessionFactory = async_sessionmaker(  # type: ignore
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+SessionKind = Literal["default", "posting", "heartbeat", "admin", "replica"]
+SESSION_KINDS: tuple[SessionKind, ...] = ("default", "posting", "heartbeat", "admin", "replica")
+
+
+@dataclass(frozen=True, slots=True)
+class PoolProfile:
+    pool_size: int
+    max_overflow: int
+    statement_timeout_ms: int  # 0 — без ограничения
+
+
+def pool_profile(config: Config, kind: SessionKind) -> PoolProfile:
+    if kind == "posting":
+        return PoolProfile(
+            config.DB_POSTING_POOL_SIZE, config.DB_POSTING_MAX_OVERFLOW, config.DB_POSTING_STATEMENT_TIMEOUT_MS
+        )
+    if kind == "heartbeat":
+        return PoolProfile(
+            config.DB_HEARTBEAT_POOL_SIZE, config.DB_HEARTBEAT_MAX_OVERFLOW, config.DB_HEARTBEAT_STATEMENT_TIMEOUT_MS
+        )
+    if kind in ("admin", "replica"):
+        return PoolProfile(
+            config.DB_ADMIN_POOL_SIZE, config.DB_ADMIN_MAX_OVERFLOW, config.DB_ADMIN_STATEMENT_TIMEOUT_MS
+        )
+    return PoolProfile(config.DB_POOL_SIZE, config.DB_MAX_OVERFLOW, config.DB_STATEMENT_TIMEOUT_MS)
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long a checkout waits for a connection.
+
+    The pool's logging name is the session kind (see build_engine_kwargs),
+    so the wait is labelled per workload.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(kind=self._orig_logging_name or "default").observe(
+                time.perf_counter() - started
+            )
+
+
+def database_url(config: Config, kind: SessionKind) -> str:
+    if kind == "replica":
+        if not config.DATABASE_REPLICA_URL:
+            raise ValueError("DATABASE_REPLICA_URL is not configured")
+        return config.DATABASE_REPLICA_URL
+    return config.DATABASE_URL
+
+
+def build_engine_kwargs(config: Config, kind: SessionKind = "default") -> dict[str, Any]:
+    """Pool and driver options for create_async_engine, taken from Config."""
+    profile = pool_profile(config, kind)
+    url = database_url(config, kind)
+    kwargs: dict[str, Any] = {
+        "echo": False,
+        "poolclass": TimedAsyncQueuePool,
+        "pool_logging_name": kind,
+        "pool_size": profile.pool_size,
+        "max_overflow": profile.max_overflow,
+        "pool_timeout": config.DB_POOL_TIMEOUT_S,
+        "pool_recycle": config.DB_POOL_RECYCLE_S,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+    if "+asyncpg" in url:
+        server_settings = {"application_name": f"{config.DB_APPLICATION_NAME}:{kind}"}
+        connect_args: dict[str, Any] = {"server_settings": server_settings}
+        if config.DB_PGBOUNCER:
+            # В transaction mode соединение с сервером меняется между транзакциями,
+            # поэтому prepared statements не кэшируем и даём им уникальные имена
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        else:
+            connect_args["statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+            connect_args["prepared_statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+            if profile.statement_timeout_ms > 0:
+                server_settings["statement_timeout"] = str(profile.statement_timeout_ms)
+        kwargs["connect_args"] = connect_args
+
+    return kwargs
+
+
+def _create_engine(config: Config, kind: SessionKind) -> AsyncEngine:
+    new_engine = create_async_engine(database_url(config, kind), **build_engine_kwargs(config, kind))
+    instrument_engine(new_engine)
+
+    timeout_ms = pool_profile(config, kind).statement_timeout_ms
+    if config.DB_PGBOUNCER and timeout_ms > 0:
+        # pgbouncer не пропускает statement_timeout в параметрах старта, ставим его на транзакцию
+        @event.listens_for(new_engine.sync_engine, "begin")
+        def _set_statement_timeout(conn) -> None:
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+    return new_engine
+
+
+def _create_session_factory(target: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(  # type: ignore
+        target,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+# Движки создаются при первом запросе, включая "default": импорт модуля
+# не читает настройки и не тянет драйвер БД
+_engines: dict[SessionKind, AsyncEngine] = {}
+_session_factories: dict[SessionKind, async_sessionmaker[AsyncSession]] = {}
+
+
+def get_engine(kind: SessionKind = "default") -> AsyncEngine:
+    """Engine with its own pool per workload; created on first use."""
+    if kind not in _engines:
+        if kind not in SESSION_KINDS:
+            raise ValueError(f"Unknown session kind: {kind}")
+        _engines[kind] = _create_engine(get_settings(), kind)
+    return _engines[kind]
+
+
+def get_session_factory(kind: SessionKind = "default") -> async_sessionmaker[AsyncSession]:
+    factory = _session_factories.get(kind)
+    if factory is None:
+        factory = _session_factories[kind] = _create_session_factory(get_engine(kind))
+    return factory
+
+
+@dataclass(slots=True)
+class PoolUsage:
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+
+
+def pool_usage(target: Optional[AsyncEngine] = None) -> PoolUsage:
+    """Snapshot of the connection pool, used for the db_pool_* metrics."""
+    pool = (target if target is not None else get_engine()).pool
+    return PoolUsage(
+        size=pool.size(),  # type: ignore[attr-defined]
+        checked_out=pool.checkedout(),  # type: ignore[attr-defined]
+        checked_in=pool.checkedin(),  # type: ignore[attr-defined]
+        overflow=pool.overflow(),  # type: ignore[attr-defined]
+    )
+
+
+def pool_usages() -> dict[SessionKind, PoolUsage]:
+    """Pool snapshots for every engine created so far."""
+    return {kind: pool_usage(created) for kind, created in list(_engines.items())}
 
 
 async def dispose_engine() -> None:
     """Закрывает все соединения с базой данных."""
-    await engine.dispose()
+    for created in list(_engines.values()):
+        await created.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # Совместимость со старыми импортами `engine` / `SessionFactory` (движок "default")
+    if name == "engine":
+        return get_engine()
+    if name == "SessionFactory":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional
+import inspect
+from logging import getLogger
+from typing import Any, Callable, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from infra.db.repo import (
@@ -11,14 +14,42 @@ from infra.db.repo import (
     SQLAlchemyGroupRepository,
     SQLAlchemyPostRepository,
     SQLAlchemyPostAttemptRepository,
+    SQLAlchemyGitRemoteHeadRepository,
 )
 
-from .session import SessionFactory
+from .replica import get_replica_router
+from .session import SessionKind, get_session_factory
+
+logger = getLogger(__name__)
 
 
 class SQLAlchemyUnitOfWork:
+    """Unit of work with a lazily opened session.
+
+    Entering the context does not touch the database: the session is created
+    when a repository (or the session itself) is first accessed, and the
+    transaction autobegins on its first statement, so a unit of work that is
+    never used never checks out a pooled connection. Nested ``async with``
+    blocks on the same instance share the outer transaction.
+
+    A ``read_only`` unit of work is routed to the read replica when one is
+    configured and in sync (see ``ReplicaRouter``) and is rolled back instead
+    of committed on exit.
+
+    Callbacks registered with ``after_commit`` run once the outermost block
+    commits (cache writes and invalidations that must not see uncommitted
+    state) and are dropped on rollback.
+
+    ``has_writes`` tells whether anything was written in the current context,
+    so callers can keep follow-up reads on this transaction instead of a
+    replica that has not seen the write yet.
+    """
+
     _session_factory: async_sessionmaker[AsyncSession]
     _session: Optional[AsyncSession]
+    _depth: int
+    _read_only: bool
+    _wrote: bool
 
     _user_repo: Optional[SQLAlchemyUserRepository]
     _settings_repo: Optional[SQLAlchemySettingsRepository]
@@ -26,99 +57,181 @@ class SQLAlchemyUnitOfWork:
     _group_repo: Optional[SQLAlchemyGroupRepository]
     _post_repo: Optional[SQLAlchemyPostRepository]
     _post_attempt_repo: Optional[SQLAlchemyPostAttemptRepository]
-
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = SessionFactory) -> None:
-        self._session_factory = session_factory
+    _git_remote_head_repo: Optional[SQLAlchemyGitRemoteHeadRepository]
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        *,
+        read_only: bool = False,
+    ) -> None:
+        self._session_factory = session_factory if session_factory is not None else get_session_factory()
         self._session = None
-
-        self._user_repo = None
-        self._settings_repo = None
-        self._bot_repo = None
-        self._group_repo = None
-        self._post_repo = None
-        self._post_attempt_repo = None
+        self._depth = 0
+        self._read_only = read_only
+        self._wrote = False
+        self._after_commit: list[Callable[[], Any]] = []
+        self._reset_repos()
 
     # ---------- public accessors ----------
 
+    @property
+    def is_active(self) -> bool:
+        """True once the session has been opened inside the current context."""
+        return self._session is not None
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    @property
+    def has_writes(self) -> bool:
+        """True if the current context flushed, executed or holds pending writes."""
+        if self._wrote:
+            return True
+        session = self._session
+        return session is not None and bool(session.new or session.dirty or session.deleted)
+
     @property
     def session(self) -> AsyncSession:
-        if self._session is None:
+        if self._depth == 0:
             raise RuntimeError("SQLAlchemyUnitOfWork is not entered. Use 'async with SQLAlchemyUnitOfWork(...) as uow:'")
+        if self._session is None:
+            factory = self._session_factory
+            if self._read_only:
+                router = get_replica_router()
+                if router is not None:
+                    factory = router.pick(factory)
+            self._session = factory()
+            if not self._read_only:
+                sync_session = self._session.sync_session
+                event.listen(sync_session, "after_flush", self._on_flush)
+                event.listen(sync_session, "do_orm_execute", self._on_execute)
         return self._session
 
     @property
     def user_repo(self) -> SQLAlchemyUserRepository:
-        assert self._user_repo is not None, "user_repo is not initialized (use within context manager)"
+        if self._user_repo is None:
+            self._user_repo = SQLAlchemyUserRepository(self.session)
         return self._user_repo
 
     @property
     def settings_repo(self) -> SQLAlchemySettingsRepository:
-        assert self._settings_repo is not None, "settings_repo is not initialized (use within context manager)"
+        if self._settings_repo is None:
+            self._settings_repo = SQLAlchemySettingsRepository(self.session)
         return self._settings_repo
 
     @property
     def bot_repo(self) -> SQLAlchemyBotRepository:
-        assert self._bot_repo is not None, "bot_repo is not initialized (use within context manager)"
+        if self._bot_repo is None:
+            self._bot_repo = SQLAlchemyBotRepository(self.session)
         return self._bot_repo
 
     @property
     def group_repo(self) -> SQLAlchemyGroupRepository:
-        assert self._group_repo is not None, "group_repo is not initialized (use within context manager)"
+        if self._group_repo is None:
+            self._group_repo = SQLAlchemyGroupRepository(self.session)
         return self._group_repo
 
     @property
     def post_repo(self) -> SQLAlchemyPostRepository:
-        assert self._post_repo is not None, "post_repo is not initialized (use within context manager)"
+        if self._post_repo is None:
+            self._post_repo = SQLAlchemyPostRepository(self.session)
         return self._post_repo
 
     @property
     def post_attempt_repo(self) -> SQLAlchemyPostAttemptRepository:
-        assert self._post_attempt_repo is not None, "post_attempt_repo is not initialized (use within context manager)"
+        if self._post_attempt_repo is None:
+            self._post_attempt_repo = SQLAlchemyPostAttemptRepository(self.session)
         return self._post_attempt_repo
 
+    @property
+    def git_remote_head_repo(self) -> SQLAlchemyGitRemoteHeadRepository:
+        if self._git_remote_head_repo is None:
+            self._git_remote_head_repo = SQLAlchemyGitRemoteHeadRepository(self.session)
+        return self._git_remote_head_repo
+
     # ---------- context manager ----------
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
-        self._session = self._session_factory()
-        await self._session.begin()
-
-        self._user_repo = SQLAlchemyUserRepository(self._session)
-        self._settings_repo = SQLAlchemySettingsRepository(self._session)
-        self._bot_repo = SQLAlchemyBotRepository(self._session)
-        self._group_repo = SQLAlchemyGroupRepository(self._session)
-        self._post_repo = SQLAlchemyPostRepository(self._session)
-        self._post_attempt_repo = SQLAlchemyPostAttemptRepository(self._session)
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, traceback) -> bool:
-        if self._session is None:
+        self._depth -= 1
+        if self._depth > 0:
             return False
 
-        try:
-            if exc_type:
-                await self._session.rollback()
-            else:
-                await self._session.commit()
-        finally:
-            await self._session.close()
-            self._session = None
-            self._user_repo = None
-            self._settings_repo = None
-            self._bot_repo = None
-            self._group_repo = None
-            self._post_repo = None
-            self._post_attempt_repo = None
-
+        self._wrote = False
+        committed = False
+        if self._session is None:
+            # Сессия не открывалась — фиксировать нечего
+            committed = exc_type is None
+        else:
+            try:
+                if exc_type or self._read_only:
+                    await self._session.rollback()
+                else:
+                    await self._session.commit()
+                    committed = True
+            finally:
+                await self._session.close()
+                self._session = None
+                self._reset_repos()
+                if not committed:
+                    self._after_commit.clear()
+
+        if committed:
+            await self._run_after_commit()
         return False
 
+    def _on_flush(self, session: Any, flush_context: Any) -> None:
+        self._wrote = True
+
+    def _on_execute(self, orm_execute_state: Any) -> None:
+        # Массовые update/delete и сырой SQL идут мимо flush
+        if not orm_execute_state.is_select:
+            self._wrote = True
+
+    def _reset_repos(self) -> None:
+        self._user_repo = None
+        self._settings_repo = None
+        self._bot_repo = None
+        self._group_repo = None
+        self._post_repo = None
+        self._post_attempt_repo = None
+        self._git_remote_head_repo = None
+
     # ---------- optional helpers ----------
 
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """Run ``callback`` (sync or async) after the transaction commits; dropped on rollback."""
+        self._after_commit.append(callback)
+
     async def commit(self) -> None:
         await self.session.commit()
+        await self._run_after_commit()
 
     async def rollback(self) -> None:
         await self.session.rollback()
-
-
-def get_uow() -> SQLAlchemyUnitOfWork:
-    return SQLAlchemyUnitOfWork(SessionFactory)
+        self._after_commit.clear()
+
+    async def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                # Данные уже зафиксированы — ошибку колбэка (например, Redis) только логируем
+                logger.warning(f"after_commit callback failed: {type(e).__name__}: {e}")
+
+
+def get_uow(kind: SessionKind = "default", *, read_only: bool = False) -> SQLAlchemyUnitOfWork:
+    """Unit of work on the pool of the given workload (posting, heartbeat, admin).
+
+    With ``read_only=True`` the session goes to the replica while it is in sync
+    and falls back to the ``kind`` pool on the primary otherwise.
+    """
+    return SQLAlchemyUnitOfWork(get_session_factory(kind), read_only=read_only)
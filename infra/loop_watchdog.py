@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from infra.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+
+
+class LoopWatchdog:
+    """
+    Следит за задержкой event loop, который делят polling, heartbeat и раннер.
+
+    Задача в цикле раз в interval_s засыпает, пишет в event_loop_lag_seconds,
+    насколько позже срока проснулась, и отмечает «тик». Пока цикл заблокирован,
+    задача не выполняется, поэтому стек снимает фоновый поток: если с последнего
+    тика прошло больше interval_s + threshold_s, он берёт кадр потока цикла из
+    sys._current_frames() и логирует стек блокирующего кода — один раз на
+    каждую остановку.
+    """
+
+    def __init__(self, interval_s: float = 0.5, threshold_s: float = 0.5) -> None:
+        self.interval_s = interval_s
+        self.threshold_s = threshold_s
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_stop = threading.Event()
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._start_thread()
+        try:
+            while not stop_event.is_set():
+                expected = loop.time() + self.interval_s
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.interval_s)
+                if stop_event.is_set():
+                    break
+                lag = max(0.0, loop.time() - expected)
+                EVENT_LOOP_LAG.observe(lag)
+                if lag > self.threshold_s:
+                    EVENT_LOOP_STALLS.inc()
+                    logger.warning(f"Event loop lag {lag * 1e3:.0f} ms (threshold {self.threshold_s * 1e3:.0f} ms)")
+                self._last_tick = time.monotonic()
+        finally:
+            self._thread_stop.set()
+            if self._thread is not None:
+                self._thread.join(timeout=self.interval_s * 2)
+                self._thread = None
+
+    def _start_thread(self) -> None:
+        self._thread_stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def _watch(self) -> None:
+        reported_tick: Optional[float] = None
+        stall_after = self.interval_s + self.threshold_s
+        while not self._thread_stop.wait(self.interval_s / 2):
+            tick = self._last_tick
+            stalled_for = time.monotonic() - tick
+            if stalled_for <= stall_after or reported_tick == tick:
+                continue
+            reported_tick = tick
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                f"Event loop blocked for {stalled_for * 1e3:.0f} ms, loop thread stack:\n{stack}"
+            )
+
+
+def configure_asyncio_debug(loop: asyncio.AbstractEventLoop, enabled: bool, slow_callback_s: float) -> None:
+    """Debug-режим asyncio: логирует колбэки дольше slow_callback_s и незавершённые корутины."""
+    if not enabled:
+        return
+    loop.set_debug(True)
+    loop.slow_callback_duration = slow_callback_s
+    logger.info(f"asyncio debug mode on, slow_callback_duration={slow_callback_s}s")
+
+
+__all__ = ["LoopWatchdog", "configure_asyncio_debug"]
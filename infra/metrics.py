@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+# Метрики регистрируются в REGISTRY по умолчанию при импорте модуля;
+# HTTP-эндпоинт поднимает start_metrics_server, если METRICS_ENABLED
+
+_FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+POSTS_SENT = Counter("posts_sent_total", "Posts forwarded to Telegram successfully")
+POSTS_FAILED = Counter("posts_failed_total", "Posts that failed to send", labelnames=["error_type"])
+TELEGRAM_REQUEST_DURATION = Histogram(
+    "telegram_request_duration_seconds",
+    "Bot API request latency",
+    labelnames=["method", "outcome"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+POSTING_SCHEDULE_LAG = Histogram(
+    "posting_schedule_lag_seconds",
+    "Delay between the moment a post became due and its send",
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+POSTING_READY_QUEUE = Gauge("posting_ready_queue", "Posts ready to send in the current batch")
+
+DB_REPOSITORY_CALL_DURATION = Histogram(
+    "db_repository_call_duration_seconds",
+    "Repository method latency, including pool checkout",
+    labelnames=["repository", "method"],
+    buckets=_FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection (includes connecting)",
+    labelnames=["kind"],
+    buckets=_FAST_BUCKETS,
+)
+
+HEARTBEAT_DURATION = Histogram(
+    "heartbeat_duration_seconds",
+    "Duration of one heartbeat iteration",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+GIT_CHECK_DURATION = Histogram(
+    "git_check_duration_seconds",
+    "Duration of a git revision check",
+    labelnames=["result"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+GIT_FETCHES = Counter(
+    "git_fetch_total",
+    "git fetch runs during revision checks (skipped when ls-remote matches local refs)",
+    labelnames=["outcome"],
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop wakes up a periodic timer",
+    buckets=_FAST_BUCKETS,
+)
+EVENT_LOOP_STALLS = Counter(
+    "event_loop_stalls_total",
+    "Timer wake-ups later than LOOP_WATCHDOG_THRESHOLD_S",
+)
+
+
+def start_metrics_server(config: Config) -> bool:
+    """Serve /metrics on METRICS_ADDR:METRICS_PORT in a background thread."""
+    if not config.METRICS_ENABLED:
+        return False
+    start_http_server(config.METRICS_PORT, addr=config.METRICS_ADDR)
+    logger.info(f"Prometheus metrics on http://{config.METRICS_ADDR}:{config.METRICS_PORT}/metrics")
+    return True
+
+
+__all__ = [
+    "POSTS_SENT",
+    "POSTS_FAILED",
+    "TELEGRAM_REQUEST_DURATION",
+    "POSTING_SCHEDULE_LAG",
+    "POSTING_READY_QUEUE",
+    "DB_REPOSITORY_CALL_DURATION",
+    "DB_POOL_CHECKOUT_WAIT",
+    "HEARTBEAT_DURATION",
+    "GIT_CHECK_DURATION",
+    "GIT_FETCHES",
+    "EVENT_LOOP_LAG",
+    "EVENT_LOOP_STALLS",
+    "start_metrics_server",
+]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar
+
+from config.settings import Config
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import Span, Tracer
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "autoposter_node"
+
+# Пока трассировка не включена, _tracer = None и обёртки вызывают код напрямую,
+# без обращения к opentelemetry (SDK импортируется только в configure_tracing)
+_provider: Optional["TracerProvider"] = None
+_tracer: Optional["Tracer"] = None
+
+ClsT = TypeVar("ClsT", bound=type)
+
+
+def configure_tracing(config: Config, exporter: Optional["SpanExporter"] = None) -> bool:
+    """
+    Включает трассировку, если TRACING_ENABLED или передан exporter.
+
+    Без exporter спаны уходят батчами в OTLP/HTTP (TRACING_OTLP_ENDPOINT или
+    OTEL_EXPORTER_OTLP_ENDPOINT); переданный exporter (например, in-memory
+    в тестах) получает каждый спан сразу. Корневые спаны сэмплируются с
+    долей TRACING_SAMPLE_RATIO, дочерние следуют решению родителя.
+    """
+    global _provider, _tracer
+    if not config.TRACING_ENABLED and exporter is None:
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": config.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(config.TRACING_SAMPLE_RATIO)),
+    )
+    if exporter is None:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=config.TRACING_OTLP_ENDPOINT)))
+    else:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    shutdown_tracing()
+    _provider = provider
+    _tracer = provider.get_tracer(TRACER_NAME)
+    logger.info(f"Tracing enabled: sample_ratio={config.TRACING_SAMPLE_RATIO}")
+    return True
+
+
+def in_memory_tracing(config: Config, sample_ratio: float = 1.0) -> "InMemorySpanExporter":
+    """Трассировка в память для тестов: finished spans читаются через get_finished_spans()."""
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    configure_tracing(config.model_copy(update={"TRACING_SAMPLE_RATIO": sample_ratio}), exporter)
+    return exporter
+
+
+def shutdown_tracing() -> None:
+    """Сбрасывает накопленные спаны и выключает трассировку."""
+    global _provider, _tracer
+    if _provider is not None:
+        _provider.shutdown()
+    _provider = None
+    _tracer = None
+
+
+def get_tracer() -> Optional["Tracer"]:
+    return _tracer
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional["Span"]]:
+    """Спан вокруг блока; без включённой трассировки ничего не делает."""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, attributes=_clean(attributes)) as current:
+        yield current
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Декоратор async-функции: спан с именем name на каждый вызов."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with _tracer.start_as_current_span(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_use_case(cls: ClsT) -> ClsT:
+    """Спан usecase.<ИмяКласса> вокруг __call__ use case."""
+    cls.__call__ = traced(f"usecase.{cls.__name__}")(cls.__call__)  # type: ignore[attr-defined]
+    return cls
+
+
+def instrument_engine(engine: Any) -> None:
+    """
+    Спан на каждый SQL-запрос через события движка.
+
+    Спан открывается в before_cursor_execute дочерним к текущему (метод
+    репозитория, use case, отправка поста) и закрывается в after_cursor_execute
+    или handle_error. Контекст в greenlet SQLAlchemy переносится из задачи.
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    pool_name = getattr(sync_engine.pool, "_orig_logging_name", None) or "default"
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _tracer is None or context is None:
+            return
+        from opentelemetry.trace import SpanKind
+
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        context._otel_span = _tracer.start_span(
+            f"db.{operation}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.operation": operation,
+                "db.statement": statement[:2000],
+                "db.pool": pool_name,
+            },
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        current = getattr(context, "_otel_span", None)
+        if current is not None:
+            current.end()
+            context._otel_span = None
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context) -> None:
+        context = exception_context.execution_context
+        current = getattr(context, "_otel_span", None) if context is not None else None
+        if current is None:
+            return
+        from opentelemetry.trace import Status, StatusCode
+
+        current.record_exception(exception_context.original_exception)
+        current.set_status(Status(StatusCode.ERROR))
+        current.end()
+        context._otel_span = None
+
+
+def _clean(attributes: dict[str, Any]) -> dict[str, Any]:
+    # OTel принимает только str/bool/int/float; None отбрасываем, остальное — в строку
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+__all__ = [
+    "configure_tracing",
+    "in_memory_tracing",
+    "shutdown_tracing",
+    "get_tracer",
+    "is_tracing_enabled",
+    "span",
+    "traced",
+    "traced_use_case",
+    "instrument_engine",
+]
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from bootstrap import init_app
+from config.app_setup import run_event_loop
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     try:
-        asyncio.run(init_app())
+        run_event_loop(get_settings(), init_app())
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
 
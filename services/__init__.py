@@ -6,6 +6,7 @@ from .post_attempt_service import PostAttemptService
 from .user_service import UserService
 from .system_service import SystemService
 from .notification_service import NotificationService
+from .git_remote_head_service import GitRemoteHeadService
 from .posting.posting_runner import PostingRunner
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     "UserService",
     "SystemService",
     "NotificationService",
+    "GitRemoteHeadService",
     "PostingRunner",
 ]
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from typing import Any, Optional
 from uuid import UUID
 
-from common.dto import BotDTO
+from common.dto import BotDTO, BotHeartbeatDTO
+from infra.cache import RedisCache
 from infra.db.models import Bot
 from infra.db.repo import SQLAlchemyBotRepository
+from infra.db.uow import SQLAlchemyUnitOfWork
+
+LOADS_CACHE_BUCKET = "bot_loads"
 
 
 class BotService:
-    def __init__(self, repo: SQLAlchemyBotRepository) -> None:
+    def __init__(
+        self,
+        repo: SQLAlchemyBotRepository,
+        cache: Optional[RedisCache] = None,
+        *,
+        uow: Optional[SQLAlchemyUnitOfWork] = None,
+    ) -> None:
         self._repo = repo
+        self._cache = cache
+        # Кэш сбрасывается после коммита uow, иначе параллельный читатель
+        # успевает положить в него старое значение
+        self._uow = uow
 
     async def get(self, bot_id: UUID) -> Optional[BotDTO]:
         bot = await self._repo.get(bot_id)
@@ -30,8 +45,8 @@ class BotService:
         return BotDTO.from_model(bot) if bot else None
 
     async def list(self, *, limit: int = 100, offset: int = 0) -> list[BotDTO]:
-        bots = await self._repo.list(limit=limit, offset=offset)
-        return [BotDTO.from_model(bot) for bot in bots]
+        rows = await self._repo.list(limit=limit, offset=offset)
+        return BotDTO.from_rows(rows)
 
     async def search(
         self,
@@ -42,14 +57,14 @@ class BotService:
         limit: int = 100,
         offset: int = 0,
     ) -> list[BotDTO]:
-        bots = await self._repo.search(
+        rows = await self._repo.search(
             username_like=username_like,
             name_like=name_like,
             active_only=active_only,
             limit=limit,
             offset=offset,
         )
-        return [BotDTO.from_model(bot) for bot in bots]
+        return BotDTO.from_rows(rows)
 
     async def count(
         self,
@@ -73,16 +88,28 @@ class BotService:
         return BotDTO.from_model(bot)
 
     async def update_fields(self, bot_id: UUID, **fields: Any) -> BotDTO:
-        bot = await self._repo.get(bot_id)
+        bot = await self._repo.update_fields(bot_id, **fields)
         if not bot:
             raise ValueError(f"Bot {bot_id} not found")
-        if fields:
-            bot.update(**fields)
-            await self._repo.update(bot)
         return BotDTO.from_model(bot)
 
     async def delete(self, bot_id: UUID) -> None:
         await self._repo.delete(bot_id)
+        await self._invalidate_cache()
+
+    async def _invalidate_cache(self) -> None:
+        if self._cache is None:
+            return
+        invalidate = partial(self._cache.invalidate, LOADS_CACHE_BUCKET)
+        if self._uow is not None:
+            self._uow.after_commit(invalidate)
+        else:
+            await invalidate()
+
+    async def heartbeat(self, token: str, **fields: Any) -> Optional[BotHeartbeatDTO]:
+        """Mark the bot alive (and store ``fields``) in one round trip."""
+        row = await self._repo.heartbeat(token, **fields)
+        return BotHeartbeatDTO(*row) if row else None
 
     async def update_heartbeat(self, bot_id: UUID, when: Optional[datetime] = None) -> None:
         await self._repo.update_heartbeat(bot_id, when)
@@ -100,7 +127,17 @@ class BotService:
         return await self._repo.count_active_posts(bot_id)
 
     async def loads_by_bot(self, bot_ids: Optional[list[UUID]] = None) -> dict[UUID, int]:
-        return await self._repo.loads_by_bot(bot_ids)
+        if self._cache is None:
+            return await self._repo.loads_by_bot(bot_ids)
+
+        field = ",".join(sorted(str(bot_id) for bot_id in bot_ids)) if bot_ids else "*"
+        cached = await self._cache.get(LOADS_CACHE_BUCKET, field)
+        if cached is not None:
+            return {UUID(bot_id): count for bot_id, count in cached.items()}
+
+        loads = await self._repo.loads_by_bot(bot_ids)
+        await self._cache.set(LOADS_CACHE_BUCKET, field, loads)
+        return loads
 
     async def set_force_update_all(self) -> int:
         """Set force_update flag to True for all active bots."""
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from common.dto import GitRemoteHeadDTO
+from infra.db.repo import SQLAlchemyGitRemoteHeadRepository
+
+
+class GitRemoteHeadService:
+    """Общая для флота запись о последнем коммите ветки на remote."""
+
+    def __init__(self, repo: SQLAlchemyGitRemoteHeadRepository) -> None:
+        self._repo = repo
+
+    async def get(self, branch: str) -> Optional[GitRemoteHeadDTO]:
+        head = await self._repo.get(branch)
+        return GitRemoteHeadDTO.from_model(head) if head else None
+
+    async def claim_refresh(self, branch: str, *, owner: str, max_age_s: float, lease_s: float) -> bool:
+        return await self._repo.claim_refresh(branch, owner=owner, max_age_s=max_age_s, lease_s=lease_s)
+
+    async def publish(self, branch: str, commit_hash: str, *, owner: str) -> bool:
+        return await self._repo.publish(branch, commit_hash, owner=owner)
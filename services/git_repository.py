@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import contextlib
+import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
+
+from infra.metrics import GIT_CHECK_DURATION, GIT_FETCHES
 
 
 class GitRepositoryError(RuntimeError):
@@ -17,10 +23,19 @@ class GitRevisionStatus:
     remote_commit: str
     commits_behind: int
     checked_at: datetime
+    fetched: bool = False
+    duration_s: float = 0.0
 
 
 class GitRepositoryTracker:
-    """Thin wrapper over git CLI to detect local vs remote revisions."""
+    """Thin async wrapper over git CLI to detect local vs remote revisions.
+
+    Every git call runs as an asyncio subprocess with a timeout; on timeout or
+    cancellation the process is killed. The remote head is taken with
+    ``git ls-remote`` (or passed in from the fleet-wide record, see
+    ``GitRemoteHeadService``) and ``git fetch`` runs only when that commit is
+    not in the local object store yet.
+    """
 
     def __init__(
         self,
@@ -29,11 +44,15 @@ class GitRepositoryTracker:
         remote: str = "origin",
         branch: str = "main",
         auto_fetch: bool = True,
+        command_timeout_s: float = 10.0,
+        fetch_timeout_s: float = 60.0,
     ) -> None:
         self._repo_path = repo_path
         self._remote = remote
         self._branch = branch
         self._auto_fetch = auto_fetch
+        self._command_timeout_s = command_timeout_s
+        self._fetch_timeout_s = fetch_timeout_s
 
     @property
     def repo_path(self) -> Path:
@@ -50,16 +69,44 @@ class GitRepositoryTracker:
     def is_available(self) -> bool:
         return (self._repo_path / ".git").exists()
 
-    def check_status(self) -> GitRevisionStatus:
+    async def check_status(self, remote_commit: Optional[str] = None) -> GitRevisionStatus:
+        """Compare HEAD with the remote branch; ``remote_commit`` skips the ls-remote call."""
+        started = time.perf_counter()
+        result = "error"
+        try:
+            status = await self._check_status(remote_commit)
+            result = "fetched" if status.fetched else "ok"
+            status.duration_s = time.perf_counter() - started
+            return status
+        except asyncio.CancelledError:
+            result = "cancelled"
+            raise
+        finally:
+            GIT_CHECK_DURATION.labels(result=result).observe(time.perf_counter() - started)
+
+    async def _check_status(self, remote_commit: Optional[str]) -> GitRevisionStatus:
         if not self.is_available():
             raise GitRepositoryError(f"Git repository not found at {self._repo_path}")
 
-        if self._auto_fetch:
-            self._run_git("fetch", "--prune", self._remote, self._branch)
+        local_commit = await self._run_git("rev-parse", "HEAD")
+        fetched = False
 
-        local_commit = self._run_git("rev-parse", "HEAD")
-        remote_commit = self._run_git("rev-parse", self.remote_ref)
-        behind_raw = self._run_git("rev-list", "--count", f"{local_commit}..{self.remote_ref}")
+        if self._auto_fetch:
+            if remote_commit is None:
+                remote_commit = await self.remote_head()
+            if not await self._has_commit(remote_commit):
+                await self._run_git(
+                    "fetch", "--prune", self._remote, self._branch, timeout=self._fetch_timeout_s
+                )
+                GIT_FETCHES.labels(outcome="fetched").inc()
+                fetched = True
+            else:
+                GIT_FETCHES.labels(outcome="skipped").inc()
+        elif remote_commit is None:
+            # Без сети: сравниваем с тем, что уже лежит в refs/remotes
+            remote_commit = await self._run_git("rev-parse", self.remote_ref)
+
+        behind_raw = await self._run_git("rev-list", "--count", f"{local_commit}..{remote_commit}")
         commits_behind = int(behind_raw or "0")
 
         return GitRevisionStatus(
@@ -68,24 +115,64 @@ class GitRepositoryTracker:
             remote_commit=remote_commit,
             commits_behind=max(commits_behind, 0),
             checked_at=datetime.now(timezone.utc),
+            fetched=fetched,
         )
 
-    def _run_git(self, *args: str) -> str:
+    async def remote_head(self) -> str:
+        """Commit the tracked branch points to on the remote (``git ls-remote``)."""
+        ref = f"refs/heads/{self._branch}"
+        output = await self._run_git("ls-remote", self._remote, ref, timeout=self._fetch_timeout_s)
+        for line in output.splitlines():
+            sha, _, name = line.partition("\t")
+            if name == ref:
+                return sha
+        raise GitRepositoryError(f"Branch {self._branch} not found on remote {self._remote}")
+
+    async def _has_commit(self, sha: str) -> bool:
+        try:
+            await self._run_git("cat-file", "-e", f"{sha}^{{commit}}")
+        except GitRepositoryError:
+            return False
+        return True
+
+    async def _run_git(self, *args: str, timeout: Optional[float] = None) -> str:
+        timeout = self._command_timeout_s if timeout is None else timeout
         try:
-            result = subprocess.run(
-                ["git", *args],
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
                 cwd=self._repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Не ждём ввода логина/пароля, если remote требует авторизацию
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
             )
         except FileNotFoundError as exc:
             raise GitRepositoryError("git executable is not available") from exc
 
-        if result.returncode != 0:
-            stderr = result.stderr.strip()
-            raise GitRepositoryError(f"git {' '.join(args)} failed: {stderr or 'unknown error'}")
-        return result.stdout.strip()
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError as exc:
+            await _kill(proc)
+            raise GitRepositoryError(f"git {' '.join(args)} timed out after {timeout:.0f}s") from exc
+        except asyncio.CancelledError:
+            await _kill(proc)
+            raise
+
+        if proc.returncode != 0:
+            message = stderr.decode(errors="replace").strip()
+            raise GitRepositoryError(f"git {' '.join(args)} failed: {message or 'unknown error'}")
+        return stdout.decode(errors="replace").strip()
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        # Забираем код возврата, чтобы не оставлять зомби
+        with contextlib.suppress(Exception):
+            await proc.wait()
 
 
 __all__ = [
@@ -32,6 +32,11 @@ class GroupService:
         group = await self._repo.get(group_id)
         return GroupDTO.from_model(group) if group else None
 
+    async def list_by_ids(self, group_ids: list[UUID]) -> list[GroupDTO]:
+        """Groups in the order of group_ids; unknown ids are skipped."""
+        groups = {group.id: group for group in await self._repo.list_by_ids(group_ids)}
+        return [GroupDTO.from_model(groups[group_id]) for group_id in group_ids if group_id in groups]
+
     async def get_by_tg_chat_id(self, tg_chat_id: int) -> Optional[GroupDTO]:
         group = await self._repo.get_by_tg_chat_id(tg_chat_id)
         return GroupDTO.from_model(group) if group else None
@@ -63,8 +68,8 @@ class GroupService:
         return [GroupDTO.from_model(group) for group in groups]
 
     async def list_bound(self, *, limit: int = 1000, offset: int = 0) -> list[GroupDTO]:
-        groups = await self._repo.list_bound(limit=limit, offset=offset)
-        return [GroupDTO.from_model(group) for group in groups]
+        rows = await self._repo.list_bound(limit=limit, offset=offset)
+        return GroupDTO.from_rows(rows)
 
     async def count_bound(self) -> int:
         return await self._repo.count_bound()
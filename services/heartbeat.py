@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import socket
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from infra.db.uow import SQLAlchemyUnitOfWork
+from infra.db.session import pool_usages
+from infra.db.uow import get_uow
 from services.bot_service import BotService
 from services.settings_service import SettingsService
 from services.user_service import UserService
 from services.system_service import SystemService
 from services.notification_service import NotificationService
-from services.git_repository import GitRepositoryTracker, GitRepositoryError
+from services.git_remote_head_service import GitRemoteHeadService
+from services.git_repository import GitRepositoryTracker, GitRepositoryError, GitRevisionStatus
 from bot.builder.instance_bot import create_bot
 from config.settings import get_settings
+from infra.cache import get_cache
+from infra.metrics import HEARTBEAT_DURATION
 from common.usecases import BotInitializationUseCase
 
 logger = logging.getLogger(__name__)
@@ -22,8 +28,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_HEARTBEAT_INTERVAL = 15
 
 
-async def _heartbeat_worker(token: str, stop_event: asyncio.Event) -> None:
-    """Periodically update bot heartbeat timestamp while respecting shutdown event."""
+async def _heartbeat_worker(
+    token: str,
+    stop_event: asyncio.Event,
+    wake_event: Optional[asyncio.Event] = None,
+) -> None:
+    """Periodically update bot heartbeat timestamp while respecting shutdown event.
+
+    Setting ``wake_event`` (force_update NOTIFY) runs the next iteration right
+    away, including the git check, instead of waiting for the interval.
+    """
     logger.info("Heartbeat worker started")
 
     interval: int = DEFAULT_HEARTBEAT_INTERVAL
@@ -35,20 +49,41 @@ async def _heartbeat_worker(token: str, stop_event: asyncio.Event) -> None:
         repo_path=settings.base_dir,
         remote=settings.GIT_REMOTE,
         branch=settings.GIT_BRANCH,
+        command_timeout_s=settings.GIT_COMMAND_TIMEOUT_S,
+        fetch_timeout_s=settings.GIT_FETCH_TIMEOUT_S,
     )
     git_check_interval = max(0, settings.GIT_CHECK_INTERVAL_S)
+    node_name = f"{socket.gethostname()}:{os.getpid()}"
     next_git_check_at = 0.0
 
     try:
         while not stop_event.is_set():
             interval = DEFAULT_HEARTBEAT_INTERVAL
+            iteration_started = loop.time()
             try:
-                async with SQLAlchemyUnitOfWork() as uow:
-                    bot_service = BotService(uow.bot_repo)
-                    settings_service = SettingsService(uow.settings_repo)
+                # Git-статус снимаем до открытия UoW и пишем тем же UPDATE, что и heartbeat
+                status = None
+                if git_check_interval > 0 and loop.time() >= next_git_check_at:
+                    next_git_check_at = loop.time() + git_check_interval
+                    try:
+                        remote_commit = None
+                        if settings.GIT_SHARED_REMOTE_HEAD:
+                            remote_commit = await _shared_remote_commit(
+                                git_tracker,
+                                owner=node_name,
+                                max_age_s=git_check_interval,
+                                lease_s=settings.GIT_FETCH_TIMEOUT_S * 2,
+                            )
+                        status = await git_tracker.check_status(remote_commit)
+                    except GitRepositoryError:
+                        logger.warning("Git revision check failed", exc_info=True)
+                git_fields = _git_fields(status) if status is not None else {}
+
+                async with get_uow(kind="heartbeat") as uow:
+                    bot_service = BotService(uow.bot_repo, uow=uow)
 
-                    bot = await bot_service.get_by_token(token)
-                    if bot is None:
+                    beat = await bot_service.heartbeat(token, **git_fields)
+                    if beat is None:
                         logger.warning("Heartbeat worker: bot with configured token not found, attempting to create bot")
                         try:
                             # Создаем Bot через aiogram для получения информации
@@ -59,7 +94,7 @@ async def _heartbeat_worker(token: str, stop_event: asyncio.Event) -> None:
                             system_service = SystemService()
                             usecase = BotInitializationUseCase(
                                 bot_service=bot_service,
-                                settings_service=settings_service,
+                                settings_service=SettingsService(uow.settings_repo, get_cache(), uow=uow),
                                 system_service=system_service,
                             )
                             
@@ -74,128 +109,110 @@ async def _heartbeat_worker(token: str, stop_event: asyncio.Event) -> None:
                             # Закрываем сессию бота
                             await tg_bot.session.close()
                             
-                            # Получаем созданного бота
-                            bot = await bot_service.get_by_token(token)
-                            if bot:
-                                logger.info(f"Bot successfully created in database: bot_id={bot.id}, username={me.username}")
+                            # Отмечаем созданного бота
+                            beat = await bot_service.heartbeat(token, **git_fields)
+                            if beat:
+                                logger.info(f"Bot successfully created in database: bot_id={beat.id}, username={me.username}")
                             else:
                                 logger.error("Bot was created but could not be retrieved from database")
                         except Exception as e:
                             logger.error(f"Failed to create bot in heartbeat worker: {e}", exc_info=True)
                     
                     # Если бот существует (был найден или только что создан), продолжаем обработку
-                    if bot is not None:
-                        last_bot_id = bot.id
-                        await bot_service.update_heartbeat(bot.id)
-
-                        runtime_settings = await settings_service.get_current()
-                        if runtime_settings and runtime_settings.heartbeat_interval_s > 0:
-                            interval = runtime_settings.heartbeat_interval_s
-
-                        should_check_repo = git_check_interval > 0 and loop.time() >= next_git_check_at
-                        if should_check_repo:
-                            next_git_check_at = loop.time() + git_check_interval
-                            try:
-                                status = await asyncio.to_thread(git_tracker.check_status)
-                            except GitRepositoryError:
-                                logger.warning("Git revision check failed", exc_info=True)
-                            else:
-                                await bot_service.update_fields(
-                                    bot.id,
-                                    tracked_branch=status.branch,
-                                    current_commit_hash=status.local_commit,
-                                    latest_available_commit_hash=status.remote_commit,
-                                    commits_behind=status.commits_behind,
-                                    last_update_check_at=status.checked_at,
+                    if beat is not None:
+                        last_bot_id = beat.id
+                        logger.debug("DB pool usage: %s", pool_usages())
+
+                        if beat.heartbeat_interval_s and beat.heartbeat_interval_s > 0:
+                            interval = beat.heartbeat_interval_s
+
+                        if status is not None:
+                            # Check if force_update is set
+                            if beat.force_update:
+                                # Check if version is up to date
+                                is_up_to_date = (
+                                    status.commits_behind == 0
+                                    and status.local_commit
+                                    and status.remote_commit
+                                    and status.local_commit == status.remote_commit
                                 )
                                 
-                                # Reload bot to get updated force_update flag
-                                updated_bot = await bot_service.get(bot.id)
-                                if updated_bot is None:
-                                    logger.warning("Failed to reload bot after git status update")
-                                    continue
-                                
-                                # Check if force_update is set
-                                if updated_bot.force_update:
-                                    # Check if version is up to date
-                                    is_up_to_date = (
-                                        status.commits_behind == 0
-                                        and status.local_commit
-                                        and status.remote_commit
-                                        and status.local_commit == status.remote_commit
+                                # Log current status
+                                if is_up_to_date:
+                                    logger.info(
+                                        f"Force update requested for bot {beat.id}, "
+                                        f"bot is already up-to-date, executing update command"
                                     )
-                                    
-                                    # Log current status
-                                    if is_up_to_date:
-                                        logger.info(
-                                            f"Force update requested for bot {updated_bot.id}, "
-                                            f"bot is already up-to-date, executing update command"
-                                        )
-                                    else:
-                                        logger.info(
-                                            f"Force update requested for bot {updated_bot.id}, "
-                                            f"bot is {status.commits_behind} commit(s) behind, "
-                                            f"executing update command (includes git pull)"
-                                        )
-                                    
-                                    # Clear force_update flag BEFORE executing update command
-                                    # This prevents infinite restart loop since the command restarts the service
-                                    await bot_service.clear_force_update(updated_bot.id)
-                                    
-                                    # CRITICAL: Commit changes immediately to ensure flag is cleared in DB
-                                    # before the service restarts. Without this, the transaction will rollback
-                                    # and the bot will restart in an infinite loop.
-                                    await uow.commit()
-                                    logger.info(f"Cleared and committed force_update flag for bot {updated_bot.id}")
-                                    
-                                    # Execute update command (includes git pull + restart)
-                                    update_result = await asyncio.to_thread(SystemService.execute_update_command)
-                                    
-                                    if update_result.success:
-                                        logger.info(f"Update completed successfully for bot {updated_bot.id}")
-                                    else:
-                                        # Send error notification to admins
-                                        try:
-                                            user_service = UserService(uow.user_repo)
-                                            admins = await user_service.search(is_superuser=True, limit=100)
-                                            admin_ids = [admin.user_id for admin in admins]
-                                            
-                                            if admin_ids:
-                                                notification_bot = create_bot(token)
-                                                notification_service = NotificationService(notification_bot)
-                                                
-                                                # Get bot model for notification
-                                                from infra.db.models import Bot as BotModel
-                                                bot_model = await uow.bot_repo.get(updated_bot.id)
-                                                
-                                                if bot_model:
-                                                    await notification_service.notify_update_error(
-                                                        bot=bot_model,
-                                                        error_details=f"Update command failed with exit code {update_result.exit_code}",
-                                                        exit_code=update_result.exit_code,
-                                                        stdout=update_result.stdout,
-                                                        stderr=update_result.stderr,
-                                                        admin_ids=admin_ids,
-                                                    )
-                                                
-                                                await notification_bot.session.close()
-                                                
-                                        except Exception as notify_error:
-                                            logger.error(f"Failed to send update error notification: {notify_error}", exc_info=True)
+                                else:
+                                    logger.info(
+                                        f"Force update requested for bot {beat.id}, "
+                                        f"bot is {status.commits_behind} commit(s) behind, "
+                                        f"executing update command (includes git pull)"
+                                    )
+                                
+                                # Clear force_update flag BEFORE executing update command
+                                # This prevents infinite restart loop since the command restarts the service
+                                await bot_service.clear_force_update(beat.id)
+                                
+                                # CRITICAL: Commit changes immediately to ensure flag is cleared in DB
+                                # before the service restarts. Without this, the transaction will rollback
+                                # and the bot will restart in an infinite loop.
+                                await uow.commit()
+                                logger.info(f"Cleared and committed force_update flag for bot {beat.id}")
+                                
+                                # Execute update command (includes git pull + restart)
+                                update_result = await asyncio.to_thread(SystemService.execute_update_command)
+                                
+                                if update_result.success:
+                                    logger.info(f"Update completed successfully for bot {beat.id}")
+                                else:
+                                    # Send error notification to admins
+                                    try:
+                                        user_service = UserService(uow.user_repo)
+                                        admins = await user_service.search(is_superuser=True, limit=100)
+                                        admin_ids = [admin.user_id for admin in admins]
                                         
-                                        logger.error(
-                                            f"Update failed for bot {updated_bot.id}: exit_code={update_result.exit_code}, "
-                                            f"stderr={update_result.stderr[:200]}"
-                                        )
+                                        if admin_ids:
+                                            notification_bot = create_bot(token)
+                                            notification_service = NotificationService(notification_bot)
+                                            
+                                            # Get bot model for notification
+                                            from infra.db.models import Bot as BotModel
+                                            bot_model = await uow.bot_repo.get(beat.id)
+                                            
+                                            if bot_model:
+                                                await notification_service.notify_update_error(
+                                                    bot=bot_model,
+                                                    error_details=f"Update command failed with exit code {update_result.exit_code}",
+                                                    exit_code=update_result.exit_code,
+                                                    stdout=update_result.stdout,
+                                                    stderr=update_result.stderr,
+                                                    admin_ids=admin_ids,
+                                                )
+                                            
+                                            await notification_bot.session.close()
+                                            
+                                    except Exception as notify_error:
+                                        logger.error(f"Failed to send update error notification: {notify_error}", exc_info=True)
+                                    
+                                    logger.error(
+                                        f"Update failed for bot {beat.id}: exit_code={update_result.exit_code}, "
+                                        f"stderr={update_result.stderr[:200]}"
+                                    )
 
             except Exception:
                 logger.exception("Heartbeat worker iteration failed")
+            HEARTBEAT_DURATION.observe(loop.time() - iteration_started)
 
             interval = max(1, interval)
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=interval)
-            except asyncio.TimeoutError:
-                continue
+            if wake_event is None:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    continue
+            elif await _wait_for_wake(stop_event, wake_event, interval):
+                wake_event.clear()
+                next_git_check_at = 0.0
     except asyncio.CancelledError:
         logger.info("Heartbeat worker cancelled")
         raise
@@ -207,4 +224,62 @@ async def _heartbeat_worker(token: str, stop_event: asyncio.Event) -> None:
         logger.info("Heartbeat worker stopped")
 
 
+async def _wait_for_wake(stop_event: asyncio.Event, wake_event: asyncio.Event, timeout: float) -> bool:
+    """Sleep up to ``timeout``; True if woken by ``wake_event``."""
+    waiters = [asyncio.create_task(stop_event.wait()), asyncio.create_task(wake_event.wait())]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+    return wake_event.is_set() and not stop_event.is_set()
+
+
+async def _shared_remote_commit(
+    git_tracker: GitRepositoryTracker,
+    *,
+    owner: str,
+    max_age_s: float,
+    lease_s: float,
+) -> Optional[str]:
+    """Remote head from the fleet-wide record; this node refreshes it only when it wins the lease.
+
+    None means the record is not usable yet (first refresh in progress, table
+    unavailable), and the caller falls back to its own ``git ls-remote``.
+    """
+    try:
+        # Lease фиксируем отдельной транзакцией, чтобы остальные ноды её видели
+        async with get_uow(kind="heartbeat") as uow:
+            service = GitRemoteHeadService(uow.git_remote_head_repo)
+            claimed = await service.claim_refresh(
+                git_tracker.branch, owner=owner, max_age_s=max_age_s, lease_s=lease_s
+            )
+            head = None if claimed else await service.get(git_tracker.branch)
+    except Exception:
+        logger.warning("Shared git remote head is unavailable, checking remote directly", exc_info=True)
+        return None
+
+    if not claimed:
+        return head.commit_hash if head else None
+
+    commit = await git_tracker.remote_head()
+    async with get_uow(kind="heartbeat") as uow:
+        published = await GitRemoteHeadService(uow.git_remote_head_repo).publish(
+            git_tracker.branch, commit, owner=owner
+        )
+    if published:
+        logger.debug(f"Published remote head {commit[:12]} of {git_tracker.branch}")
+    return commit
+
+
+def _git_fields(status: GitRevisionStatus) -> dict:
+    return {
+        "tracked_branch": status.branch,
+        "current_commit_hash": status.local_commit,
+        "latest_available_commit_hash": status.remote_commit,
+        "commits_behind": status.commits_behind,
+        "last_update_check_at": status.checked_at,
+    }
+
+
 __all__ = ["_heartbeat_worker"]
\ No newline at end of file
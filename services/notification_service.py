@@ -7,8 +7,8 @@ from aiogram import Bot
 from common.enums.telegram_error import TelegramErrorType
 
 if TYPE_CHECKING:
-    from infra.db.models import Bot as BotDB, Post
-    from common.dto import GroupDTO
+    from infra.db.models import Bot as BotDB
+    from common.dto import GroupDTO, PostingJob
 
 logger = getLogger(__name__)
 
@@ -46,7 +46,7 @@ class NotificationService:
         self,
         bot: BotDB,
         group: GroupDTO,
-        post: Post,
+        post: PostingJob,
         error_type: TelegramErrorType,
         error_message: str,
         admin_ids: list[int],
@@ -16,6 +16,9 @@ class PostAttemptService:
         await self._uow.post_attempt_repo.add(attempt)
         return attempt
 
+    async def mark_deleted(self, attempt_id: UUID) -> None:
+        await self._uow.post_attempt_repo.mark_deleted(attempt_id)
+
     async def count_success_in_period(self, *, bot_id: Optional[UUID], seconds: int) -> int:
         return await self._uow.post_attempt_repo.count_success_in_period(bot_id=bot_id, seconds=seconds)
 
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+from datetime import datetime
+from functools import partial
 from typing import Optional, Iterable
 from uuid import UUID
 
-from common.dto import PostDTO, GroupDTO, DistributionContextDTO
+from common.dto import PostDTO, GroupDTO, DistributionContextDTO, PostingJob
+from infra.cache import RedisCache
 from infra.db.models import PostStatus, Post
 from infra.db.uow import SQLAlchemyUnitOfWork
 
+from .bot_service import LOADS_CACHE_BUCKET
+
+SUMMARY_CACHE_BUCKET = "dist_summary"
+
 class PostService:
-    def __init__(self, uow: SQLAlchemyUnitOfWork) -> None:
+    def __init__(self, uow: SQLAlchemyUnitOfWork, cache: Optional[RedisCache] = None) -> None:
         self._uow = uow
+        self._cache = cache
 
     async def get(self, post_id: UUID) -> Optional[PostDTO]:
         async with self._uow:
@@ -64,6 +72,7 @@ class PostService:
             target_attempts=target_attempts,
             notify_on_failure=notify_on_failure,
         )
+        await self._invalidate_cache()
         return post
 
     async def find_unassigned_active(self, *, limit: int = 100, offset: int = 0) -> list[PostDTO]:
@@ -75,29 +84,30 @@ class PostService:
 
     async def assign_to_bot(self, post_id: UUID, bot_id: UUID) -> None:
         await self._uow.post_repo.assign_to_bot(post_id, bot_id)
+        await self._invalidate_cache()
 
     async def bulk_unassign_by_bot(self, bot_id: UUID) -> int:
-        return await self._uow.post_repo.bulk_unassign_by_bot(bot_id)
+        result = await self._uow.post_repo.bulk_unassign_by_bot(bot_id)
+        await self._invalidate_cache()
+        return result
 
     async def bulk_pause_by_bot(self, bot_id: UUID) -> int:
-        return await self._uow.post_repo.bulk_pause_by_bot(bot_id)
+        result = await self._uow.post_repo.bulk_pause_by_bot(bot_id)
+        await self._invalidate_cache()
+        return result
 
     async def mark_error(self, post_id: UUID, error: str) -> None:
         await self._uow.post_repo.mark_error(post_id, error)
 
-    async def mark_done(self, post_id: UUID) -> None:
-        await self._uow.post_repo.mark_done(post_id)
-
     async def touch_attempt_time(self, post_id: UUID) -> None:
         await self._uow.post_repo.touch_attempt_time(post_id)
 
-    async def increment_attempt_count(self, post_id: UUID) -> None:
-        """Atomically increment count_attempts and update last_attempt_at."""
-        await self._uow.post_repo.increment_attempt_count(post_id)
+    async def register_success(self, post_id: UUID) -> Optional[tuple[int, str]]:
+        """Count a successful send and close the post once target_attempts is reached."""
+        return await self._uow.post_repo.register_success(post_id)
 
-    async def list_by_bot(self, bot_id: UUID, *, limit: int = 100, offset: int = 0):
-        posts = await self._uow.post_repo.list_by_bot(bot_id, limit=limit, offset=offset)
-        return posts
+    async def list_posting_jobs(self, bot_id: UUID, *, limit: int = 100) -> list[PostingJob]:
+        return await self._uow.post_repo.list_posting_jobs(bot_id, limit=limit)
 
     async def list_by_group(self, group_id: UUID, *, limit: int = 100, offset: int = 0) -> list[PostDTO]:
         posts = await self._uow.post_repo.list_by_group(group_id, limit=limit, offset=offset)
@@ -114,25 +124,31 @@ class PostService:
         return await self._uow.post_repo.count_errors_for_bot(bot_id)
 
     async def delete_active_by_groups(self, group_ids: list[UUID]) -> int:
-        return await self._uow.post_repo.delete_active_by_groups(group_ids)
+        result = await self._uow.post_repo.delete_active_by_groups(group_ids)
+        await self._invalidate_cache()
+        return result
 
     async def bulk_pause_distribution(
         self,
         *,
         distribution_name: str | None,
     ) -> int:
-        return await self._uow.post_repo.bulk_pause_by_distribution(
+        result = await self._uow.post_repo.bulk_pause_by_distribution(
             distribution_name=distribution_name,
         )
+        await self._invalidate_cache()
+        return result
 
     async def bulk_resume_distribution(
         self,
         *,
         distribution_name: str | None,
     ) -> int:
-        return await self._uow.post_repo.bulk_resume_by_distribution(
+        result = await self._uow.post_repo.bulk_resume_by_distribution(
             distribution_name=distribution_name,
         )
+        await self._invalidate_cache()
+        return result
 
     async def bulk_set_notify_distribution(
         self,
@@ -140,22 +156,27 @@ class PostService:
         distribution_name: str | None,
         value: bool,
     ) -> int:
-        return await self._uow.post_repo.bulk_set_notify_by_distribution(
+        result = await self._uow.post_repo.bulk_set_notify_by_distribution(
             distribution_name=distribution_name,
             value=value,
         )
+        await self._invalidate_cache()
+        return result
 
     async def delete_distribution(
         self,
         *,
         distribution_name: str | None,
     ) -> int:
-        return await self._uow.post_repo.delete_distribution(
+        result = await self._uow.post_repo.delete_distribution(
             distribution_name=distribution_name,
         )
+        await self._invalidate_cache()
+        return result
 
     async def pause(self, post_id: UUID) -> None:
         await self._uow.post_repo.pause(post_id)
+        await self._invalidate_cache()
 
     async def resolve_distribution_id_by_post(self, post_id: UUID) -> UUID | None:
         """Resolve distribution_id by post_id using distribution_name."""
@@ -168,6 +189,7 @@ class PostService:
 
     async def resume(self, post_id: UUID) -> None:
         await self._uow.post_repo.resume(post_id)
+        await self._invalidate_cache()
 
     async def count_distributions(self) -> int:
         return await self._uow.post_repo.count_distributions()
@@ -176,17 +198,31 @@ class PostService:
         return await self._uow.post_repo.list_distributions(limit=limit, offset=offset)
 
     async def get_distribution_summary(self, distribution_id: UUID) -> dict | None:
-        return await self._uow.post_repo.get_distribution_summary(distribution_id)
+        if self._cache is None:
+            return await self._uow.post_repo.get_distribution_summary(distribution_id)
+
+        field = str(distribution_id)
+        cached = await self._cache.get(SUMMARY_CACHE_BUCKET, field)
+        if cached is not None:
+            for key in ("created_at", "updated_at"):
+                if cached.get(key):
+                    cached[key] = datetime.fromisoformat(cached[key])
+            return cached
+
+        summary = await self._uow.post_repo.get_distribution_summary(distribution_id)
+        if summary is not None:
+            await self._cache.set(SUMMARY_CACHE_BUCKET, field, summary)
+        return summary
 
     async def list_distribution_posts(
         self,
         *,
         distribution_name: str | None,
     ):
-        posts = await self._uow.post_repo.list_distribution_posts(
+        rows = await self._uow.post_repo.list_distribution_posts(
             distribution_name=distribution_name,
         )
-        return [PostDTO.from_model(post) for post in posts]
+        return PostDTO.from_rows(rows)
 
     async def get_distribution_context(self, distribution_id: UUID) -> DistributionContextDTO | None:
         summary = await self.get_distribution_summary(distribution_id)
@@ -221,10 +257,12 @@ class PostService:
         summary = await self.get_distribution_summary(distribution_id)
         if summary is None:
             return 0
-        return await self._uow.post_repo.delete_distribution_groups(
+        deleted = await self._uow.post_repo.delete_distribution_groups(
             distribution_name=summary.get("distribution_name"),
             group_ids=group_ids,
         )
+        await self._invalidate_cache()
+        return deleted
 
     async def groups_distribution_usage(self, group_ids: list[UUID]) -> dict[UUID, UUID]:
         raw = await self._uow.post_repo.groups_distribution_usage(group_ids)
@@ -272,3 +310,8 @@ class PostService:
             )
             created += 1
         return created, skipped
+
+    async def _invalidate_cache(self) -> None:
+        # Сброс после коммита: до него параллельный читатель вернул бы в кэш старое значение
+        if self._cache is not None:
+            self._uow.after_commit(partial(self._cache.invalidate, SUMMARY_CACHE_BUCKET, LOADS_CACHE_BUCKET))
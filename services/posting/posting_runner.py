@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
 from infra.db.uow import get_uow
 
 from aiogram import Bot
@@ -21,7 +24,10 @@ from common.enums.telegram_error import (
     is_critical_error,
 )
 
-from infra.db.models import Bot as BotDB, Post, PostAttempt
+from common.dto import PostingJob
+from infra.db.models import Bot as BotDB, PostAttempt
+from infra import tracing
+from infra.metrics import POSTING_READY_QUEUE, POSTING_SCHEDULE_LAG, POSTS_FAILED, POSTS_SENT
 from sqlalchemy.exc import IntegrityError
 
 from .posting_service import PostingService
@@ -52,6 +58,10 @@ class PostingRunner:
         self.sleep_interval = SLEEP_INTERVAL_SECONDS
         self.running = True
         self.settings = get_settings()
+        self._batch_stale = False
+        # Текущая пачка: [] — пачки нет, None — идёт чтение и состав неизвестен
+        self._batch: Optional[list[PostingJob]] = []
+        self._bot_id: Optional[UUID] = None
 
     async def start(self, stop_event: asyncio.Event) -> None:
         while True:
@@ -68,6 +78,28 @@ class PostingRunner:
     async def stop(self) -> None:
         self.running = False
 
+    def interrupt_batch(self, message: Mapping[str, Any]) -> None:
+        """
+        Прервать текущую пачку, если событие (пауза, деактивация) касается её:
+        посты перечитаются в следующем цикле. message — payload уведомления
+        с bot_id, post_id или distribution_name.
+        """
+        if self._affects_batch(message):
+            self._batch_stale = True
+
+    def _affects_batch(self, message: Mapping[str, Any]) -> bool:
+        if "bot_id" in message:
+            return self._bot_id is None or message["bot_id"] == str(self._bot_id)
+        batch = self._batch
+        if batch is None:
+            # Пачка читается: снимок мог быть сделан до изменения
+            return True
+        if "post_id" in message:
+            return any(str(job.id) == message["post_id"] for job in batch)
+        if "distribution_name" in message:
+            return any(job.distribution_name == message["distribution_name"] for job in batch)
+        return bool(batch)
+
     async def close(self) -> None:
         """Закрывает ресурсы PostingRunner."""
         try:
@@ -77,7 +109,7 @@ class PostingRunner:
         except Exception as e:
             logger.error(f"Error closing posting runner bot session: {e}", exc_info=True)
 
-    def _is_post_ready(self, post: Post) -> bool:
+    def _is_post_ready(self, post: PostingJob) -> bool:
         """Проверяет, готов ли пост к отправке"""
         # Проверка статуса
         if post.status != PostStatus.ACTIVE.value:
@@ -95,6 +127,14 @@ class PostingRunner:
         
         return True
 
+    @staticmethod
+    def _observe_schedule_lag(post: PostingJob) -> None:
+        # Для первой отправки момента «должен был уйти» нет — её не учитываем
+        if post.last_attempt_at is None:
+            return
+        due_at = post.last_attempt_at + timedelta(seconds=post.pause_between_attempts_s)
+        POSTING_SCHEDULE_LAG.observe(max(0.0, (datetime.now(timezone.utc) - due_at).total_seconds()))
+
     def _is_network_or_server_error(self, exception: Exception) -> bool:
         """Проверяет, является ли ошибка сетевой или серверной (некритической)"""
         error_type = classify_telegram_error(exception)
@@ -104,42 +144,67 @@ class PostingRunner:
         }
 
     async def run_once(self) -> None:
-        try:
-            async with get_uow() as uow:
-                bot = await uow.bot_repo.get_by_token(self.tg_bot.token)
-                if bot is None:
-                    logger.error("Bot not found in DB for PostingRunner.")
-                    return
-                
-                post_service = PostService(uow=uow)
-                posts = await post_service.list_by_bot(bot_id=bot.id, limit=bot.settings.max_posts_per_bot)
-                
+        # Корневой спан цикла: чтение батча, отправки и запись попыток — его потомки
+        with tracing.span("posting.batch", **{"bot.token_id": self.tg_bot.id}) as batch_span:
+            try:
+                # Флаг сбрасываем до чтения: событие, пришедшее во время запроса,
+                # должно прервать пачку, снимок которой мог его не увидеть
+                self._batch_stale = False
+                self._batch = None
+                # Сессия нужна только на чтение: PostingJob не привязаны к ней,
+                # поэтому соединение возвращается в пул до начала отправки
+                async with get_uow(kind="posting") as uow:
+                    bot = await uow.bot_repo.get_by_token(self.tg_bot.token)
+                    if bot is None:
+                        logger.error("Bot not found in DB for PostingRunner.")
+                        return
+
+                    self._bot_id = bot.id
+                    post_service = PostService(uow=uow)
+                    jobs = await post_service.list_posting_jobs(bot.id, limit=bot.settings.max_posts_per_bot)
+
                 # Фильтруем готовые к отправке посты
-                ready_posts = [post for post in posts if self._is_post_ready(post)]
-                
+                ready_posts = [job for job in jobs if self._is_post_ready(job)]
+                self._batch = ready_posts
+                POSTING_READY_QUEUE.set(len(ready_posts))
+                if batch_span is not None:
+                    batch_span.set_attribute("posting.ready", len(ready_posts))
+
                 if not ready_posts:
                     return
-                
+
                 # Отправляем посты с лимитом из настроек
                 MAX_POSTS_PER_SECOND = self.settings.MAX_POSTS_PER_SECOND
                 DELAY_BETWEEN_POSTS = 1.0 / MAX_POSTS_PER_SECOND
-                
+
                 logger.info(f"Sending {len(ready_posts)} posts with rate limit {MAX_POSTS_PER_SECOND} posts/sec")
-                
+
                 # Отправляем посты последовательно с задержкой для соблюдения лимита
                 for i, post in enumerate(ready_posts):
+                    if self._batch_stale:
+                        logger.info("Control event received, dropping the rest of the batch")
+                        break
+
                     # Перед отправкой заново проверяем готовность (могла измениться)
                     if self._is_post_ready(post):
-                        await self._process_post(bot, post, post_service)
-                    
+                        self._observe_schedule_lag(post)
+                        with tracing.span(
+                            "posting.send",
+                            **{"post.id": post.id, "telegram.chat_id": post.target_chat_id},
+                        ):
+                            await self._process_post(bot, post)
+                    POSTING_READY_QUEUE.set(len(ready_posts) - i - 1)
+
                     # Задержка после всех постов кроме последнего
                     if i < len(ready_posts) - 1:
                         await sleep(DELAY_BETWEEN_POSTS)
-        except Exception as e:
-            logger.error(f"Error in PostingRunner.run_once: {type(e).__name__}: {e}", exc_info=True)
-            # Не пробрасываем исключение дальше, чтобы цикл продолжался
+            except Exception as e:
+                logger.error(f"Error in PostingRunner.run_once: {type(e).__name__}: {e}", exc_info=True)
+                # Не пробрасываем исключение дальше, чтобы цикл продолжался
+            finally:
+                self._batch = []
 
-    async def _process_post(self, bot: BotDB, post: Post, post_service: PostService) -> None:
+    async def _process_post(self, bot: BotDB, post: PostingJob) -> None:
         """Отправляет пост в Telegram (без проверок готовности)"""
         # Константы для повторных попыток
         MAX_IMMEDIATE_RETRIES = 3
@@ -147,17 +212,11 @@ class PostingRunner:
         
         try:
             # Удаляем предыдущую попытку, если требуется
-            if post.delete_last_attempt and post.post_attempts:
-                attempts_to_delete = [
-                    attempt
-                    for attempt in post.post_attempts
-                    if not attempt.deleted and attempt.chat_id and attempt.message_id
-                ]
-                if attempts_to_delete:
-                    last_post_attempt = max(attempts_to_delete, key=lambda attempt: attempt.created_at)
-                    result_deleted = await self.posting_service.delete_post_attempt(last_post_attempt)
-                    if result_deleted:
-                        last_post_attempt.deleted = True
+            if post.delete_last_attempt and post.last_sent_attempt_id is not None:
+                result_deleted = await self.posting_service.delete_last_sent(post)
+                if result_deleted:
+                    async with get_uow(kind="posting") as uow:
+                        await PostAttemptService(uow=uow).mark_deleted(post.last_sent_attempt_id)
 
             # Отправляем пост с повторными попытками для сетевых/серверных ошибок
             tg_msg = None
@@ -176,7 +235,8 @@ class PostingRunner:
                             # Еще есть попытки - логируем и повторяем
                             logger.warning(
                                 f"Network/server error sending post {post.id} (attempt {retry_attempt + 1}/{MAX_IMMEDIATE_RETRIES}): "
-                                f"{type(e).__name__}: {e}. Retrying in {RETRY_DELAY} seconds..."
+                                f"{type(e).__name__}: {e}. Retrying in {RETRY_DELAY} seconds...",
+                                extra={"chat_id": post.target_chat_id},
                             )
                             await sleep(RETRY_DELAY)
                             continue
@@ -184,8 +244,10 @@ class PostingRunner:
                             # Все попытки исчерпаны - пропускаем пост без записи ошибки
                             logger.warning(
                                 f"Skipping post {post.id} after {MAX_IMMEDIATE_RETRIES} retries due to network/server error: "
-                                f"{type(e).__name__}: {e}. Post will be retried in next cycle."
+                                f"{type(e).__name__}: {e}. Post will be retried in next cycle.",
+                                extra={"chat_id": post.target_chat_id},
                             )
+                            POSTS_FAILED.labels(error_type=classify_telegram_error(e).value).inc()
                             return  # Пропускаем пост, он останется активным для следующего цикла
                     else:
                         # Это не сетевая/серверная ошибка - пробрасываем дальше для обычной обработки
@@ -197,10 +259,13 @@ class PostingRunner:
                 if last_error:
                     raise last_error
                 raise ValueError(f"Failed to send post {post.id} for unknown reason")
+            POSTS_SENT.inc()
 
-            # Записываем успешную попытку в БД
+            # Записываем успешную попытку и счётчики поста в одной транзакции:
+            # INSERT попытки + атомарный UPDATE (count_attempts + 1, статус done по лимиту)
+            progress = None
             try:
-                async with get_uow() as uow:
+                async with get_uow(kind="posting") as uow:
                     post_attempt_service = PostAttemptService(uow=uow)
 
                     await post_attempt_service.add(PostAttempt(
@@ -212,6 +277,7 @@ class PostingRunner:
                         deleted=False,
                         success=True,
                     ))
+                    progress = await PostService(uow=uow).register_success(post.id)
             except IntegrityError as e:
                 # Если пост был удален между отправкой и записью попытки, логируем предупреждение
                 error_str = str(e).lower()
@@ -220,23 +286,18 @@ class PostingRunner:
                     return
                 # Если это другая IntegrityError, пробрасываем дальше
                 raise
-            
-            # Обновляем счетчики и статус через сервис (избегаем StaleDataError)
-            await post_service.increment_attempt_count(post.id)
-            await self.posting_service.pin_post(post, tg_msg)
-            
-            # Проверяем, нужно ли отметить пост как выполненный
-            # Используем текущие значения поста, т.к. мы только что увеличили count_attempts на 1
-            if post.target_attempts >= 0 and (post.count_attempts + 1) >= post.target_attempts:
-                await post_service.mark_done(post.id)
+
+            count_attempts = progress[0] if progress else post.count_attempts + 1
+            await self.posting_service.pin_post(post, tg_msg, count_attempts=count_attempts)
         except Exception as e:
             # Классифицируем ошибку
             error_type = classify_telegram_error(e)
             is_critical = is_critical_error(error_type)
+            POSTS_FAILED.labels(error_type=error_type.value).inc()
             
             # Записываем неудачную попытку и отмечаем пост как ошибочный
             try:
-                async with get_uow() as uow:
+                async with get_uow(kind="posting") as uow:
                     post_attempt_service = PostAttemptService(uow=uow)
                     post_service = PostService(uow=uow)
 
@@ -263,7 +324,10 @@ class PostingRunner:
             except Exception as inner:
                 logger.error(f"Failed to record error for post {post.id}: {inner}")
             
-            logger.error(f"Error processing post {post.id} for bot {bot.id}: {e}")
+            logger.error(
+                f"Error processing post {post.id} for bot {bot.id}: {e}",
+                extra={"chat_id": post.target_chat_id},
+            )
             
             # Обработка критических ошибок (удаление группы, нотификация)
             if is_critical and post.notify_on_failure:
@@ -275,7 +339,7 @@ class PostingRunner:
     async def _handle_critical_error(
         self,
         bot: BotDB,
-        post: Post,
+        post: PostingJob,
         error_type,
         error_message: str,
     ) -> None:
@@ -288,7 +352,7 @@ class PostingRunner:
             error_type: Тип ошибки Telegram
             error_message: Текст ошибки
         """
-        async with get_uow() as uow:
+        async with get_uow(kind="posting") as uow:
             # Получаем список админов (superuser)
             user_service = UserService(uow.user_repo)
             admins = await user_service.search(is_superuser=True, limit=100)
@@ -1,9 +1,10 @@
 from asyncio import sleep
+from typing import Optional
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from aiogram.types import Message
-from infra.db.models import Post, PostAttempt
+from common.dto import PostingJob
 from logging import getLogger
 
 logger = getLogger('PostingService')
@@ -100,7 +101,7 @@ class PostingService:
         
         return False
 
-    async def send_post(self, post: Post) -> Message:
+    async def send_post(self, post: PostingJob) -> Message:
         try:
             from_chat_id = post.source_channel_id
             if from_chat_id is None:
@@ -109,7 +110,7 @@ class PostingService:
             message_id = post.source_message_id
             to_chat_id = post.target_chat_id
 
-            logger.info(f"Sending post {post.id} from {from_chat_id} message {message_id} to chat {to_chat_id}")
+            logger.debug(f"Sending post {post.id} from {from_chat_id} message {message_id} to chat {to_chat_id}")
 
             msg = await self.bot.forward_message(
                 chat_id=to_chat_id,
@@ -118,22 +119,26 @@ class PostingService:
             )
             return msg
         except Exception as e:
-            logger.error(f"Failed to send post ({post.id}):\n{to_chat_id=}\n{from_chat_id=}\n{message_id}\nError: {type(e).__name__}: {e}")
+            logger.error(
+                f"Failed to send post ({post.id}):\n{to_chat_id=}\n{from_chat_id=}\n{message_id}\nError: {type(e).__name__}: {e}",
+                extra={"chat_id": post.target_chat_id},
+            )
             raise e
     
-    async def delete_post_attempt(self, post_attempt: PostAttempt) -> bool:
-        if post_attempt.message_id is None or post_attempt.chat_id is None:
-            logger.warning(f"Last attempt message_id or chat_id is None for attempt {post_attempt.message_id}. Skipping deletion.")
+    async def delete_last_sent(self, post: PostingJob) -> bool:
+        if post.last_sent_chat_id is None or post.last_sent_message_id is None:
             return False
-        
+
         return await self._delete_message_safe(
-            chat_id=post_attempt.chat_id,
-            message_id=post_attempt.message_id,
+            chat_id=post.last_sent_chat_id,
+            message_id=post.last_sent_message_id,
             operation_name="last attempt message"
         )
-        
-    async def pin_post(self, post: Post, tg_msg: Message) -> bool:
-        if not post.pin_after_post or (post.num_attempt_for_pin_post and post.count_attempts % post.num_attempt_for_pin_post != 0):
+
+    async def pin_post(self, post: PostingJob, tg_msg: Message, *, count_attempts: Optional[int] = None) -> bool:
+        if count_attempts is None:
+            count_attempts = post.count_attempts
+        if not post.pin_after_post or (post.num_attempt_for_pin_post and count_attempts % post.num_attempt_for_pin_post != 0):
             return False
         
         result = await self._pin_message_safe(
@@ -1,39 +1,70 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+from datetime import datetime
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
 from common.dto import SettingDTO
+from infra.cache import RedisCache
 from infra.db.models import Setting
 from infra.db.repo import SQLAlchemySettingsRepository
+from infra.db.uow import SQLAlchemyUnitOfWork
+
+SETTINGS_CACHE_BUCKET = "settings"
 
 
 class SettingsService:
-    def __init__(self, repo: SQLAlchemySettingsRepository) -> None:
+    def __init__(
+        self,
+        repo: SQLAlchemySettingsRepository,
+        cache: Optional[RedisCache] = None,
+        *,
+        uow: Optional[SQLAlchemyUnitOfWork] = None,
+    ) -> None:
         self._repo = repo
+        self._cache = cache
+        # Кэш сбрасывается после коммита uow, иначе параллельный читатель
+        # успевает положить в него старое значение
+        self._uow = uow
 
     async def get(self, setting_id: UUID) -> Optional[SettingDTO]:
         setting = await self._repo.get(setting_id)
         return SettingDTO.from_model(setting) if setting else None
 
     async def get_current(self) -> Optional[SettingDTO]:
+        if self._cache is not None:
+            cached = await self._cache.get(SETTINGS_CACHE_BUCKET, "current")
+            if cached is not None:
+                return _setting_from_cache(cached)
+
         setting = await self._repo.get_current()
-        return SettingDTO.from_model(setting) if setting else None
+        if setting is None:
+            return None
+        dto = SettingDTO.from_model(setting)
+        if self._cache is not None:
+            await self._cache.set(SETTINGS_CACHE_BUCKET, "current", asdict(dto))
+        return dto
 
     async def set_current(self, setting_id: UUID) -> SettingDTO:
         setting = await self._repo.set_current(setting_id)
+        await self._invalidate_cache()
         return SettingDTO.from_model(setting)
 
     async def add(self, setting: Setting) -> SettingDTO:
         await self._repo.add(setting)
+        await self._invalidate_cache()
         return SettingDTO.from_model(setting)
 
     async def update(self, setting: Setting) -> SettingDTO:
         await self._repo.update(setting)
+        await self._invalidate_cache()
         return SettingDTO.from_model(setting)
 
     async def delete(self, setting_id: UUID) -> None:
         await self._repo.delete(setting_id)
+        await self._invalidate_cache()
 
     async def count(self, *, name_like: Optional[str] = None) -> int:
         return await self._repo.count(name_like=name_like)
@@ -47,3 +78,19 @@ class SettingsService:
     ) -> list[SettingDTO]:
         settings = await self._repo.list(name_like=name_like, limit=limit, offset=offset)
         return [SettingDTO.from_model(setting) for setting in settings]
+
+    async def _invalidate_cache(self) -> None:
+        if self._cache is None:
+            return
+        invalidate = partial(self._cache.invalidate, SETTINGS_CACHE_BUCKET)
+        if self._uow is not None:
+            self._uow.after_commit(invalidate)
+        else:
+            await invalidate()
+
+
+def _setting_from_cache(data: dict) -> SettingDTO:
+    data["id"] = UUID(data["id"])
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return SettingDTO(**data)